@@ -0,0 +1,51 @@
+"""
+Compares per-request latency of a fresh `HttpClient` per call (the old behaviour of
+`StatsNhlApi`) against the pooled client that `StatsNhlApi` now keeps open.
+
+Run with `poetry run python benchmarks/bench_connection_pool.py`.
+"""
+
+import statistics
+import time
+
+from stub_server import StubServer
+
+from nhl_data import StatsNhlApi
+from nhl_data.api.http_client import HttpClient
+
+REQUESTS = 500
+
+
+def time_calls(func, n: int = REQUESTS) -> list[float]:
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p50 = statistics.median(timings) * 1000
+    p95 = timings[int(len(timings) * 0.95)] * 1000
+    print(f"{label:<24} p50={p50:7.3f}ms  p95={p95:7.3f}ms")
+
+
+def main() -> None:
+    with StubServer({"teams": []}) as server:
+        api_cls = type("LocalStatsNhlApi", (StatsNhlApi,), {})
+        api_cls.base_domain = server.base_domain
+
+        with api_cls() as api:
+
+            def new_client_per_call():
+                with HttpClient(api.base_url) as client:
+                    client.get("/teams").json()
+
+            report("new client per call", time_calls(new_client_per_call))
+            report("pooled client", time_calls(lambda: api.get("/teams")))
+
+
+if __name__ == "__main__":
+    main()
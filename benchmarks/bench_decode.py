@@ -0,0 +1,52 @@
+"""
+Compares the installed JSON backends on decoding a raw body and building the
+models from it, for the game, people and teams payloads.
+
+Run with `poetry run python benchmarks/bench_decode.py`.
+"""
+
+import json
+import timeit
+
+from fixtures import game_feed, people, teams
+
+from nhl_data.api.decoding import DECODERS
+from nhl_data.models import Game, Person, Team
+
+try:
+    from nhl_data.models.structs import decode_game
+except ImportError:
+    decode_game = None
+
+CASES = {
+    "game": (game_feed(), lambda data: Game.from_response(data)),
+    "people": (people(), lambda data: Person.from_response(data["people"][0])),
+    "teams": (teams(), lambda data: [Team.from_response(t) for t in data["teams"]]),
+}
+
+
+def main(repeat: int = 5, number: int = 20) -> None:
+    for case, (payload, build) in CASES.items():
+        body = json.dumps(payload).encode()
+        print(f"{case} ({len(body) / 1024:.0f} KiB)")
+        for name, decode in DECODERS.items():
+            decode_only = min(
+                timeit.repeat(lambda: decode(body), repeat=repeat, number=number)
+            )
+            with_models = min(
+                timeit.repeat(lambda: build(decode(body)), repeat=repeat, number=number)
+            )
+            print(
+                f"  {name:<8} decode={decode_only / number * 1000:7.3f}ms  "
+                f"decode+models={with_models / number * 1000:7.3f}ms"
+            )
+        if case == "game" and decode_game is not None:
+            typed = min(
+                timeit.repeat(lambda: decode_game(body), repeat=repeat, number=number)
+            )
+            label = "structs"
+            print(f"  {label:<24} decode+models={typed / number * 1000:7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares looking up plays through a SeasonIndex with scanning every play of
+every game.
+
+Run with `poetry run python benchmarks/bench_index.py`.
+"""
+
+import datetime
+import timeit
+
+from fixtures import game_feed
+
+from nhl_data.models import Game, SeasonIndex
+
+N_GAMES = 1312
+
+
+def scan(games: list[Game], person_id: int) -> list:
+    return [
+        play
+        for game in games
+        for play in game.all_plays
+        if play.event_type_id == "GOAL"
+        and any(p["player"]["id"] == person_id for p in play.players or ())
+    ]
+
+
+def main(repeat: int = 5, number: int = 20) -> None:
+    feed = Game.from_response(game_feed())
+    start = datetime.datetime(2022, 10, 7, tzinfo=datetime.timezone.utc)
+    games = [
+        Game(
+            pk=2022020001 + i,
+            date_time=(start + datetime.timedelta(hours=3 * i)).isoformat(),
+            away_team=feed.away_team,
+            home_team=feed.home_team,
+            all_plays=feed.all_plays,
+        )
+        for i in range(N_GAMES)
+    ]
+    build = min(timeit.repeat(lambda: SeasonIndex(games), repeat=3, number=1))
+    index = SeasonIndex(games)
+    march = datetime.date(2023, 3, 1), datetime.date(2023, 4, 1)
+    cases = {
+        "scan goals by player": lambda: scan(games, 8470000),
+        "index goals by player": lambda: index.plays(
+            person_id=8470000, event_type_id="GOAL"
+        ),
+        "index games in March": lambda: index.game_pks(
+            team_id=feed.home_team.id, start=march[0], end=march[1]
+        ),
+        "index period 3 penalties": lambda: index.plays(
+            event_type_id="PENALTY", period=3
+        ),
+    }
+    print(f"{'build index':<28} {build * 1000:8.3f}ms")
+    for label, func in cases.items():
+        best = min(timeit.repeat(func, repeat=repeat, number=number))
+        print(f"{label:<28} {best / number * 1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Reports the resident bytes per instance of the high-volume models, compared with
+equivalent dataclasses that keep a per-instance `__dict__`.
+
+Run with `poetry run python benchmarks/bench_memory.py`.
+"""
+
+import dataclasses
+import tracemalloc
+
+from fixtures import game_feed, schedule, teams
+
+from nhl_data.models.game import Play
+from nhl_data.models.schedule import ScheduleGame
+from nhl_data.models.stat import Stat
+from nhl_data.models.team import TeamRosterSpot
+
+
+def without_slots(cls: type) -> type:
+    """Builds a copy of a dataclass model which does not use `__slots__`."""
+    params = cls.__dataclass_params__
+    return dataclasses.make_dataclass(
+        f"{cls.__name__}WithDict",
+        [
+            (f.name, f.type, dataclasses.field(default=None))
+            for f in dataclasses.fields(cls)
+        ],
+        frozen=params.frozen,
+    )
+
+
+def bytes_per_instance(cls: type, rows: list[dict]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(**row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the instances is not part of the instance size
+    return (after - before - instances.__sizeof__()) / len(instances)
+
+
+def field_values(instances: list) -> list[dict]:
+    return [
+        {f.name: getattr(i, f.name) for f in dataclasses.fields(i)} for i in instances
+    ]
+
+
+def main() -> None:
+    plays = Play.from_response_list(
+        game_feed(n_plays=2000)["liveData"]["plays"]["allPlays"]
+    )
+    games = [
+        ScheduleGame.from_response(g) for d in schedule()["dates"] for g in d["games"]
+    ]
+    roster = [
+        TeamRosterSpot.from_response(r)
+        for t in teams()["teams"]
+        for r in t["roster"]["roster"]
+    ]
+    stats = [Stat(stat_type="yearByYear", splits=[]) for _ in range(2000)]
+    for cls, instances in [
+        (Play, plays),
+        (ScheduleGame, games),
+        (TeamRosterSpot, roster),
+        (Stat, stats),
+    ]:
+        rows = field_values(instances)
+        before = bytes_per_instance(without_slots(cls), rows)
+        after = bytes_per_instance(cls, rows)
+        print(f"{cls.__name__:<16} {before:7.0f} B -> {after:7.0f} B per instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures how long it takes to build models from decoded payloads.
+
+Every case is also timed against a baseline, which converts nested dictionaries
+with the original key conversion: one regular expression substitution per key,
+without the memo table, and without skipping dictionaries that were already
+converted.
+
+Run with `poetry run python benchmarks/bench_parse.py`.
+"""
+
+import re
+import timeit
+from unittest.mock import patch
+
+from fixtures import game_feed, people, schedule, teams
+
+from nhl_data.models import Game, LazyGame, Person, ScheduleDate, Team
+
+CASES = {
+    "Game.from_response": (lambda data: Game.from_response(data), game_feed()),
+    "LazyGame status only": (
+        lambda data: LazyGame.from_response(data).abstract_game_state,
+        game_feed(),
+    ),
+    "ScheduleDate.from_response": (
+        lambda data: [ScheduleDate.from_response(d) for d in data["dates"]],
+        schedule(),
+    ),
+    "Person.from_response": (
+        lambda data: Person.from_response(data["people"][0]),
+        people(),
+    ),
+    "Team.from_response": (
+        lambda data: [Team.from_response(t) for t in data["teams"]],
+        teams(),
+    ),
+}
+
+
+def baseline_convert_keys_to_snake_case(d: dict) -> dict:
+    new_data = {}
+    for k, v in d.items():
+        new_key = re.sub(r"(?<!^)(?=[A-Z])", "_", k).lower()
+        if isinstance(v, dict):
+            new_data[new_key] = baseline_convert_keys_to_snake_case(v)
+        else:
+            new_data[new_key] = v
+    return new_data
+
+
+def main(repeat: int = 5, number: int = 20) -> None:
+    for label, (func, data) in CASES.items():
+        best = min(timeit.repeat(lambda: func(data), repeat=repeat, number=number))
+        with patch(
+            "nhl_data.models.base.convert_keys_to_snake_case",
+            baseline_convert_keys_to_snake_case,
+        ):
+            baseline = min(
+                timeit.repeat(lambda: func(data), repeat=repeat, number=number)
+            )
+        print(
+            f"{label:<28} {best / number * 1000:8.3f}ms  "
+            f"baseline {baseline / number * 1000:8.3f}ms  "
+            f"({baseline / best:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Compares peak memory of iterating a large live feed's plays through
+`StatsNhlApi.game` (decode the whole body, then build the Game) against
+`StatsNhlApi.iter_plays` (decode and build one play at a time).
+
+Run with `poetry run python benchmarks/bench_streaming.py`.
+"""
+
+import time
+import tracemalloc
+
+from fixtures import game_feed
+from stub_server import StubServer
+
+from nhl_data import StatsNhlApi
+
+N_PLAYS = 5000
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    # measured separately, since tracing allocations slows the parsers down
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        f"{label:<12} plays={count}  peak={peak / 2**20:7.2f}MiB  "
+        f"time={elapsed * 1000:7.1f}ms"
+    )
+
+
+def main() -> None:
+    with StubServer(game_feed(n_plays=N_PLAYS)) as server:
+        api_cls = type("LocalStatsNhlApi", (StatsNhlApi,), {})
+        api_cls.base_domain = server.base_domain
+        with api_cls() as api:
+            measure("game()", lambda: sum(1 for _ in api.game(1).all_plays))
+            measure("iter_plays()", lambda: sum(1 for _ in api.iter_plays(1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Synthetic Stats NHL API payloads, shaped like the real responses, for benchmarks.
+"""
+
+import random
+
+EVENTS = [
+    ("FACEOFF", "Faceoff"),
+    ("SHOT", "Shot"),
+    ("MISSED_SHOT", "Missed Shot"),
+    ("BLOCKED_SHOT", "Blocked Shot"),
+    ("HIT", "Hit"),
+    ("GIVEAWAY", "Giveaway"),
+    ("TAKEAWAY", "Takeaway"),
+    ("GOAL", "Goal"),
+    ("PENALTY", "Penalty"),
+    ("STOP", "Stoppage"),
+]
+SHOT_TYPES = ["Wrist Shot", "Slap Shot", "Snap Shot", "Backhand", "Tip-In"]
+STRENGTHS = ["Even", "Power Play", "Short Handed"]
+
+
+def team(team_id: int) -> dict:
+    return {
+        "id": team_id,
+        "name": f"Team {team_id}",
+        "link": f"/api/v1/teams/{team_id}",
+        "triCode": f"T{team_id:02d}",
+    }
+
+
+def player(person_id: int) -> dict:
+    return {
+        "id": person_id,
+        "fullName": f"Player {person_id}",
+        "link": f"/api/v1/people/{person_id}",
+        "firstName": "Player",
+        "lastName": str(person_id),
+        "primaryNumber": str(person_id % 99),
+        "birthDate": "1995-01-01",
+        "currentAge": 28,
+        "birthCity": "City",
+        "birthCountry": "CAN",
+        "nationality": "CAN",
+        "height": "6' 1\"",
+        "weight": 200,
+        "active": True,
+        "rookie": False,
+        "shootsCatches": "L",
+        "rosterStatus": "Y",
+        "currentTeam": team(person_id % 2 + 1),
+        "primaryPosition": {
+            "code": "C",
+            "name": "Center",
+            "type": "Forward",
+            "abbreviation": "C",
+        },
+    }
+
+
+def play(index: int, rng: random.Random, home: dict, away: dict) -> dict:
+    event_type_id, event = rng.choice(EVENTS)
+    period = index // 110 + 1
+    seconds = (index % 110) * 10
+    data = {
+        "result": {
+            "event": event,
+            "eventCode": f"EDM{index}",
+            "eventTypeId": event_type_id,
+            "description": f"Player {index} {event}",
+        },
+        "about": {
+            "eventIdx": index,
+            "eventId": index + 1,
+            "period": period,
+            "periodType": "REGULAR",
+            "ordinalNum": f"{period}",
+            "periodTime": f"{seconds // 60:02d}:{seconds % 60:02d}",
+            "periodTimeRemaining": f"{19 - seconds // 60:02d}:{59 - seconds % 60:02d}",
+            "dateTime": "2023-01-01T00:00:00Z",
+            "goals": {"away": 1, "home": 2},
+        },
+        "coordinates": {"x": rng.uniform(-99, 99), "y": rng.uniform(-42, 42)},
+    }
+    if event_type_id not in ("STOP",):
+        data["players"] = [
+            {
+                "player": {
+                    "id": 8470000 + rng.randrange(40),
+                    "fullName": "Some Player",
+                    "link": "/api/v1/people/8470000",
+                },
+                "playerType": "Shooter",
+            },
+            {
+                "player": {
+                    "id": 8470000 + rng.randrange(40),
+                    "fullName": "Other Player",
+                    "link": "/api/v1/people/8470001",
+                },
+                "playerType": "Goalie",
+            },
+        ]
+        data["team"] = rng.choice([home, away])
+    if event_type_id in ("SHOT", "GOAL"):
+        data["result"]["secondaryType"] = rng.choice(SHOT_TYPES)
+    if event_type_id == "GOAL":
+        data["result"]["strength"] = {"code": "EVEN", "name": rng.choice(STRENGTHS)}
+        data["result"]["gameWinningGoal"] = False
+        data["result"]["emptyNet"] = False
+    if event_type_id == "PENALTY":
+        data["result"]["penaltySeverity"] = "Minor"
+        data["result"]["penaltyMinutes"] = 2
+    return data
+
+
+def boxscore_side(team_data: dict, first_player: int) -> dict:
+    players = {
+        f"ID{first_player + i}": {
+            "person": {"id": first_player + i, "fullName": f"Player {i}"},
+            "jerseyNumber": str(i),
+            "position": {"code": "C", "name": "Center"},
+            "stats": {
+                "skaterStats": {
+                    "timeOnIce": "15:00",
+                    "assists": 0,
+                    "goals": 0,
+                    "shots": 2,
+                    "hits": 1,
+                    "powerPlayGoals": 0,
+                    "faceOffWins": 3,
+                    "faceoffTaken": 7,
+                    "plusMinus": 0,
+                }
+            },
+        }
+        for i in range(20)
+    }
+    return {
+        "team": team_data,
+        "teamStats": {
+            "teamSkaterStats": {"goals": 2, "pim": 4, "shots": 30, "powerPlayGoals": 1}
+        },
+        "players": players,
+        "goalies": [first_player],
+        "skaters": list(range(first_player + 1, first_player + 20)),
+        "onIce": [],
+        "onIcePlus": [],
+        "scratches": [],
+        "penaltyBox": [],
+        "coaches": [{"person": {"fullName": "Coach"}, "position": {"code": "HC"}}],
+    }
+
+
+def game_feed(game_pk: int = 2022020001, n_plays: int = 350, seed: int = 0) -> dict:
+    """Builds a finished game's `/game/{id}/feed/live` payload."""
+    rng = random.Random(seed)
+    home, away = team(1), team(2)
+    plays = [play(i, rng, home, away) for i in range(n_plays)]
+    return {
+        "gamePk": game_pk,
+        "link": f"/api/v1/game/{game_pk}/feed/live",
+        "metaData": {"wait": 10, "timeStamp": "20230101_030000"},
+        "gameData": {
+            "game": {"pk": game_pk, "season": "20222023", "type": "R"},
+            "datetime": {
+                "dateTime": "2023-01-01T00:00:00Z",
+                "endDateTime": "2023-01-01T02:30:00Z",
+            },
+            "status": {
+                "abstractGameState": "Final",
+                "codedGameState": "7",
+                "detailedState": "Final",
+                "statusCode": "7",
+                "startTimeTBD": False,
+            },
+            "teams": {"away": away, "home": home},
+            "players": {f"ID{8470000 + i}": player(8470000 + i) for i in range(40)},
+            "venue": {"id": 5000, "name": "Arena", "link": "/api/v1/venues/5000"},
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": plays,
+                "scoringPlays": [i for i, p in enumerate(plays) if "strength" in p],
+                "penaltyPlays": [],
+                "playsByPeriod": [
+                    {"startIndex": 0, "plays": list(range(110)), "endIndex": 109}
+                ],
+                "currentPlay": plays[-1],
+            },
+            "linescore": {"currentPeriod": 3},
+            "boxscore": {
+                "teams": {
+                    "away": boxscore_side(away, 8470000),
+                    "home": boxscore_side(home, 8470020),
+                },
+                "officials": [],
+            },
+            "decisions": {"winner": {"id": 8470000}},
+        },
+    }
+
+
+def schedule(n_dates: int = 180, games_per_date: int = 8) -> dict:
+    """Builds a season's `/schedule` payload."""
+    dates = []
+    for d in range(n_dates):
+        games = [
+            {
+                "gamePk": 2022020000 + d * games_per_date + g,
+                "link": "/api/v1/game/2022020001/feed/live",
+                "gameType": "R",
+                "season": "20222023",
+                "gameDate": "2022-10-07T17:00:00Z",
+                "status": {
+                    "abstractGameState": "Final",
+                    "codedGameState": "7",
+                    "detailedState": "Final",
+                    "statusCode": "7",
+                },
+                "teams": {
+                    "away": {
+                        "leagueRecord": {"wins": 1, "losses": 0, "ot": 0},
+                        "score": 3,
+                        "team": team(g * 2 + 1),
+                    },
+                    "home": {
+                        "leagueRecord": {"wins": 0, "losses": 1, "ot": 0},
+                        "score": 1,
+                        "team": team(g * 2 + 2),
+                    },
+                },
+                "venue": {"id": 5000, "name": "Arena"},
+            }
+            for g in range(games_per_date)
+        ]
+        dates.append(
+            {
+                "date": f"2022-{10 + d // 30 % 3}-{d % 28 + 1:02d}",
+                "totalItems": games_per_date,
+                "totalEvents": 0,
+                "totalGames": games_per_date,
+                "totalMatches": 0,
+                "games": games,
+                "events": [],
+                "matches": [],
+            }
+        )
+    return {"totalGames": n_dates * games_per_date, "dates": dates}
+
+
+def people(person_id: int = 8470000) -> dict:
+    """Builds a `/people/{id}` payload with expanded stats."""
+    data = player(person_id)
+    data["stats"] = [
+        {
+            "type": {"displayName": stat_type},
+            "splits": [
+                {"season": "20222023", "stat": {"goals": 10, "assists": 20}}
+                for _ in range(20)
+            ],
+        }
+        for stat_type in ["yearByYear", "gameLog", "byMonth", "homeAndAway"]
+    ]
+    return {"people": [data]}
+
+
+def teams(n_teams: int = 32) -> dict:
+    """Builds a `/teams` payload."""
+    return {
+        "teams": [
+            {
+                **team(i),
+                "venue": {"name": "Arena"},
+                "abbreviation": f"T{i:02d}",
+                "teamName": f"Team {i}",
+                "locationName": "City",
+                "firstYearOfPlay": "1917",
+                "division": {"id": 1, "name": "Division"},
+                "conference": {"id": 1, "name": "Conference"},
+                "franchise": {"franchiseId": i, "teamName": f"Team {i}"},
+                "roster": {
+                    "roster": [
+                        {
+                            "person": {"id": 8470000 + p, "fullName": "Player"},
+                            "jerseyNumber": str(p),
+                            "position": {"code": "C", "name": "Center"},
+                        }
+                        for p in range(25)
+                    ]
+                },
+                "shortName": "Team",
+                "officialSiteUrl": "https://nhl.com",
+                "active": True,
+            }
+            for i in range(1, n_teams + 1)
+        ]
+    }
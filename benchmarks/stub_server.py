@@ -0,0 +1,52 @@
+"""
+Minimal local HTTP server used by the benchmarks in place of the Stats NHL API.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every GET request with the JSON payload stored on the server."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = self.server.payload
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    Runs a `ThreadingHTTPServer` on a random local port in a background thread.
+
+    Use as a context manager; `base_domain` can be swapped in for
+    `StatsNhlApi.base_domain`.
+    """
+
+    def __init__(self, payload: dict | list = None) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.payload = json.dumps(payload or {}).encode()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_domain(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
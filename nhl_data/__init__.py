@@ -1 +1 @@
-from nhl_data.api.stats import StatsNhlApi
+from nhl_data.api.stats import AsyncStatsNhlApi, StatsNhlApi
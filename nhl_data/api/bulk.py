@@ -0,0 +1,121 @@
+"""
+Helpers for running many API calls with bounded concurrency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """
+    The outcome of a single call made by a bulk fetch.
+
+    Exactly one of `value` and `error` is set, so one failing key never aborts
+    the rest of the batch.
+    """
+
+    key: Hashable
+    value: Any = None
+    error: Exception = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def map_concurrent(
+    func: Callable[[Hashable], Any], keys: Iterable[Hashable], max_workers: int
+) -> Iterator[FetchResult]:
+    """
+    Calls `func` for every key on a thread pool, yielding results as they complete.
+
+    At most `max_workers` calls are in flight at once, and `keys` is consumed
+    lazily, so memory stays bounded no matter how many keys are passed in.
+
+    :param func: the function to call for each key
+    :param keys: the keys to call `func` with
+    :param max_workers: the maximum number of calls running at the same time
+    :return: iterator of FetchResults, in completion order
+    """
+    keys = iter(keys)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: dict[Future, Hashable] = {}
+
+    def submit_next() -> None:
+        for key in keys:
+            pending[executor.submit(func, key)] = key
+            return
+
+    try:
+        for _ in range(max_workers):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                submit_next()
+                yield _to_result(key, future)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def amap_concurrent(
+    func: Callable[[Hashable], Awaitable[Any]],
+    keys: Iterable[Hashable],
+    max_concurrency: int,
+) -> AsyncIterator[FetchResult]:
+    """
+    Awaits `func` for every key, yielding results as they complete.
+
+    At most `max_concurrency` calls are in flight at once, and `keys` is consumed
+    lazily, so memory stays bounded no matter how many keys are passed in.
+
+    :param func: the coroutine function to await for each key
+    :param keys: the keys to call `func` with
+    :param max_concurrency: the maximum number of calls running at the same time
+    :return: async iterator of FetchResults, in completion order
+    """
+    keys = iter(keys)
+    pending: dict[asyncio.Task, Hashable] = {}
+
+    def submit_next() -> None:
+        for key in keys:
+            pending[asyncio.ensure_future(func(key))] = key
+            return
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = pending.pop(task)
+                submit_next()
+                yield _to_result(key, task)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _to_result(key: Hashable, future: Future | asyncio.Task) -> FetchResult:
+    error = future.exception()
+    if error is not None:
+        logger.warning("Fetching %s failed: %r", key, error)
+        return FetchResult(key, error=error)
+    return FetchResult(key, value=future.result())
@@ -0,0 +1,390 @@
+"""
+Response caching for the HTTP clients.
+
+A `ResponseCache` combines a storage backend with a `CachePolicy`, which decides
+per endpoint how long (if at all) a response may be served from the cache.
+A `ValidatorCache` instead revalidates every request with the server, but lets
+the server answer `304 Not Modified` when nothing has changed.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from http import HTTPMethod
+from pathlib import Path
+
+from httpx import Request, Response
+
+from nhl_data.api.decoding import response_json
+
+FOREVER = math.inf
+"""TTL for responses which never change once they have been published."""
+
+TtlFunction = Callable[[str, dict | list], float | None]
+
+_BODY_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+"""
+Headers describing the body as it was sent over the wire. The cache keeps the
+decoded body, so they no longer apply to it and are never stored or replayed.
+"""
+
+
+def _cacheable_headers(headers: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    return [(k, v) for k, v in headers if k.lower() not in _BODY_HEADERS]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The parts of a response needed to rebuild it when served from the cache."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    expires: float
+
+    def to_response(self, method: str, url: str) -> Response:
+        return Response(
+            self.status_code,
+            headers=_cacheable_headers(self.headers),
+            content=self.content,
+            request=Request(method, url),
+        )
+
+
+class CacheBackend(ABC):
+    """Base class for every storage backend of a ResponseCache."""
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:  # pragma: no cover
+        """
+        Looks up an entry, ignoring entries which have expired.
+
+        :param key: the cache key of the request
+        :return: the cached entry, or None if there is no fresh entry
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:  # pragma: no cover
+        """
+        Stores an entry, replacing any existing entry with the same key.
+
+        :param key: the cache key of the request
+        :param entry: the response to store
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:  # pragma: no cover
+        """Removes every entry from the backend."""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """In-memory backend which evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCache(CacheBackend):
+    """
+    On-disk backend storing every entry in a single SQLite database, so cached
+    responses survive between processes.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT, "
+                "content BLOB, expires REAL)"
+            )
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, expires FROM responses "
+                "WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content, expires = row
+        return CachedResponse(
+            status_code, [tuple(h) for h in json.loads(headers)], content, expires
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        # SQLite stores `inf` as a REAL, so FOREVER round trips unchanged
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.expires,
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """
+    Caching rule for every endpoint matching `pattern`.
+
+    `ttl` is either a number of seconds, or a function which receives the
+    endpoint and decoded JSON body and returns the number of seconds; this allows
+    rules that depend on the state of the payload. A TTL of None or 0 means the
+    response is not cached.
+    """
+
+    pattern: str
+    ttl: float | TtlFunction | None
+
+    def matches(self, endpoint: str) -> bool:
+        return re.fullmatch(self.pattern, endpoint) is not None
+
+    def ttl_for(self, endpoint: str, response: Response) -> float | None:
+        if callable(self.ttl):
+            return self.ttl(endpoint, response_json(response))
+        return self.ttl
+
+
+def _final_game_ttl(endpoint: str, body: dict) -> float | None:
+    status = body.get("gameData", dict()).get("status", dict())
+    return FOREVER if status.get("abstractGameState") == "Final" else None
+
+
+def _draft_ttl(endpoint: str, body: dict) -> float | None:
+    draft_year = int(endpoint.rsplit("/", 1)[-1])
+    return FOREVER if draft_year < datetime.date.today().year else 60 * 60
+
+
+DEFAULT_RULES = [
+    CacheRule(r"/(statTypes|standingsTypes|leagueLeaderTypes)", 24 * 60 * 60),
+    CacheRule(r"/seasons", 24 * 60 * 60),
+    CacheRule(r"/draft/\d{4}", _draft_ttl),
+    CacheRule(r"/game/\d+/feed/live", _final_game_ttl),
+]
+
+
+class CachePolicy:
+    """
+    Ordered collection of CacheRules. The first rule matching an endpoint decides
+    its TTL; endpoints that match no rule are never cached.
+    """
+
+    def __init__(self, rules: Iterable[CacheRule] = DEFAULT_RULES) -> None:
+        self.rules = list(rules)
+
+    def ttl_for(self, endpoint: str, response: Response) -> float | None:
+        """
+        :param endpoint: the endpoint the response was returned from
+        :param response: the response we may want to cache
+        :return: seconds the response may be cached for, None if it may not
+        """
+        for rule in self.rules:
+            if rule.matches(endpoint):
+                return rule.ttl_for(endpoint, response)
+        return None
+
+
+class ResponseCache:
+    """
+    Caches successful GET responses in front of `HttpClient.request`, keeping
+    count of cache hits and misses.
+    """
+
+    def __init__(
+        self, backend: CacheBackend = None, policy: CachePolicy = None
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCache()
+        self.policy = policy if policy is not None else CachePolicy()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str, url_parameters: dict = None) -> str:
+        params = sorted((url_parameters or dict()).items())
+        return f"{method} {url}?" + "&".join(f"{k}={v}" for k, v in params)
+
+    def get(
+        self, method: str, url: str, url_parameters: dict = None
+    ) -> Response | None:
+        """
+        Looks up a request in the cache.
+
+        :param method: the HTTP method of the request
+        :param url: the full url of the request
+        :param url_parameters: any additional parameters of the request
+        :return: the cached response, or None on a cache miss
+        """
+        if method != HTTPMethod.GET:
+            return None
+        entry = self.backend.get(self.key(method, url, url_parameters))
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry.to_response(method, url)
+
+    def set(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        url_parameters: dict | None,
+        response: Response,
+    ) -> None:
+        """
+        Stores a response, if the cache policy allows it to be cached.
+
+        :param method: the HTTP method of the request
+        :param url: the full url of the request
+        :param endpoint: the endpoint the response was returned from
+        :param url_parameters: any additional parameters of the request
+        :param response: the response to cache
+        """
+        if method != HTTPMethod.GET or response.status_code != 200:
+            return
+        ttl = self.policy.ttl_for(endpoint, response)
+        if not ttl:
+            return
+        entry = CachedResponse(
+            response.status_code,
+            _cacheable_headers(response.headers.multi_items()),
+            response.content,
+            time.time() + ttl,
+        )
+        self.backend.set(self.key(method, url, url_parameters), entry)
+
+    def stats(self) -> dict[str, int]:
+        """:return: the number of cache hits and misses so far"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+@dataclass(frozen=True)
+class _Validated:
+    etag: str | None
+    last_modified: str | None
+    response: Response
+
+
+class ValidatorCache:
+    """
+    Remembers the `ETag` / `Last-Modified` validators of the latest response for
+    each url, so polling requests can be sent conditionally. When the server
+    answers `304 Not Modified`, the previous response (and its already decoded
+    JSON body) is handed back instead.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.revalidated = 0
+        self._entries: OrderedDict[str, _Validated] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def headers(self, method: str, url: str, url_parameters: dict = None) -> dict:
+        """
+        :param method: the HTTP method of the request
+        :param url: the full url of the request
+        :param url_parameters: any additional parameters of the request
+        :return: the conditional headers to send with the request
+        """
+        if method != HTTPMethod.GET:
+            return dict()
+        with self._lock:
+            entry = self._entries.get(ResponseCache.key(method, url, url_parameters))
+        if entry is None:
+            return dict()
+        headers = dict()
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(
+        self, method: str, url: str, url_parameters: dict | None, response: Response
+    ) -> Response | None:
+        """
+        Replaces a `304 Not Modified` response with the response it validated, and
+        remembers the validators of any other successful response.
+
+        :param method: the HTTP method of the request
+        :param url: the full url of the request
+        :param url_parameters: any additional parameters of the request
+        :param response: the response returned by the server
+        :return: the response to hand back to the caller, or None for a `304`
+            whose validated response is no longer held (e.g. it was evicted
+            while the request was in flight), in which case the request has to
+            be sent again without conditional headers
+        """
+        if method != HTTPMethod.GET:
+            return response
+        key = ResponseCache.key(method, url, url_parameters)
+        with self._lock:
+            if response.status_code == 304:
+                if key not in self._entries:
+                    return None
+                self._entries.move_to_end(key)
+                self.revalidated += 1
+                return self._entries[key].response
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if response.status_code != 200 or (etag is None and last_modified is None):
+                return response
+            self._entries[key] = _Validated(etag, last_modified, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return response
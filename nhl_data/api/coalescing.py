@@ -0,0 +1,87 @@
+"""
+Request coalescing ("single-flight"): concurrent identical requests share a
+single upstream request instead of each sending their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls made from many threads.
+
+    The first caller for a key runs the call; every caller arriving with the same
+    key while it is in flight waits for it and receives the same result (or the
+    same error). Once the call has finished, the next caller runs it again.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: dict[str, Future] = dict()
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        """
+        :param key: identifies the call, e.g. the method, url and parameters
+        :param call: runs the call, unless an identical call is in flight
+        :return: the result of the call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            result = call()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls made from coroutines of a single event loop.
+    See `SingleFlight`.
+
+    The call runs in a task of its own, so cancelling one of the callers does
+    not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: dict[str, asyncio.Task] = dict()
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        :param key: identifies the call, e.g. the method, url and parameters
+        :param call: coroutine function running the call, unless an identical
+            call is in flight
+        :return: the result of the call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(call())
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
@@ -0,0 +1,78 @@
+"""
+Decoding of JSON response bodies.
+
+The JSON backend is pluggable: the fastest installed decoder out of `orjson` and
+`msgspec` is used automatically, falling back to the standard library's `json`
+module. `set_json_decoder` selects a backend by name or installs any callable
+which turns the raw body into Python objects.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from httpx import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+JsonDecoder = Callable[[bytes], Any]
+
+_JSON_EXTENSION = "nhl_data.json"
+
+DECODERS: dict[str, JsonDecoder] = dict()
+"""Every installed JSON backend by name, fastest first."""
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+if msgspec is not None:
+    DECODERS["msgspec"] = msgspec.json.Decoder().decode
+DECODERS["json"] = json.loads
+
+_decoder: JsonDecoder = next(iter(DECODERS.values()))
+
+
+def get_json_decoder() -> JsonDecoder:
+    """:return: the function currently used to decode response bodies"""
+    return _decoder
+
+
+def set_json_decoder(decoder: str | JsonDecoder) -> None:
+    """
+    Changes the JSON backend used for every response body.
+
+    :param decoder: the name of an installed backend (see `DECODERS`), or a
+        function which decodes the raw body
+    """
+    global _decoder
+    if isinstance(decoder, str):
+        if decoder not in DECODERS:
+            raise ValueError(
+                f"Unknown JSON decoder {decoder!r}, expected one of {list(DECODERS)}"
+            )
+        decoder = DECODERS[decoder]
+    _decoder = decoder
+
+
+def response_json(response: Response) -> dict | list:
+    """
+    Decodes the JSON body of a response.
+
+    The decoded body is memoized on the response, so a response which is handed
+    out more than once (e.g. replayed after a `304 Not Modified`) is only parsed
+    the first time. Callers must therefore treat the result as read-only.
+
+    :param response: the response we want to decode
+    :return: the decoded JSON body
+    """
+    if _JSON_EXTENSION not in response.extensions:
+        response.extensions[_JSON_EXTENSION] = _decoder(response.content)
+    return response.extensions[_JSON_EXTENSION]
@@ -1,26 +1,86 @@
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from http import HTTPMethod
 
-from httpx import AsyncClient, Client, Response
+from httpx import AsyncClient, Client, Limits, Response
+
+from nhl_data.api.cache import ResponseCache, ValidatorCache
+from nhl_data.api.coalescing import AsyncSingleFlight, SingleFlight
+from nhl_data.api.resilience import (
+    CircuitBreaker,
+    HedgePolicy,
+    RateLimiter,
+    RetryPolicy,
+    TimeoutPolicy,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 10
+DEFAULT_LIMITS = Limits(
+    max_connections=10, max_keepalive_connections=10, keepalive_expiry=30
+)
+
 
 class HttpClient:
     """
     HTTP Client for connecting to the NHL API.
+
+    The underlying `httpx.Client` keeps a pool of keep-alive connections, so a
+    single instance should be reused across requests wherever possible.
+
+    With `coalesce`, concurrent identical GET requests share a single upstream
+    request: every caller receives the same response object, and therefore the
+    same decoded body (see `response_json`).
     """
 
-    def __init__(self, base_url: str, raise_status_errors: bool = True) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        raise_status_errors: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache = None,
+        validators: ValidatorCache = None,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        timeouts: TimeoutPolicy = None,
+        hedging: HedgePolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        coalesce: bool = False,
+    ) -> None:
         self.base_url = base_url
         self.raise_status_errors = raise_status_errors
-        self.client = Client(base_url=self.base_url, timeout=10)
+        self.cache = cache
+        self.validators = validators
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.timeouts = timeouts
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self.in_flight = SingleFlight() if coalesce else None
+        self.client = Client(
+            base_url=self.base_url, timeout=timeout, limits=limits, http2=http2
+        )
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes every connection held in the connection pool, and the worker
+        threads of the hedging policy.
+        """
         self.client.close()
+        if self.hedging is not None:
+            self.hedging.close()
 
     def request(
         self, method: HTTPMethod, endpoint: str, url_parameters: dict = None
@@ -34,8 +94,153 @@ class HttpClient:
             defaults to None
         :return: the response object
         """
-        response = self.client.request(method, endpoint, params=url_parameters)
-        return self._handle_response(response)
+        if self.in_flight is not None and method == HTTPMethod.GET:
+            url = f"{self.base_url}{endpoint}"
+            return self.in_flight.do(
+                ResponseCache.key(method, url, url_parameters),
+                lambda: self._request(method, endpoint, url_parameters),
+            )
+        return self._request(method, endpoint, url_parameters)
+
+    def _request(
+        self, method: HTTPMethod, endpoint: str, url_parameters: dict
+    ) -> Response:
+        url = f"{self.base_url}{endpoint}"
+        if self.cache is not None:
+            cached = self.cache.get(method, url, url_parameters)
+            if cached is not None:
+                return cached
+        headers = None
+        if self.validators is not None:
+            headers = self.validators.headers(method, url, url_parameters)
+        response = self._send(method, endpoint, url_parameters, headers)
+        if self.validators is not None:
+            resolved = self.validators.resolve(method, url, url_parameters, response)
+            if resolved is None:
+                # the validated response was evicted, so ask for the full body
+                response = self._send(method, endpoint, url_parameters, None)
+                resolved = self.validators.resolve(
+                    method, url, url_parameters, response
+                )
+            response = response if resolved is None else resolved
+        response = self._handle_response(response)
+        if self.cache is not None:
+            self.cache.set(method, url, endpoint, url_parameters, response)
+        return response
+
+    @contextmanager
+    def stream(
+        self, method: HTTPMethod, endpoint: str, url_parameters: dict = None
+    ) -> Iterator[Response]:
+        """
+        Performs a HTTP Request whose body is read incrementally, e.g. through
+        `response.iter_bytes()`, instead of being loaded into memory at once.
+
+        The request goes through the same rate limiter, retry policy, endpoint
+        timeouts and circuit breaker as `request`. Retries only happen before the
+        body is read, i.e. on connection errors and retryable status codes.
+        Streamed requests are never hedged or coalesced.
+
+        A fresh entry in the response cache is served as is, but streamed
+        responses are never added to the cache or revalidated.
+
+        :param method: the specific request type we want to send
+        :param endpoint: endpoint we want to send the request to
+        :param url_parameters: any additional parameters to add for the request,
+            defaults to None
+        :return: context manager yielding the response object with an unread body
+        """
+        if self.cache is not None:
+            url = f"{self.base_url}{endpoint}"
+            cached = self.cache.get(method, url, url_parameters)
+            if cached is not None:
+                yield cached
+                return
+        response = self._send(method, endpoint, url_parameters, None, stream=True)
+        try:
+            yield self._handle_response(response)
+        finally:
+            response.close()
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url_parameters: dict,
+        headers: dict,
+        stream: bool = False,
+    ) -> Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self._attempt(
+                    method, endpoint, url_parameters, headers, stream
+                )
+            except Exception as error:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, error=error
+                ):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning("%s %s failed (%r), retrying", method, endpoint, error)
+            else:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, response=response
+                ):
+                    return response
+                delay = self.retry.delay(attempt, response)
+                logger.warning(
+                    "%s %s returned %s, retrying",
+                    method,
+                    endpoint,
+                    response.status_code,
+                )
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt(
+        self,
+        method: str,
+        endpoint: str,
+        url_parameters: dict,
+        headers: dict,
+        stream: bool = False,
+    ) -> Response:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        kwargs = {"params": url_parameters, "headers": headers}
+        if self.timeouts is not None:
+            timeout = self.timeouts.timeout_for(endpoint)
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+
+        def call() -> Response:
+            if stream:
+                request = self.client.build_request(method, endpoint, **kwargs)
+                return self.client.send(request, stream=True)
+            return self.client.request(method, endpoint, **kwargs)
+
+        def duplicate() -> Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            return call()
+
+        hedged = not stream and self.hedging is not None
+        try:
+            if hedged and method in self.hedging.methods:
+                response = self.hedging.run(call, duplicate)
+            else:
+                response = call()
+        except Exception as error:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(error=error)
+            raise
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(response=response)
+        return response
 
     def _handle_response(self, response: Response) -> dict | list:
         if self.raise_status_errors:
@@ -63,17 +268,52 @@ class HttpClient:
 class HttpClientAsync:
     """
     Asynchronous HTTP Client for connecting to the NHL API.
+
+    The optional `concurrency` semaphore bounds the number of requests sent at
+    once. It is only held while a request is actually sent, so cache hits and
+    coalesced requests never wait for a free slot.
     """
 
-    def __init__(self, base_url: str, raise_status_errors: bool = True) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        raise_status_errors: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache = None,
+        validators: ValidatorCache = None,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        timeouts: TimeoutPolicy = None,
+        hedging: HedgePolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        coalesce: bool = False,
+        concurrency: asyncio.Semaphore = None,
+    ) -> None:
         self.base_url = base_url
         self.raise_status_errors = raise_status_errors
-        self.client = AsyncClient(base_url=self.base_url, timeout=10)
+        self.cache = cache
+        self.validators = validators
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.timeouts = timeouts
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self.in_flight = AsyncSingleFlight() if coalesce else None
+        self.concurrency = concurrency
+        self.client = AsyncClient(
+            base_url=self.base_url, timeout=timeout, limits=limits, http2=http2
+        )
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes every connection held in the connection pool."""
         await self.client.aclose()
 
     async def request(
@@ -88,8 +328,152 @@ class HttpClientAsync:
             defaults to None
         :return: the response object
         """
-        response = await self.client.request(method, endpoint, params=url_parameters)
-        return await self._handle_response(response)
+        if self.in_flight is not None and method == HTTPMethod.GET:
+            url = f"{self.base_url}{endpoint}"
+            return await self.in_flight.do(
+                ResponseCache.key(method, url, url_parameters),
+                lambda: self._request(method, endpoint, url_parameters),
+            )
+        return await self._request(method, endpoint, url_parameters)
+
+    async def _request(
+        self, method: HTTPMethod, endpoint: str, url_parameters: dict
+    ) -> Response:
+        url = f"{self.base_url}{endpoint}"
+        if self.cache is not None:
+            cached = self.cache.get(method, url, url_parameters)
+            if cached is not None:
+                return cached
+        headers = None
+        if self.validators is not None:
+            headers = self.validators.headers(method, url, url_parameters)
+        async with self.concurrency or nullcontext():
+            response = await self._send(method, endpoint, url_parameters, headers)
+            if self.validators is not None:
+                resolved = self.validators.resolve(
+                    method, url, url_parameters, response
+                )
+                if resolved is None:
+                    # the validated response was evicted, so ask for the full body
+                    response = await self._send(method, endpoint, url_parameters, None)
+                    resolved = self.validators.resolve(
+                        method, url, url_parameters, response
+                    )
+                response = response if resolved is None else resolved
+        response = await self._handle_response(response)
+        if self.cache is not None:
+            self.cache.set(method, url, endpoint, url_parameters, response)
+        return response
+
+    @asynccontextmanager
+    async def stream(
+        self, method: HTTPMethod, endpoint: str, url_parameters: dict = None
+    ) -> AsyncIterator[Response]:
+        """
+        Performs a HTTP Request whose body is read incrementally. See
+        `HttpClient.stream`.
+
+        :param method: the specific request type we want to send
+        :param endpoint: endpoint we want to send the request to
+        :param url_parameters: any additional parameters to add for the request,
+            defaults to None
+        :return: async context manager yielding the response object with an unread
+            body
+        """
+        if self.cache is not None:
+            url = f"{self.base_url}{endpoint}"
+            cached = self.cache.get(method, url, url_parameters)
+            if cached is not None:
+                yield cached
+                return
+        async with self.concurrency or nullcontext():
+            response = await self._send(
+                method, endpoint, url_parameters, None, stream=True
+            )
+            try:
+                yield await self._handle_response(response)
+            finally:
+                await response.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url_parameters: dict,
+        headers: dict,
+        stream: bool = False,
+    ) -> Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            try:
+                response = await self._attempt(
+                    method, endpoint, url_parameters, headers, stream
+                )
+            except Exception as error:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, error=error
+                ):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning("%s %s failed (%r), retrying", method, endpoint, error)
+            else:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, response=response
+                ):
+                    return response
+                delay = self.retry.delay(attempt, response)
+                logger.warning(
+                    "%s %s returned %s, retrying",
+                    method,
+                    endpoint,
+                    response.status_code,
+                )
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt(
+        self,
+        method: str,
+        endpoint: str,
+        url_parameters: dict,
+        headers: dict,
+        stream: bool = False,
+    ) -> Response:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        kwargs = {"params": url_parameters, "headers": headers}
+        if self.timeouts is not None:
+            timeout = self.timeouts.timeout_for(endpoint)
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+
+        async def call() -> Response:
+            if stream:
+                request = self.client.build_request(method, endpoint, **kwargs)
+                return await self.client.send(request, stream=True)
+            return await self.client.request(method, endpoint, **kwargs)
+
+        async def duplicate() -> Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            return await call()
+
+        hedged = not stream and self.hedging is not None
+        try:
+            if hedged and method in self.hedging.methods:
+                response = await self.hedging.arun(call, duplicate)
+            else:
+                response = await call()
+        except Exception as error:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(error=error)
+            raise
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(response=response)
+        return response
 
     async def _handle_response(self, response: Response) -> dict | list:
         if self.raise_status_errors:
@@ -0,0 +1,225 @@
+"""
+Incremental tracking of live games through the live feed `diffPatch` endpoint.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import time
+from collections.abc import Iterator
+
+from nhl_data.api.stats import StatsNhlApi
+from nhl_data.models.game import Game, Play
+
+logger = logging.getLogger(__name__)
+
+_ALL_PLAYS_PATH = ("liveData", "plays", "allPlays")
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if not pointer:
+        return []
+    return [
+        part.replace("~1", "/").replace("~0", "~") for part in pointer.split("/")[1:]
+    ]
+
+
+def _resolve_parent(document: dict | list, parts: list[str]) -> dict | list:
+    for part in parts[:-1]:
+        document = document[int(part)] if isinstance(document, list) else document[part]
+    return document
+
+
+def _event_id(play_data: dict) -> int | None:
+    return (play_data.get("about") or dict()).get("eventId")
+
+
+def apply_json_patch(document: dict, operations: list[dict]) -> None:
+    """
+    Applies JSON Patch (RFC 6902) operations to a document in place. Only the
+    `add`, `replace` and `remove` operations are used by the NHL API.
+
+    :param document: the decoded JSON document we want to patch
+    :param operations: the patch operations, in order
+    """
+    for operation in operations:
+        op = operation["op"]
+        parts = _parse_pointer(operation["path"])
+        if not parts and op in ("add", "replace"):
+            # the whole document is replaced
+            document.clear()
+            document.update(operation["value"])
+            continue
+        parent = _resolve_parent(document, parts)
+        key = parts[-1]
+        if isinstance(parent, list):
+            if op == "add":
+                index = len(parent) if key == "-" else int(key)
+                parent.insert(index, operation["value"])
+            elif op == "replace":
+                parent[int(key)] = operation["value"]
+            elif op == "remove":
+                del parent[int(key)]
+            else:
+                raise ValueError(f"Unsupported patch operation: {op}")
+        elif op in ("add", "replace"):
+            parent[key] = operation["value"]
+        elif op == "remove":
+            del parent[key]
+        else:
+            raise ValueError(f"Unsupported patch operation: {op}")
+
+
+class LiveGameTracker:
+    """
+    Follows a single game, keeping its live feed in memory and only downloading
+    what has changed since the previous poll.
+
+    The first poll downloads the complete live feed; every following poll asks
+    the `diffPatch` endpoint for the changes since the feed's last timestamp and
+    applies them to the cached feed. Only plays that were added (or corrected)
+    are parsed, so the cost of a poll scales with the number of new events
+    rather than with the length of the game.
+    """
+
+    def __init__(self, api: StatsNhlApi, game_id: int) -> None:
+        self.api = api
+        self.game_id = game_id
+        self.feed: dict = None
+        self.plays: list[Play] = []
+        self._event_ids: list[int | None] = []
+        self._game: Game = None
+
+    @property
+    def timecode(self) -> str | None:
+        """The timestamp of the cached live feed, e.g. `20231010_231530`."""
+        if self.feed is None:
+            return None
+        return self.feed.get("metaData", dict()).get("timeStamp")
+
+    @property
+    def game(self) -> Game | None:
+        """The Game model for the cached live feed, rebuilt only after a change."""
+        if self._game is None and self.feed is not None:
+            self._game = self._build_game()
+        return self._game
+
+    @property
+    def is_final(self) -> bool:
+        """Whether the game is over, False until the first poll."""
+        if self.feed is None:
+            return False
+        status = self.feed.get("gameData", dict()).get("status", dict())
+        return status.get("abstractGameState") == "Final"
+
+    def poll(self) -> list[Play]:
+        """
+        Brings the cached game up to date.
+
+        :return: the plays which were added since the previous poll; every play
+            of the game on the first poll
+        """
+        if self.feed is None:
+            return self._reset(self.api.get(f"/game/{self.game_id}/feed/live"))
+        patches = self.api.get(
+            f"/game/{self.game_id}/feed/live/diffPatch",
+            url_parameters={"startTimecode": self.timecode},
+        )
+        if isinstance(patches, dict):
+            # The API sends the complete feed when the timecode is too old
+            return self._reset(patches)
+        if not patches:
+            return []
+        return self._apply(patches)
+
+    def follow(self, interval: float = 10) -> Iterator[Play]:
+        """
+        Polls the game every `interval` seconds until it is final, yielding every
+        play as it happens.
+
+        :param interval: seconds to wait between polls, defaults to 10
+        :return: iterator of plays in the order they were added
+        """
+        while True:
+            yield from self.poll()
+            if self.is_final:
+                return
+            time.sleep(interval)
+
+    def _reset(self, feed: dict) -> list[Play]:
+        # Patches are applied in place, so never mutate a (possibly memoized) body
+        self.feed = copy.deepcopy(feed)
+        self._reset_plays(self._all_plays_data())
+        self._game = None
+        return list(self.plays)
+
+    def _apply(self, patches: list[dict]) -> list[Play]:
+        known = len(self.plays)
+        changed = set()
+        resync = False
+        for patch in patches:
+            operations = patch.get("diff", [])
+            apply_json_patch(self.feed, operations)
+            for operation in operations:
+                parts = tuple(_parse_pointer(operation["path"]))
+                if len(parts) <= 3:
+                    # allPlays itself, or a document holding it, was replaced
+                    resync = resync or parts == _ALL_PLAYS_PATH[: len(parts)]
+                    continue
+                if parts[:3] != _ALL_PLAYS_PATH:
+                    continue
+                if parts[3] == "-":
+                    continue
+                elif len(parts) > 4 or operation["op"] == "replace":
+                    changed.add(int(parts[3]))
+                elif operation["op"] == "remove" or int(parts[3]) < known:
+                    # plays were removed or inserted, so indices have shifted
+                    resync = True
+        all_plays_data = self._all_plays_data()
+        self._game = None
+        if resync:
+            logger.debug("Re-parsing all plays of game %s", self.game_id)
+            previous_ids = set(self._event_ids) - {None}
+            self._reset_plays(all_plays_data)
+            # indices have shifted, so new plays are told apart by their event id
+            return [
+                play
+                for index, (play, event_id) in enumerate(
+                    zip(self.plays, self._event_ids)
+                )
+                if (
+                    index >= known if event_id is None else event_id not in previous_ids
+                )
+            ]
+        for index in changed:
+            if index < known:
+                self.plays[index] = Play.from_response(all_plays_data[index])
+                self._event_ids[index] = _event_id(all_plays_data[index])
+        added = all_plays_data[known:]
+        self.plays.extend(Play.from_response(d) for d in added)
+        self._event_ids.extend(_event_id(d) for d in added)
+        return self.plays[known:]
+
+    def _reset_plays(self, all_plays_data: list[dict]) -> None:
+        self.plays = [Play.from_response(d) for d in all_plays_data]
+        self._event_ids = [_event_id(d) for d in all_plays_data]
+
+    def _all_plays_data(self) -> list[dict]:
+        plays = self.feed.get("liveData", dict()).get("plays", dict())
+        return plays.get("allPlays", [])
+
+    def _build_game(self) -> Game:
+        live_data = self.feed.get("liveData", dict())
+        plays = live_data.get("plays", dict())
+        feed = {
+            **self.feed,
+            "liveData": {
+                **live_data,
+                "plays": {k: v for k, v in plays.items() if k != "allPlays"},
+            },
+        }
+        game = Game.from_response(feed)
+        if "allPlays" in plays:
+            game.all_plays = list(self.plays)
+        return game
@@ -0,0 +1,173 @@
+"""
+Registry of the metadata endpoints (leader types, stat types, standings types
+and seasons), which change at most a few times a year.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+METADATA_ENDPOINTS = ("/leagueLeaderTypes", "/statTypes", "/standingsTypes", "/seasons")
+"""The endpoints served from the registry by the API wrappers."""
+
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+class MetadataEntry(NamedTuple):
+    body: Any
+    fetched_at: float
+
+
+class MetadataRegistry:
+    """
+    Keeps the decoded bodies of the metadata endpoints, so they are requested
+    once instead of on every call that needs them.
+
+    An entry older than `max_age` seconds is still served as is, while a single
+    refresh is started in the background (on a daemon thread, or as a task of
+    the running event loop); the entry is only replaced once the refresh
+    succeeded. Only an endpoint which has never been loaded is waited on.
+
+    A registry may be shared by any number of wrappers, and with `snapshot` it
+    is persisted as JSON, so a new process starts warm. The bodies are shared
+    by every caller and must be treated as read-only.
+    """
+
+    def __init__(
+        self, max_age: float = DEFAULT_MAX_AGE, snapshot: str | Path = None
+    ) -> None:
+        self.max_age = max_age
+        self.snapshot = Path(snapshot) if snapshot is not None else None
+        self._entries: dict[str, MetadataEntry] = dict()
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+        if self.snapshot is not None and self.snapshot.exists():
+            self.load(self.snapshot)
+
+    def get(self, endpoint: str) -> Any:
+        """
+        :param endpoint: the metadata endpoint, e.g. `/statTypes`
+        :return: the stored body, or None if the endpoint was never loaded
+        """
+        entry = self._entries.get(endpoint)
+        return entry.body if entry is not None else None
+
+    def set(self, endpoint: str, body: Any, fetched_at: float = None) -> None:
+        """
+        Stores the body of an endpoint, persisting the snapshot if there is one.
+
+        :param endpoint: the metadata endpoint, e.g. `/statTypes`
+        :param body: the decoded body of the endpoint
+        :param fetched_at: when the body was fetched, defaults to now
+        """
+        entry = MetadataEntry(body, fetched_at or time.time())
+        with self._lock:
+            self._entries[endpoint] = entry
+        if self.snapshot is not None:
+            self.save(self.snapshot)
+
+    def is_stale(self, endpoint: str) -> bool:
+        entry = self._entries.get(endpoint)
+        return entry is None or time.time() - entry.fetched_at > self.max_age
+
+    def fetch(self, endpoint: str, load: Callable[[], Any]) -> Any:
+        """
+        :param endpoint: the metadata endpoint, e.g. `/statTypes`
+        :param load: requests the endpoint and returns its decoded body
+        :return: the body of the endpoint
+        """
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            body = load()
+            self.set(endpoint, body)
+            return body
+        if self.is_stale(endpoint) and self._begin_refresh(endpoint):
+            threading.Thread(
+                target=self._refresh, args=(endpoint, load), daemon=True
+            ).start()
+        return entry.body
+
+    async def afetch(self, endpoint: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asynchronous version of `fetch`.
+
+        :param endpoint: the metadata endpoint, e.g. `/statTypes`
+        :param load: coroutine function requesting the endpoint and returning its
+            decoded body
+        :return: the body of the endpoint
+        """
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            body = await load()
+            self.set(endpoint, body)
+            return body
+        if self.is_stale(endpoint) and self._begin_refresh(endpoint):
+            task = asyncio.ensure_future(self._arefresh(endpoint, load))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return entry.body
+
+    def load(self, path: str | Path) -> None:
+        """:param path: JSON snapshot written by `save`"""
+        with open(path) as file:
+            snapshot = json.load(file)
+        with self._lock:
+            for endpoint, entry in snapshot.items():
+                self._entries[endpoint] = MetadataEntry(
+                    entry["body"], entry["fetched_at"]
+                )
+
+    def save(self, path: str | Path) -> None:
+        """
+        Writes every entry to a JSON snapshot, replacing the file atomically.
+
+        :param path: where the snapshot is written
+        """
+        with self._lock:
+            snapshot = {
+                endpoint: {"body": entry.body, "fetched_at": entry.fetched_at}
+                for endpoint, entry in self._entries.items()
+            }
+        path = Path(path)
+        temporary = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        with open(temporary, "w") as file:
+            json.dump(snapshot, file)
+        os.replace(temporary, path)
+
+    def _begin_refresh(self, endpoint: str) -> bool:
+        with self._lock:
+            if endpoint in self._refreshing:
+                return False
+            self._refreshing.add(endpoint)
+            return True
+
+    def _refresh(self, endpoint: str, load: Callable[[], Any]) -> None:
+        try:
+            self.set(endpoint, load())
+        except Exception as error:
+            logger.warning("Refreshing %s failed: %r", endpoint, error)
+        finally:
+            with self._lock:
+                self._refreshing.discard(endpoint)
+
+    async def _arefresh(
+        self, endpoint: str, load: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            self.set(endpoint, await load())
+        except Exception as error:
+            logger.warning("Refreshing %s failed: %r", endpoint, error)
+        finally:
+            with self._lock:
+                self._refreshing.discard(endpoint)
@@ -0,0 +1,368 @@
+"""
+Resilience policies for the HTTP clients: retries with exponential backoff, a
+token bucket rate limiter, per-endpoint timeouts, hedged requests and a circuit
+breaker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from http import HTTPMethod
+
+from httpx import Response, TransportError
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""Status codes which usually signal a transient failure."""
+
+
+def _retry_after(response: Response) -> float | None:
+    """Parses the `Retry-After` header, given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again, and how long to wait first.
+
+    Requests are retried when the server answers with one of `statuses`, or when
+    the connection fails (connect / read timeouts, refused connections, ...).
+    The wait grows exponentially with every attempt, `backoff * 2 ** attempt`,
+    capped at `max_backoff`; with `jitter`, a random wait between zero and that
+    value is used instead, so that many clients do not retry in lockstep. A
+    `Retry-After` header sent by the server takes precedence.
+    """
+
+    max_retries: int = 3
+    statuses: frozenset[int] = RETRY_STATUSES
+    retry_connection_errors: bool = True
+    respect_retry_after: bool = True
+    backoff: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    methods: frozenset[str] = field(default=frozenset({HTTPMethod.GET}))
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Response = None,
+        error: Exception = None,
+    ) -> bool:
+        """
+        :param method: the HTTP method of the request
+        :param attempt: how many times the request has been retried already
+        :param response: the response of the failed attempt, if there was one
+        :param error: the error raised by the failed attempt, if there was one
+        :return: True if the request should be sent again
+        """
+        if attempt >= self.max_retries or method not in self.methods:
+            return False
+        if error is not None:
+            return self.retry_connection_errors and isinstance(error, TransportError)
+        return response is not None and response.status_code in self.statuses
+
+    def delay(self, attempt: int, response: Response = None) -> float:
+        """
+        :param attempt: how many times the request has been retried already
+        :param response: the response of the failed attempt, if there was one
+        :return: seconds to wait before sending the request again
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        delay = min(self.backoff * 2**attempt, self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` requests per second on average, with bursts of
+    up to `burst` requests.
+
+    A single instance may be shared by any number of threads, coroutines and
+    clients: every caller reserves its token under a short lock and then sleeps
+    (or awaits) outside of it until the token is due, so callers are served in
+    the order they arrived and the lock is never held while waiting.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Waits, without blocking the event loop, until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass(frozen=True)
+class TimeoutRule:
+    """Timeout, in seconds, for every endpoint matching `pattern`."""
+
+    pattern: str
+    timeout: float
+
+    def matches(self, endpoint: str) -> bool:
+        return re.fullmatch(self.pattern, endpoint) is not None
+
+
+class TimeoutPolicy:
+    """
+    Ordered collection of TimeoutRules. The first rule matching an endpoint
+    decides its timeout; endpoints that match no rule use `default`.
+    """
+
+    def __init__(self, rules: Iterable[TimeoutRule] = (), default: float = None):
+        self.rules = list(rules)
+        self.default = default
+
+    def timeout_for(self, endpoint: str) -> float | None:
+        """
+        :param endpoint: the endpoint the request is sent to
+        :return: seconds to wait on the request, None to use the client's timeout
+        """
+        for rule in self.rules:
+            if rule.matches(endpoint):
+                return rule.timeout
+        return self.default
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate of a slow request and returns whichever response arrives
+    first, trading a little extra load for a much shorter tail latency.
+
+    The duplicate is sent once the request has been in flight for longer than
+    the `quantile` (e.g. p95) of the latencies observed so far; until
+    `min_samples` latencies have been observed, `initial_delay` is used instead.
+    Only successful responses are observed, so fast error responses do not
+    drag the delay down.
+
+    `run` needs a thread pool of its own, which `close` releases (it is created
+    again if the policy is used afterwards).
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 1000,
+        max_workers: int = 20,
+    ) -> None:
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.methods = frozenset({HTTPMethod.GET})
+        self.hedged = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._executor: ThreadPoolExecutor = None
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """:return: seconds to wait on a request before sending its duplicate"""
+        latencies = sorted(self._latencies)
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        return latencies[min(len(latencies) - 1, int(len(latencies) * self.quantile))]
+
+    def record(self, latency: float) -> None:
+        """:param latency: seconds a successful request took"""
+        self._latencies.append(latency)
+
+    def close(self) -> None:
+        """Shuts down the worker threads used by `run`."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def run(
+        self, call: Callable[[], Response], duplicate: Callable[[], Response] = None
+    ) -> Response:
+        """
+        Runs `call`, running `duplicate` as well if the first call is slow, and
+        returns the first successful response.
+
+        Both calls run on worker threads: a blocking call cannot be abandoned, so
+        the primary request may not run on the caller's thread if the caller is
+        to return as soon as the duplicate wins.
+
+        :param call: sends the request
+        :param duplicate: sends the duplicate request (e.g. after waiting on a
+            rate limiter), defaults to `call`
+        :return: the first successful response
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers)
+            executor = self._executor
+        futures = [executor.submit(self._timed, call)]
+        done, _ = wait(futures, timeout=self.delay())
+        if not done:
+            self.hedged += 1
+            futures.append(executor.submit(self._timed, duplicate or call))
+        pending, error = set(futures), None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def arun(
+        self,
+        call: Callable[[], Awaitable[Response]],
+        duplicate: Callable[[], Awaitable[Response]] = None,
+    ) -> Response:
+        """
+        Asynchronous version of `run`; the slower request is cancelled as soon as
+        the first response arrives.
+
+        :param call: coroutine function sending the request
+        :param duplicate: coroutine function sending the duplicate request,
+            defaults to `call`
+        :return: the first successful response
+        """
+        tasks = [asyncio.ensure_future(self._atimed(call))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if not done:
+                self.hedged += 1
+                tasks.append(asyncio.ensure_future(self._atimed(duplicate or call)))
+            pending, error = set(tasks), None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _timed(self, call: Callable[[], Response]) -> Response:
+        start = time.monotonic()
+        response = call()
+        if response.status_code < 400:
+            self.record(time.monotonic() - start)
+        return response
+
+    async def _atimed(self, call: Callable[[], Awaitable[Response]]) -> Response:
+        start = time.monotonic()
+        response = await call()
+        if response.status_code < 400:
+            self.record(time.monotonic() - start)
+        return response
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the upstream is unhealthy.
+
+    After `failure_threshold` consecutive failures (connection errors or `5xx`
+    responses) the circuit opens, and every request raises CircuitOpenError
+    without being sent. Once `recovery_time` seconds have passed a single trial
+    request is let through: if it succeeds the circuit closes again, otherwise
+    it stays open for another `recovery_time` seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self._opened_at: float = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.recovery_time:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def before_request(self) -> None:
+        """Raises CircuitOpenError if a request may not be sent right now."""
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return
+            if state == self.OPEN or self._trial_in_flight:
+                raise CircuitOpenError(
+                    f"Circuit open after {self.failures} consecutive failures"
+                )
+            self._trial_in_flight = True
+
+    def record(self, response: Response = None, error: Exception = None) -> None:
+        """
+        :param response: the response of the request, if there was one
+        :param error: the error raised by the request, if there was one
+        """
+        failed = error is not None or response.status_code >= 500
+        with self._lock:
+            self._trial_in_flight = False
+            if not failed:
+                self.failures = 0
+                self._opened_at = None
+                return
+            self.failures += 1
+            if self._opened_at is not None or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
@@ -2,30 +2,244 @@
 Module containing all relevant functionality related to the Stats NHL API.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from http import HTTPMethod
 
-from nhl_data.api.http_client import HttpClient
+from httpx import Limits
+
+from nhl_data.api.bulk import FetchResult, amap_concurrent, map_concurrent
+from nhl_data.api.cache import ResponseCache, ValidatorCache
+from nhl_data.api.decoding import response_json
+from nhl_data.api.http_client import (
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    HttpClient,
+    HttpClientAsync,
+)
+from nhl_data.api.metadata import MetadataRegistry
+from nhl_data.api.resilience import (
+    CircuitBreaker,
+    HedgePolicy,
+    RateLimiter,
+    RetryPolicy,
+    TimeoutPolicy,
+)
+from nhl_data.api.streaming import ALL_PLAYS_PREFIX, aiter_json_items, iter_json_items
 from nhl_data.models import (
     Boxscore,
     Draft,
     Game,
+    LazyGame,
     Person,
+    Play,
     Prospect,
     ScheduleDate,
     Season,
     Standing,
     Team,
 )
+from nhl_data.models.base import Model
+
+TEAM_EXPANDS = ["team.record", "team.leaders", "team.roster"]
+PEOPLE_EXPANDS = ["person.social"]
+PEOPLE_STATS = [
+    "yearByYear",
+    "yearByYearPlayoffs",
+    "careerRegularSeason",
+    "careerPlayoffs",
+    "gameLog",
+    "playoffGameLog",
+    "winLoss",
+    "winLossPlayoffs",
+    "homeAndAway",
+    "homeAndAwayPlayoffs",
+    "byMonth",
+    "byMonthPlayoffs",
+    "byDayOfWeek",
+    "byDayOfWeekPlayoffs",
+    "goalsByGameSituation",
+    "goalsByGameSituationPlayoffs",
+]
+TEAMS_PER_REQUEST = 50
+"""The most team ids sent in the `teamId` parameter of a single request."""
+
+
+def _season(start_year: int = None) -> str | None:
+    """Formats a season start year the way the API expects, e.g. `20222023`."""
+    return f"{start_year}{start_year+1}" if start_year else None
+
+
+def _teams_params(
+    team_ids: list,
+    season_start_year: int,
+    expands: Iterable[str] = TEAM_EXPANDS,
+    leader_categories: Iterable[str] = None,
+) -> dict:
+    params = {
+        "teamId": ",".join([str(x) for x in team_ids]),
+        "expand": ",".join(expands) or None,
+        "leaderCategories": (
+            ",".join(leader_categories) if leader_categories is not None else None
+        ),
+        "season": _season(season_start_year),
+    }
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _needs_leader_types(expands: Iterable[str], leader_categories: list) -> bool:
+    """Whether every leader category has to be looked up for a `teams` request."""
+    return leader_categories is None and "team.leaders" in expands
+
+
+def _parser(model_cls: type[Model], fields: Iterable[str] = None) -> Callable:
+    """The function building `model_cls` from a response, parsing only `fields`."""
+    return model_cls.from_response if fields is None else model_cls.projection(fields)
+
+
+def _leader_categories(leader_types: list[dict]) -> list[str]:
+    return [
+        stat["displayName"]
+        for stat in leader_types
+        if stat.get("displayName") is not None
+    ]
+
+
+def _unique(ids: Iterable[int]) -> list[int]:
+    """Drops repeated ids, keeping the order in which they were first seen."""
+    return list(dict.fromkeys(ids))
+
+
+def _chunks(ids: list[int], size: int) -> Iterator[list[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def _schedule_params(
+    team_ids: list[int], season: int, start_date: str, end_date: str
+) -> dict:
+    return {
+        "teamId": ",".join(str(x) for x in team_ids) if team_ids else None,
+        "startDate": start_date,
+        "endDate": end_date,
+        "season": _season(season),
+    }
+
+
+def _people_params(
+    season_start_year: int,
+    stats: Iterable[str] = PEOPLE_STATS,
+    expands: Iterable[str] = PEOPLE_EXPANDS,
+) -> dict:
+    stats = list(stats)
+    expands = [e for e in expands if e != "person.stats"]
+    if stats:
+        expands.append("person.stats")
+    params = {
+        "expand": ",".join(expands) or None,
+        "stats": ",".join(stats) or None,
+        "season": _season(season_start_year),
+    }
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _standings_params(standing_type: str, season_start: int) -> dict:
+    return {"standingsType": standing_type, "season": _season(season_start)}
+
+
+def _load_structs():
+    """Imports the typed decoders, which require the optional `msgspec`."""
+    from nhl_data.models import structs
+
+    return structs
 
 
 class StatsNhlApi:
-    """Wrapper for the Stats NHL API."""
+    """
+    Wrapper for the Stats NHL API.
+
+    Every request is sent through a single, long-lived `HttpClient`, which keeps
+    its connections alive between calls. Use the wrapper as a context manager
+    (or call `close`) to release the connection pool when finished.
+    """
 
     base_domain = "https://statsapi.web.nhl.com"
 
-    def __init__(self, api_version=1) -> None:
+    def __init__(
+        self,
+        api_version=1,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache = None,
+        validators: ValidatorCache = None,
+        typed_decoding: bool = False,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        timeouts: TimeoutPolicy = None,
+        hedging: HedgePolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        coalesce: bool = False,
+        metadata: MetadataRegistry = None,
+    ) -> None:
+        """
+        :param api_version: the version of the Stats NHL API to use, defaults to 1
+        :param timeout: seconds to wait on a request before giving up,
+            defaults to 10
+        :param limits: the connection pool limits, defaults to 10 connections
+            which are kept alive for 30 seconds
+        :param http2: whether to negotiate HTTP/2 when the server supports it,
+            requires the `http2` extra to be installed, defaults to False
+        :param cache: cache to serve unchanging responses (e.g. seasons, finished
+            games) from, defaults to no caching
+        :param validators: remembers ETag / Last-Modified validators so polled
+            endpoints are only re-downloaded once they change, defaults to None
+        :param typed_decoding: decode live feeds, boxscores and schedules straight
+            into typed structs, requires the `msgspec` extra, defaults to False
+        :param retry: policy for retrying failed requests, defaults to never
+            retrying
+        :param rate_limiter: limits the rate of requests, and may be shared with
+            other clients, defaults to no limit
+        :param timeouts: per-endpoint timeouts overriding `timeout`,
+            defaults to None
+        :param hedging: sends a duplicate of requests which are slower than usual,
+            defaults to no hedging
+        :param circuit_breaker: fails requests fast while the API is unhealthy,
+            defaults to None
+        :param coalesce: concurrent identical GET requests share a single upstream
+            request and its decoded response, defaults to False
+        :param metadata: serves leader types, stat types, standings types and
+            seasons after their first request, and may be shared with other
+            wrappers, defaults to a registry of this wrapper's own
+        """
         self.base_url = f"{self.base_domain}/api/v{api_version}"
         self.version = api_version
+        self.client = HttpClient(
+            self.base_url,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            validators=validators,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            timeouts=timeouts,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            coalesce=coalesce,
+        )
+        self.structs = _load_structs() if typed_decoding else None
+        self.metadata = metadata if metadata is not None else MetadataRegistry()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying connection pool."""
+        self.client.close()
 
     def request(
         self, method: HTTPMethod, endpoint: str, url_parameters: dict = None
@@ -39,9 +253,8 @@ class StatsNhlApi:
             defaults to None
         :return: the JSON response from the request
         """
-        with HttpClient(self.base_url) as client:
-            response = client.request(method, endpoint, url_parameters)
-        return response.json()
+        response = self.client.request(method, endpoint, url_parameters)
+        return response_json(response)
 
     def get(self, endpoint: str, url_parameters: dict = None) -> dict | list:
         """
@@ -52,19 +265,49 @@ class StatsNhlApi:
             defaults to None
         :return: the JSON response from the request
         """
-        with HttpClient(self.base_url) as client:
-            response = client.get(endpoint, url_parameters)
-        return response.json()
+        response = self.client.get(endpoint, url_parameters)
+        return response_json(response)
+
+    def get_content(self, endpoint: str, url_parameters: dict = None) -> bytes:
+        """
+        Sends a GET request to the Stats NHL API, without decoding the response.
+
+        :param endpoint: the endpoint we want to send the request to
+        :param url_parameters: any additional parameters to add for the request,
+            defaults to None
+        :return: the raw body of the response
+        """
+        return self.client.get(endpoint, url_parameters).content
 
-    def teams(self, team_ids: list = [], season_start_year: int = None) -> list[Team]:
+    def metadata_body(self, endpoint: str) -> dict | list:
         """
-        Pulls data from the `teams` endpoint. This method expands some of the endpoints
-        that are normally not included. This includes:
+        Returns the body of a metadata endpoint from the metadata registry,
+        requesting it only if it was never loaded.
+
+        :param endpoint: one of `METADATA_ENDPOINTS`, e.g. `/statTypes`
+        :return: the JSON response of the endpoint
+        """
+        return self.metadata.fetch(endpoint, lambda: self.get(endpoint))
+
+    def teams(
+        self,
+        team_ids: list = [],
+        season_start_year: int = None,
+        expands: Iterable[str] = TEAM_EXPANDS,
+        leader_categories: Iterable[str] = None,
+        fields: Iterable[str] = None,
+    ) -> list[Team]:
+        """
+        Pulls data from the `teams` endpoint. By default, this method expands some
+        of the endpoints that are normally not included. This includes:
 
         - leaders
         - records
         - roster
 
+        Each of these makes the response considerably larger, so callers which
+        only need some of them should narrow `expands` (and `leader_categories`).
+
         If `team_ids` is not specified, it will pull data from every single team.
         If `season_start_year` is not specified, it will pull data from the
         current season.
@@ -73,39 +316,130 @@ class StatsNhlApi:
             defaults to pulling every team
         :param season_start_year: the season we want to pull from,
             defaults to pulling from the current season
+        :param expands: the expands to request, defaults to `TEAM_EXPANDS`
+        :param leader_categories: the leader categories to request with the
+            `team.leaders` expand, defaults to every category
+        :param fields: the only fields of the Team models to parse,
+            defaults to every field
         :return: team data represented in custom models
         """
-        expands = ["team.record", "team.leaders", "team.roster"]
-        season = (
-            f"{season_start_year}{season_start_year+1}" if season_start_year else None
+        expands = list(expands)
+        leader_categories = self._leader_categories(expands, leader_categories)
+        params = _teams_params(team_ids, season_start_year, expands, leader_categories)
+        response = self.get("/teams", url_parameters=params)
+        parse = _parser(Team, fields)
+        return [parse(t) for t in response.get("teams")]
+
+    def teams_many(
+        self,
+        team_ids: Iterable[int],
+        season_start_year: int = None,
+        expands: Iterable[str] = TEAM_EXPANDS,
+        leader_categories: Iterable[str] = None,
+        fields: Iterable[str] = None,
+        max_workers: int = 10,
+    ) -> dict[int, Team]:
+        """
+        Pulls many teams in as few requests as possible. The `teams` endpoint
+        accepts a list of ids, so repeated ids are dropped and the rest are sent
+        `TEAMS_PER_REQUEST` at a time, the chunks in parallel on a thread pool.
+        See `teams` for the remaining parameters.
+
+        :param team_ids: the teams we want to pull, may contain repeats
+        :param season_start_year: the season we want to pull from,
+            defaults to pulling from the current season
+        :param expands: the expands to request, defaults to `TEAM_EXPANDS`
+        :param leader_categories: the leader categories to request with the
+            `team.leaders` expand, defaults to every category
+        :param fields: the only fields of the Team models to parse,
+            defaults to every field
+        :param max_workers: the maximum number of requests in flight at once,
+            defaults to 10
+        :return: Team model of every team found, keyed by team id
+        """
+        team_ids = _unique(team_ids)
+        if not team_ids:
+            return dict()
+        expands = list(expands)
+        leader_categories = self._leader_categories(expands, leader_categories)
+        parse = _parser(Team, fields)
+        results = map_concurrent(
+            lambda chunk: self.get(
+                "/teams",
+                url_parameters=_teams_params(
+                    chunk, season_start_year, expands, leader_categories
+                ),
+            ),
+            _chunks(team_ids, TEAMS_PER_REQUEST),
+            max_workers,
         )
-        with HttpClient(self.base_url) as client:
-            leader_categories = [
-                stat.get("displayName")
-                for stat in client.get("/leagueLeaderTypes").json()
-            ]
-            params = {
-                "teamId": ",".join([str(x) for x in team_ids]),
-                "expand": ",".join(expands),
-                "leaderCategories": ",".join(leader_categories),
-                "season": season,
-            }
-            if season is None:
-                del params["season"]
-            response = client.get("/teams", url_parameters=params).json()
-        return [Team.from_response(t) for t in response.get("teams")]
-
-    def game(self, game_id: int) -> Game:
+        teams = dict()
+        for result in results:
+            if not result.ok:
+                raise result.error
+            teams.update((t["id"], parse(t)) for t in result.value["teams"])
+        return teams
+
+    def _leader_categories(
+        self, expands: list[str], leader_categories: Iterable[str] = None
+    ) -> list[str] | None:
+        if _needs_leader_types(expands, leader_categories):
+            return _leader_categories(self.metadata_body("/leagueLeaderTypes"))
+        return list(leader_categories) if leader_categories is not None else None
+
+    def game(self, game_id: int, lazy: bool = False) -> Game:
         """
         Pulls data from the `game` endpoint. This method specifically retrieves the live
         feed data for a specific game.
 
+        If `lazy` is set, a LazyGame is returned, which only parses the fields
+        (e.g. plays or the boxscore) that are actually accessed.
+
         :param game_id: the specific game we want to look at
+        :param lazy: defer parsing each field until it is accessed, defaults to False
         :return: all game data for a specific game
         """
         url = f"/game/{game_id}/feed/live"
+        if self.structs is not None and not lazy:
+            return self.structs.decode_game(self.get_content(url))
         game_data = self.get(url)
-        return Game.from_response(game_data)
+        return (LazyGame if lazy else Game).from_response(game_data)
+
+    def iter_plays(self, game_id: int) -> Iterator[Play]:
+        """
+        Streams the plays of a game from its live feed, decoding the response body
+        incrementally and yielding every Play as soon as it has been read. Memory
+        use stays flat regardless of the size of the feed, as neither the body
+        nor the decoded document are ever held in full.
+
+        Requires the optional `ijson` dependency.
+
+        :param game_id: the specific game we want to look at
+        :return: iterator of the game's plays, in order
+        """
+        url = f"/game/{game_id}/feed/live"
+        with self.client.stream(HTTPMethod.GET, url) as response:
+            for data in iter_json_items(response.iter_bytes(), ALL_PLAYS_PREFIX):
+                yield Play.from_response(data)
+
+    def fetch_games(
+        self, game_ids: Iterable[int], max_workers: int = 10
+    ) -> Iterator[FetchResult]:
+        """
+        Pulls the live feed of many games in parallel on a thread pool, yielding
+        each one as soon as it has been fetched and parsed.
+
+        A failing game does not abort the batch; its error is reported on the
+        yielded result instead. `max_workers` should not exceed the connection
+        pool size, otherwise workers wait on the pool rather than the network.
+
+        :param game_ids: the games we want to pull, consumed lazily
+        :param max_workers: the maximum number of requests in flight at once,
+            defaults to 10
+        :return: iterator of FetchResults keyed by game id, in completion order,
+            whose value is the Game model
+        """
+        return map_concurrent(self.game, game_ids, max_workers)
 
     def boxscore(self, game_id: int) -> Boxscore:
         """
@@ -116,18 +450,20 @@ class StatsNhlApi:
         :return: all boxscore data for a specific game
         """
         url = f"/game/{game_id}/boxscore"
+        if self.structs is not None:
+            return self.structs.decode_boxscore(self.get_content(url))
         game_data = self.get(url)
         return Boxscore.from_response(game_data)
 
     def seasons(self) -> list[Season]:
         """
-        Pulls data from the `seasons` endpoint.
+        Pulls data from the `seasons` endpoint. The response is kept in the
+        metadata registry, so only the first call sends a request.
 
         :return: summary data for every season in the NHL, represented as a list
             of Season models
         """
-        url = "/seasons"
-        seasons_data = self.get(url).get("seasons", [])
+        seasons_data = self.metadata_body("/seasons").get("seasons", [])
         return [Season.from_response(data) for data in seasons_data]
 
     def schedule(
@@ -160,16 +496,20 @@ class StatsNhlApi:
             retrieved
         """
         url = "/schedule"
-        params = {
-            "teamId": ",".join(str(x) for x in team_ids) if team_ids else None,
-            "startDate": start_date,
-            "endDate": end_date,
-            "season": f"{season}{season+1}" if season else None,
-        }
+        params = _schedule_params(team_ids, season, start_date, end_date)
+        if self.structs is not None:
+            return self.structs.decode_schedule(self.get_content(url, params))
         data = self.get(url, url_parameters=params).get("dates", [])
         return [ScheduleDate.from_response(d) for d in data]
 
-    def people(self, person_id: int, season_start_year: int) -> Person:
+    def people(
+        self,
+        person_id: int,
+        season_start_year: int = None,
+        stats: Iterable[str] = PEOPLE_STATS,
+        expands: Iterable[str] = PEOPLE_EXPANDS,
+        fields: Iterable[str] = None,
+    ) -> Person:
         """
         Pulls data from the `people` endpoint. This method fetches data containing
         general information, stats, and other misc. information.
@@ -178,39 +518,63 @@ class StatsNhlApi:
         season specific stats in that specific year. Otherwise, it will search for
         the current season.
 
+        By default every stat type of `PEOPLE_STATS` is requested, which makes for
+        a large response; callers which only need some of them should narrow
+        `stats`, or pass no stats at all.
+
         :param person_id: the specific person we want to search for
         :param season_start_year: the season start year of the season specific stats,
             defaults to None
+        :param stats: the stat types to request, defaults to `PEOPLE_STATS`
+        :param expands: the expands to request besides `person.stats`, which is
+            added whenever stats are requested, defaults to `PEOPLE_EXPANDS`
+        :param fields: the only fields of the Person model to parse,
+            defaults to every field
         :return: Person model containing all data for a specific person
         """
         url = f"/people/{person_id}"
-        stats_to_query = [
-            "yearByYear",
-            "yearByYearPlayoffs",
-            "careerRegularSeason",
-            "careerPlayoffs",
-            "gameLog",
-            "playoffGameLog",
-            "winLoss",
-            "winLossPlayoffs",
-            "homeAndAway",
-            "homeAndAwayPlayoffs",
-            "byMonth",
-            "byMonthPlayoffs",
-            "byDayOfWeek",
-            "byDayOfWeekPlayoffs",
-            "goalsByGameSituation",
-            "goalsByGameSituationPlayoffs",
-        ]
-        params = {
-            "expand": "person.social,person.stats",
-            "stats": ",".join(stats_to_query),
-            "season": f"{season_start_year}{season_start_year+1}"
-            if season_start_year
-            else None,
-        }
+        params = _people_params(season_start_year, stats, expands)
         data = self.get(url, params).get("people")[0]
-        return Person.from_response(data)
+        return _parser(Person, fields)(data)
+
+    def people_many(
+        self,
+        person_ids: Iterable[int],
+        season_start_year: int = None,
+        max_workers: int = 10,
+        stats: Iterable[str] = PEOPLE_STATS,
+        expands: Iterable[str] = PEOPLE_EXPANDS,
+        fields: Iterable[str] = None,
+    ) -> dict[int, Person]:
+        """
+        Pulls many people in parallel on a thread pool. The `people` endpoint only
+        accepts a single id, so one request is sent per distinct id; repeated ids
+        are only requested once.
+
+        A person who cannot be pulled does not abort the batch: the failure is
+        logged and the id is missing from the result.
+
+        :param person_ids: the people we want to pull, may contain repeats
+        :param season_start_year: the season start year of the season specific stats,
+            defaults to None
+        :param max_workers: the maximum number of requests in flight at once,
+            defaults to 10
+        :param stats: the stat types to request, defaults to `PEOPLE_STATS`
+        :param expands: the expands to request, defaults to `PEOPLE_EXPANDS`
+        :param fields: the only fields of the Person models to parse,
+            defaults to every field
+        :return: Person model of every person pulled, keyed by person id
+        """
+        stats, expands = list(stats), list(expands)
+        fields = frozenset(fields) if fields is not None else None
+        results = map_concurrent(
+            lambda person_id: self.people(
+                person_id, season_start_year, stats, expands, fields
+            ),
+            _unique(person_ids),
+            max_workers,
+        )
+        return {result.key: result.value for result in results if result.ok}
 
     def standings(
         self, standing_type: str = None, season_start: int = None
@@ -233,10 +597,7 @@ class StatsNhlApi:
         :return: list of Standing Models containing data for a specific standing
         """
         url = "/standings"
-        params = {
-            "standingsType": standing_type,
-            "season": f"{season_start}{season_start+1}" if season_start else None,
-        }
+        params = _standings_params(standing_type, season_start)
         data = self.get(url, url_parameters=params).get("records", [])
         return [Standing.from_response(d) for d in data]
 
@@ -277,10 +638,9 @@ class StatsNhlApi:
 
         :return: list of strings representing the stat types that are queryable
         """
-        url = "/statTypes"
         data = [
             stat["displayName"]
-            for stat in self.get(url)
+            for stat in self.metadata_body("/statTypes")
             if stat.get("displayName") is not None
         ]
         return data
@@ -293,6 +653,448 @@ class StatsNhlApi:
         :return: list of strings representing all possible standing types that are
             queryable
         """
-        url = "/standingsTypes"
-        data = [standing["name"] for standing in self.get(url) if "name" in standing]
+        data = [
+            standing["name"]
+            for standing in self.metadata_body("/standingsTypes")
+            if "name" in standing
+        ]
         return data
+
+
+class AsyncStatsNhlApi:
+    """
+    Asynchronous wrapper for the Stats NHL API.
+
+    Mirrors every endpoint of `StatsNhlApi`, but each method is a coroutine. All
+    requests share a single `HttpClientAsync`, and at most `max_concurrency`
+    requests are in flight at the same time, so callers can safely `gather`
+    hundreds of calls (e.g. every game of a season) in one event loop.
+    """
+
+    base_domain = StatsNhlApi.base_domain
+
+    def __init__(
+        self,
+        api_version=1,
+        max_concurrency: int = 10,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache = None,
+        validators: ValidatorCache = None,
+        typed_decoding: bool = False,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        timeouts: TimeoutPolicy = None,
+        hedging: HedgePolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        coalesce: bool = False,
+        metadata: MetadataRegistry = None,
+    ) -> None:
+        """
+        :param api_version: the version of the Stats NHL API to use, defaults to 1
+        :param max_concurrency: the maximum number of requests that are sent at the
+            same time, defaults to 10
+        :param timeout: seconds to wait on a request before giving up,
+            defaults to 10
+        :param limits: the connection pool limits, defaults to 10 connections
+            which are kept alive for 30 seconds
+        :param http2: whether to negotiate HTTP/2 when the server supports it,
+            requires the `http2` extra to be installed, defaults to False
+        :param cache: cache to serve unchanging responses (e.g. seasons, finished
+            games) from, defaults to no caching
+        :param validators: remembers ETag / Last-Modified validators so polled
+            endpoints are only re-downloaded once they change, defaults to None
+        :param typed_decoding: decode live feeds, boxscores and schedules straight
+            into typed structs, requires the `msgspec` extra, defaults to False
+        :param retry: policy for retrying failed requests, defaults to never
+            retrying
+        :param rate_limiter: limits the rate of requests, and may be shared with
+            other clients, defaults to no limit
+        :param timeouts: per-endpoint timeouts overriding `timeout`,
+            defaults to None
+        :param hedging: sends a duplicate of requests which are slower than usual,
+            defaults to no hedging
+        :param circuit_breaker: fails requests fast while the API is unhealthy,
+            defaults to None
+        :param coalesce: concurrent identical GET requests share a single upstream
+            request and its decoded response, defaults to False
+        :param metadata: serves leader types, stat types, standings types and
+            seasons after their first request, and may be shared with other
+            wrappers, defaults to a registry of this wrapper's own
+        """
+        self.base_url = f"{self.base_domain}/api/v{api_version}"
+        self.version = api_version
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.client = HttpClientAsync(
+            self.base_url,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            validators=validators,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            timeouts=timeouts,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            coalesce=coalesce,
+            concurrency=self.semaphore,
+        )
+        self.structs = _load_structs() if typed_decoding else None
+        self.metadata = metadata if metadata is not None else MetadataRegistry()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        await self.client.close()
+
+    async def request(
+        self, method: HTTPMethod, endpoint: str, url_parameters: dict = None
+    ) -> dict | list:
+        """
+        Sends an arbitrary request to the Stats NHL API.
+
+        :param method: the specific HTTP Method to send
+        :param endpoint: the endpoint we want to send the request to
+        :param url_parameters: any additional parameters to add for the request,
+            defaults to None
+        :return: the JSON response from the request
+        """
+        response = await self.client.request(method, endpoint, url_parameters)
+        return response_json(response)
+
+    async def get(self, endpoint: str, url_parameters: dict = None) -> dict | list:
+        """
+        Sends a GET request to the Stats NHL API.
+
+        :param endpoint: the endpoint we want to send the request to
+        :param url_parameters: any additional parameters to add for the request,
+            defaults to None
+        :return: the JSON response from the request
+        """
+        response = await self.client.get(endpoint, url_parameters)
+        return response_json(response)
+
+    async def get_content(self, endpoint: str, url_parameters: dict = None) -> bytes:
+        """
+        Sends a GET request to the Stats NHL API, without decoding the response.
+
+        :param endpoint: the endpoint we want to send the request to
+        :param url_parameters: any additional parameters to add for the request,
+            defaults to None
+        :return: the raw body of the response
+        """
+        response = await self.client.get(endpoint, url_parameters)
+        return response.content
+
+    async def metadata_body(self, endpoint: str) -> dict | list:
+        """
+        Returns the body of a metadata endpoint from the metadata registry.
+        See `StatsNhlApi.metadata_body`.
+
+        :param endpoint: one of `METADATA_ENDPOINTS`, e.g. `/statTypes`
+        :return: the JSON response of the endpoint
+        """
+        return await self.metadata.afetch(endpoint, lambda: self.get(endpoint))
+
+    async def teams(
+        self,
+        team_ids: list = [],
+        season_start_year: int = None,
+        expands: Iterable[str] = TEAM_EXPANDS,
+        leader_categories: Iterable[str] = None,
+        fields: Iterable[str] = None,
+    ) -> list[Team]:
+        """
+        Pulls data from the `teams` endpoint. See `StatsNhlApi.teams`.
+
+        :param team_ids: the specific teams we want to pull,
+            defaults to pulling every team
+        :param season_start_year: the season we want to pull from,
+            defaults to pulling from the current season
+        :param expands: the expands to request, defaults to `TEAM_EXPANDS`
+        :param leader_categories: the leader categories to request with the
+            `team.leaders` expand, defaults to every category
+        :param fields: the only fields of the Team models to parse,
+            defaults to every field
+        :return: team data represented in custom models
+        """
+        expands = list(expands)
+        leader_categories = await self._leader_categories(expands, leader_categories)
+        params = _teams_params(team_ids, season_start_year, expands, leader_categories)
+        response = await self.get("/teams", url_parameters=params)
+        parse = _parser(Team, fields)
+        return [parse(t) for t in response.get("teams")]
+
+    async def teams_many(
+        self,
+        team_ids: Iterable[int],
+        season_start_year: int = None,
+        expands: Iterable[str] = TEAM_EXPANDS,
+        leader_categories: Iterable[str] = None,
+        fields: Iterable[str] = None,
+    ) -> dict[int, Team]:
+        """
+        Pulls many teams in as few requests as possible, sending the chunks
+        concurrently. See `StatsNhlApi.teams_many`.
+
+        :param team_ids: the teams we want to pull, may contain repeats
+        :param season_start_year: the season we want to pull from,
+            defaults to pulling from the current season
+        :param expands: the expands to request, defaults to `TEAM_EXPANDS`
+        :param leader_categories: the leader categories to request with the
+            `team.leaders` expand, defaults to every category
+        :param fields: the only fields of the Team models to parse,
+            defaults to every field
+        :return: Team model of every team found, keyed by team id
+        """
+        team_ids = _unique(team_ids)
+        if not team_ids:
+            return dict()
+        expands = list(expands)
+        leader_categories = await self._leader_categories(expands, leader_categories)
+        parse = _parser(Team, fields)
+        responses = await asyncio.gather(
+            *[
+                self.get(
+                    "/teams",
+                    url_parameters=_teams_params(
+                        chunk, season_start_year, expands, leader_categories
+                    ),
+                )
+                for chunk in _chunks(team_ids, TEAMS_PER_REQUEST)
+            ]
+        )
+        return {t["id"]: parse(t) for response in responses for t in response["teams"]}
+
+    async def _leader_categories(
+        self, expands: list[str], leader_categories: Iterable[str] = None
+    ) -> list[str] | None:
+        if _needs_leader_types(expands, leader_categories):
+            return _leader_categories(await self.metadata_body("/leagueLeaderTypes"))
+        return list(leader_categories) if leader_categories is not None else None
+
+    async def game(self, game_id: int, lazy: bool = False) -> Game:
+        """
+        Pulls the live feed data for a specific game. See `StatsNhlApi.game`.
+
+        :param game_id: the specific game we want to look at
+        :param lazy: defer parsing each field until it is accessed, defaults to False
+        :return: all game data for a specific game
+        """
+        url = f"/game/{game_id}/feed/live"
+        if self.structs is not None and not lazy:
+            return self.structs.decode_game(await self.get_content(url))
+        game_data = await self.get(url)
+        return (LazyGame if lazy else Game).from_response(game_data)
+
+    async def iter_plays(self, game_id: int) -> AsyncIterator[Play]:
+        """
+        Streams the plays of a game from its live feed. See
+        `StatsNhlApi.iter_plays`.
+
+        :param game_id: the specific game we want to look at
+        :return: async iterator of the game's plays, in order
+        """
+        url = f"/game/{game_id}/feed/live"
+        async with self.client.stream(HTTPMethod.GET, url) as response:
+            chunks = response.aiter_bytes()
+            async for data in aiter_json_items(chunks, ALL_PLAYS_PREFIX):
+                yield Play.from_response(data)
+
+    def fetch_games(
+        self, game_ids: Iterable[int], max_concurrency: int = None
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Pulls the live feed of many games concurrently, yielding each one as soon
+        as it has been fetched and parsed. See `StatsNhlApi.fetch_games`.
+
+        :param game_ids: the games we want to pull, consumed lazily
+        :param max_concurrency: the maximum number of games in flight at once,
+            defaults to the `max_concurrency` of this wrapper
+        :return: async iterator of FetchResults keyed by game id, in completion
+            order, whose value is the Game model
+        """
+        return amap_concurrent(
+            self.game, game_ids, max_concurrency or self.max_concurrency
+        )
+
+    async def boxscore(self, game_id: int) -> Boxscore:
+        """
+        Pulls data from the boxscore endpoint. See `StatsNhlApi.boxscore`.
+
+        :param game_id: the specific game we want to look at
+        :return: all boxscore data for a specific game
+        """
+        url = f"/game/{game_id}/boxscore"
+        if self.structs is not None:
+            return self.structs.decode_boxscore(await self.get_content(url))
+        game_data = await self.get(url)
+        return Boxscore.from_response(game_data)
+
+    async def seasons(self) -> list[Season]:
+        """
+        Pulls data from the `seasons` endpoint. See `StatsNhlApi.seasons`.
+
+        :return: summary data for every season in the NHL, represented as a list
+            of Season models
+        """
+        seasons_data = (await self.metadata_body("/seasons")).get("seasons", [])
+        return [Season.from_response(data) for data in seasons_data]
+
+    async def schedule(
+        self,
+        team_ids: list[int] = None,
+        season: int = None,
+        start_date: str = None,
+        end_date: str = None,
+    ) -> list[ScheduleDate]:
+        """
+        Pulls data from the `schedule` endpoint. See `StatsNhlApi.schedule`.
+
+        :param team_ids: specific teams we want search for, defaults to None
+        :param season: specific season we want to search on, defaults to None
+        :param start_date: the beginning of a date range we want to search on,
+            defaults to None
+        :param end_date: the end of a date range we want to search on, default to None
+        :return: list of ScheduleDate models which contains summary data for each date
+            retrieved
+        """
+        params = _schedule_params(team_ids, season, start_date, end_date)
+        if self.structs is not None:
+            content = await self.get_content("/schedule", params)
+            return self.structs.decode_schedule(content)
+        data = (await self.get("/schedule", url_parameters=params)).get("dates", [])
+        return [ScheduleDate.from_response(d) for d in data]
+
+    async def people(
+        self,
+        person_id: int,
+        season_start_year: int = None,
+        stats: Iterable[str] = PEOPLE_STATS,
+        expands: Iterable[str] = PEOPLE_EXPANDS,
+        fields: Iterable[str] = None,
+    ) -> Person:
+        """
+        Pulls data from the `people` endpoint. See `StatsNhlApi.people`.
+
+        :param person_id: the specific person we want to search for
+        :param season_start_year: the season start year of the season specific stats,
+            defaults to None
+        :param stats: the stat types to request, defaults to `PEOPLE_STATS`
+        :param expands: the expands to request besides `person.stats`, which is
+            added whenever stats are requested, defaults to `PEOPLE_EXPANDS`
+        :param fields: the only fields of the Person model to parse,
+            defaults to every field
+        :return: Person model containing all data for a specific person
+        """
+        params = _people_params(season_start_year, stats, expands)
+        data = (await self.get(f"/people/{person_id}", params)).get("people")[0]
+        return _parser(Person, fields)(data)
+
+    async def people_many(
+        self,
+        person_ids: Iterable[int],
+        season_start_year: int = None,
+        max_concurrency: int = None,
+        stats: Iterable[str] = PEOPLE_STATS,
+        expands: Iterable[str] = PEOPLE_EXPANDS,
+        fields: Iterable[str] = None,
+    ) -> dict[int, Person]:
+        """
+        Pulls many people concurrently, requesting every distinct id once.
+        See `StatsNhlApi.people_many`.
+
+        :param person_ids: the people we want to pull, may contain repeats
+        :param season_start_year: the season start year of the season specific stats,
+            defaults to None
+        :param max_concurrency: the maximum number of requests in flight at once,
+            defaults to the `max_concurrency` of this wrapper
+        :param stats: the stat types to request, defaults to `PEOPLE_STATS`
+        :param expands: the expands to request, defaults to `PEOPLE_EXPANDS`
+        :param fields: the only fields of the Person models to parse,
+            defaults to every field
+        :return: Person model of every person pulled, keyed by person id
+        """
+        stats, expands = list(stats), list(expands)
+        fields = frozenset(fields) if fields is not None else None
+        results = amap_concurrent(
+            lambda person_id: self.people(
+                person_id, season_start_year, stats, expands, fields
+            ),
+            _unique(person_ids),
+            max_concurrency or self.max_concurrency,
+        )
+        return {result.key: result.value async for result in results if result.ok}
+
+    async def standings(
+        self, standing_type: str = None, season_start: int = None
+    ) -> list[Standing]:
+        """
+        Pulls data from the `standings` endpoint. See `StatsNhlApi.standings`.
+
+        :param standing_type: the specific standing type we want to search by,
+            defaults to None
+        :param season_start: the start year of the season we want to look at
+            standings for, defaults to None
+        :return: list of Standing Models containing data for a specific standing
+        """
+        params = _standings_params(standing_type, season_start)
+        data = (await self.get("/standings", url_parameters=params)).get("records", [])
+        return [Standing.from_response(d) for d in data]
+
+    async def draft(self, draft_year: int = None) -> Draft:
+        """
+        Pulls data from the `draft` endpoint. See `StatsNhlApi.draft`.
+
+        :param draft_year: the specific draft year we want to search, defaults to None
+        :return: Draft Model containing data for a specific draft
+        """
+        url = f"/draft/{draft_year}" if draft_year else "/draft"
+        data = (await self.get(url)).get("drafts")
+        return Draft.from_response(data[0]) if data else Draft()
+
+    async def prospect(self, prospect_id: int = None) -> list[Prospect]:
+        """
+        Pulls data from the `prospects` endpoint. See `StatsNhlApi.prospect`.
+
+        :param prospect_id: the specific draft year we want to search, defaults to None
+        :return: list of Prospect Models containing detailed data for
+            prospects / upcoming players
+        """
+        url = f"/draft/prospects/{prospect_id}" if prospect_id else "/draft/prospects"
+        data = (await self.get(url)).get("prospects", [])
+        return [Prospect.from_response(d) for d in data]
+
+    async def stat_types(self) -> list[str]:
+        """
+        Retrieves a list of all stat types that can searched for from the NHL API.
+
+        :return: list of strings representing the stat types that are queryable
+        """
+        return [
+            stat["displayName"]
+            for stat in await self.metadata_body("/statTypes")
+            if stat.get("displayName") is not None
+        ]
+
+    async def standing_types(self) -> list[str]:
+        """
+        Retrieves a list of all the standing types that can be searched for from
+        the NHL API.
+
+        :return: list of strings representing all possible standing types that are
+            queryable
+        """
+        return [
+            standing["name"]
+            for standing in await self.metadata_body("/standingsTypes")
+            if "name" in standing
+        ]
@@ -0,0 +1,70 @@
+"""
+Incremental decoding of JSON response bodies, for payloads too large to be
+decoded in one go (e.g. the live feed of a finished game).
+
+Requires the optional `ijson` dependency (`poetry install -E streaming`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+ALL_PLAYS_PREFIX = "liveData.plays.allPlays.item"
+"""ijson prefix of every play in a live feed."""
+
+
+def _require_ijson() -> None:
+    if ijson is None:
+        raise ImportError(
+            "Streaming requires ijson, install it with `poetry install -E streaming`"
+        )
+
+
+def iter_json_items(chunks: Iterable[bytes], prefix: str) -> Iterator[Any]:
+    """
+    Decodes the JSON document split over `chunks` incrementally, yielding every
+    value found at `prefix` as soon as it is complete. Only the value being
+    decoded is held in memory, never the whole document.
+
+    :param chunks: the raw document, e.g. `response.iter_bytes()`
+    :param prefix: ijson prefix of the values, e.g. `ALL_PLAYS_PREFIX`
+    :return: iterator of the decoded values, in document order
+    """
+    _require_ijson()
+    items = ijson.sendable_list()
+    coroutine = ijson.items_coro(items, prefix, use_float=True)
+    for chunk in chunks:
+        coroutine.send(chunk)
+        yield from items
+        del items[:]
+    coroutine.close()
+    yield from items
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[bytes], prefix: str
+) -> AsyncIterator[Any]:
+    """
+    Asynchronous version of `iter_json_items`.
+
+    :param chunks: the raw document, e.g. `response.aiter_bytes()`
+    :param prefix: ijson prefix of the values, e.g. `ALL_PLAYS_PREFIX`
+    :return: async iterator of the decoded values, in document order
+    """
+    _require_ijson()
+    items = ijson.sendable_list()
+    coroutine = ijson.items_coro(items, prefix, use_float=True)
+    async for chunk in chunks:
+        coroutine.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+    coroutine.close()
+    for item in items:
+        yield item
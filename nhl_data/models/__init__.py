@@ -1,5 +1,6 @@
 from nhl_data.models.draft import Draft, Prospect
-from nhl_data.models.game import Boxscore, Game
+from nhl_data.models.game import Boxscore, Game, LazyGame, Play
+from nhl_data.models.index import SeasonIndex
 from nhl_data.models.person import Person
 from nhl_data.models.schedule import ScheduleDate
 from nhl_data.models.season import Season
@@ -1,4 +1,39 @@
-from abc import ABC, abstractmethod
+from __future__ import annotations
+
+import dataclasses
+from abc import ABC
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any, NamedTuple
+
+from nhl_data.models.utils import (
+    camel_to_snake_case,
+    convert_keys_to_snake_case,
+    snake_to_camel_case,
+)
+
+
+class FieldSource(NamedTuple):
+    """Where a single model field is read from in the raw (camelCase) response."""
+
+    name: str
+    path: tuple[str, ...]
+    parser: Callable[[Any], Any] | None
+
+
+def source(*path: str, parser: Callable[[Any], Any] = None) -> dataclasses.Field:
+    """
+    Declares where a model field is read from in the raw response.
+
+    Fields that are not declared with `source` are read from the top-level key
+    matching the camelCase version of the field name.
+
+    :param path: the camelCase keys leading to the field's value
+    :param parser: function which builds the field from the raw value,
+        defaults to using the raw value as is
+    :return: dataclass field defaulting to None
+    """
+    return dataclasses.field(default=None, metadata={"path": path, "parser": parser})
 
 
 class Model(ABC):
@@ -6,21 +41,248 @@ class Model(ABC):
     Base class that all Models from the NHL API are based off of.
     """
 
-    @abstractmethod
-    def from_response(cls, data: dict):  # pragma: no cover
+    __slots__ = ()
+
+    @classmethod
+    def field_map(cls) -> tuple[FieldSource, ...]:
+        """
+        The mapping from camelCase response paths to the fields of this model.
+        It is computed once per class.
+
+        :return: a FieldSource for every field of the model
+        """
+        try:
+            return cls.__dict__["_field_map"]
+        except KeyError:
+            field_map = tuple(
+                FieldSource(
+                    field.name,
+                    field.metadata.get("path") or (snake_to_camel_case(field.name),),
+                    field.metadata.get("parser"),
+                )
+                for field in dataclasses.fields(cls)
+            )
+            setattr(cls, "_field_map", field_map)
+            return field_map
+
+    @classmethod
+    def from_response(cls, data: dict, fields: Iterable[str] = None):
         """
-        Helper function which removes specific keywords / fields from the
-        response data depending on the Model, and incorporates other models
-        when applicable.
+        Builds the model straight from the raw response data, following the
+        model's path table. No intermediate snake_case copy of the response is made.
         It preserves the dataclass' `__init__` method, making initialization
         easier for all subclasses.
 
         This should be called rather than the model's `__init__` method.
         This is because this method will account for possible data fields that may be
         included from some response data, that is not accounted for in models.
-        Additionally, it replaces all camelCase fields to snake_case.
+        Additionally, dictionaries stored on the model have their camelCase keys
+        replaced with snake_case.
+
+        If `fields` is given, only those fields are parsed and every other field
+        is left as None, however much data the response holds for it.
 
         :param data: dictionary containing all the data (e.g. the response data)
+        :param fields: the names of the fields to parse, defaults to every field
         :return: an instance of the model
         """
-        raise NotImplementedError
+        if fields is not None:
+            return cls.projection(fields)(data)
+        try:
+            table = cls.__dict__["_path_table"]
+        except KeyError:
+            table = _path_table(cls.field_map())
+            setattr(cls, "_path_table", table)
+        return cls(**_read_paths(table, data, dict()))
+
+    @classmethod
+    def from_response_list(cls, data: list[dict]) -> list:
+        """
+        Builds one model for every item of a list from the response data.
+
+        :param data: list of dictionaries containing the data for each model
+        :return: list of model instances
+        """
+        return [cls.from_response(d) for d in data]
+
+    @classmethod
+    def projection(cls, fields: Iterable[str]) -> Callable[[dict], Model]:
+        """
+        The function which builds the model from a response, parsing only the
+        given fields. Its path table is built once per class and set of fields.
+
+        :param fields: the names of the fields to parse
+        :return: function building an instance of the model from response data
+        """
+        fields = frozenset(fields)
+        projections = cls.__dict__.get("_projections")
+        if projections is None:
+            projections = dict()
+            setattr(cls, "_projections", projections)
+        try:
+            return projections[fields]
+        except KeyError:
+            unknown = fields - {f.name for f in dataclasses.fields(cls)}
+            if unknown:
+                raise ValueError(
+                    f"Unknown fields for {cls.__name__}: {sorted(unknown)}"
+                )
+            table = _path_table(f for f in cls.field_map() if f.name in fields)
+            return projections.setdefault(fields, partial(_build, cls, table))
+
+
+class PathNode(NamedTuple):
+    """
+    A key of the response which needs more than a plain read: the fields built
+    from its value, and the path table of the keys below it.
+    """
+
+    fields: tuple[tuple[str, Callable[[Any], Any] | None], ...]
+    children: PathTable
+
+
+class PathTable(NamedTuple):
+    """
+    The keys read from one level of a response. Keys holding a single field,
+    without a parser or keys below them, are `leaves` mapping to that field; the
+    others are `nodes`. `aliases` maps snake_case keys to the camelCase key they
+    are read in place of.
+    """
+
+    leaves: dict[str, str]
+    nodes: dict[str, PathNode]
+    aliases: dict[str, str]
+
+
+def _path_table(field_sources: Iterable[FieldSource]) -> PathTable:
+    """
+    Arranges field sources into a tree of PathTables. Fields sharing a path
+    prefix are nested under a single node for that prefix, so every key of the
+    response is read at most once.
+    """
+    tree = dict()
+    for field_source in field_sources:
+        node = tree
+        for key in field_source.path:
+            node = node.setdefault(key, dict())
+        node.setdefault(None, []).append((field_source.name, field_source.parser))
+
+    def freeze(node: dict) -> PathTable:
+        table = PathTable(dict(), dict(), dict())
+        for key, child in node.items():
+            if key is None:
+                continue
+            fields = child.get(None, [])
+            if len(child) == 1 and len(fields) == 1 and fields[0][1] is None:
+                table.leaves[key] = fields[0][0]
+            else:
+                table.nodes[key] = PathNode(tuple(fields), freeze(child))
+            snake_key = camel_to_snake_case(key)
+            if snake_key != key:
+                table.aliases[snake_key] = key
+        return table
+
+    return freeze(tree)
+
+
+def _build(cls: type[Model], table: PathTable, data: dict) -> Model:
+    return cls(**_read_paths(table, data, dict()))
+
+
+def _read_paths(table: PathTable, data: dict, kwargs: dict) -> dict:
+    """
+    Reads the fields of a path table from the response into `kwargs`, walking
+    the keys of the response once. A key is read in camelCase first and in
+    snake_case second, which keeps responses that were already converted (e.g.
+    by `convert_keys_to_snake_case`) working.
+    """
+    leaves, nodes, aliases = table
+    for key, value in data.items():
+        name = leaves.get(key)
+        if name is not None:
+            if value is not None:
+                kwargs[name] = (
+                    convert_keys_to_snake_case(value)
+                    if isinstance(value, dict)
+                    else value
+                )
+            continue
+        node = nodes.get(key)
+        if node is not None:
+            if value is None:
+                continue
+            fields, children = node
+            for name, parser in fields:
+                if parser is not None:
+                    kwargs[name] = parser(value)
+                elif isinstance(value, dict):
+                    kwargs[name] = convert_keys_to_snake_case(value)
+                else:
+                    kwargs[name] = value
+            if isinstance(value, dict):
+                _read_paths(children, value, kwargs)
+        elif key in aliases and value is not None:
+            # only fills the fields its camelCase key left unset
+            camel_key = aliases[key]
+            found = _read_paths(table, {camel_key: value}, dict())
+            for name, value in found.items():
+                kwargs.setdefault(name, value)
+    return kwargs
+
+
+class LazyField:
+    """
+    Non-data descriptor which builds a single field from the raw response the
+    first time it is read. The result is stored on the instance, where it shadows
+    the descriptor, so every later read is a plain attribute lookup.
+    """
+
+    def __init__(self, field_source: FieldSource) -> None:
+        self.name, self.path, self.parser = field_source
+
+    def __get__(self, instance: Model, owner: type = None):
+        if instance is None:
+            return self
+        value = instance.__dict__.get("_response")
+        for key in self.path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            item = value.get(key)
+            value = value.get(camel_to_snake_case(key)) if item is None else item
+        if value is not None:
+            if self.parser is not None:
+                value = self.parser(value)
+            elif isinstance(value, dict):
+                value = convert_keys_to_snake_case(value)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def lazy(cls: type[Model]) -> type[Model]:
+    """
+    Class decorator turning a subclass of a (non-slotted) model into its lazy
+    variant: `from_response` only keeps a reference to the raw response, and
+    every field is built on first access through a `LazyField`. Instances created
+    through `__init__` behave exactly like the eager model.
+
+    :param cls: subclass of the model we want a lazy variant of
+    :return: the same class, with a LazyField for every field
+    """
+    for field_source in cls.field_map():
+        setattr(cls, field_source.name, LazyField(field_source))
+
+    def from_response(lazy_cls, data: dict):
+        """
+        Keeps a reference to the raw response, deferring the parsing of every
+        field until it is first accessed.
+
+        :param data: dictionary containing all the data (e.g. the response data)
+        :return: an instance of the model
+        """
+        instance = lazy_cls.__new__(lazy_cls)
+        instance.__dict__["_response"] = data
+        return instance
+
+    cls.from_response = classmethod(from_response)
+    return cls
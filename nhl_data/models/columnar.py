@@ -0,0 +1,253 @@
+"""
+Columnar (struct-of-arrays) representation of play-by-play data.
+
+Requires the optional `numpy` dependency (`poetry install -E columnar`).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from nhl_data.models.game import Play
+
+NUMERIC_COLUMNS = {
+    "game_pk": "int64",
+    "period": "int16",
+    "period_seconds": "int32",
+    "x": "float64",
+    "y": "float64",
+    "goals_away": "int16",
+    "goals_home": "int16",
+    "team_id": "int32",
+}
+"""Numeric columns and their dtypes. Missing integers are -1, missing floats NaN."""
+
+CATEGORICAL_COLUMNS = ("event_type_id", "strength_name", "secondary_type")
+"""Dictionary-encoded columns. Missing values have the code -1."""
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "PlaysFrame requires numpy, install it with `poetry install -E columnar`"
+        )
+
+
+def _period_seconds(period_time: str | None) -> int:
+    if not period_time:
+        return -1
+    minutes, _, seconds = period_time.partition(":")
+    return int(minutes) * 60 + int(seconds)
+
+
+class _Encoder:
+    """Assigns dictionary codes to categorical values in order of appearance."""
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = dict()
+
+    def encode(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    @property
+    def categories(self) -> list[str]:
+        return list(self.codes)
+
+
+class _Builder:
+    """Accumulates rows in Python lists before turning them into arrays once."""
+
+    def __init__(self) -> None:
+        self.columns = {name: [] for name in (*NUMERIC_COLUMNS, *CATEGORICAL_COLUMNS)}
+        self.encoders = {name: _Encoder() for name in CATEGORICAL_COLUMNS}
+
+    def append(self, row: dict) -> None:
+        for name in NUMERIC_COLUMNS:
+            self.columns[name].append(row[name])
+        for name in CATEGORICAL_COLUMNS:
+            self.columns[name].append(self.encoders[name].encode(row[name]))
+
+    def build(self) -> PlaysFrame:
+        _require_numpy()
+        arrays = {
+            name: np.array(self.columns[name], dtype=dtype)
+            for name, dtype in NUMERIC_COLUMNS.items()
+        }
+        for name in CATEGORICAL_COLUMNS:
+            arrays[name] = np.array(self.columns[name], dtype="int32")
+        categories = {name: e.categories for name, e in self.encoders.items()}
+        return PlaysFrame(arrays, categories)
+
+
+def _missing(value, default=-1):
+    return default if value is None else value
+
+
+@dataclass(frozen=True, eq=False)
+class PlaysFrame:
+    """
+    Play-by-play data of one or more games, stored as one NumPy array per column.
+
+    Numeric fields are stored in `arrays` with the dtypes in `NUMERIC_COLUMNS`.
+    `event_type_id`, `strength_name` and `secondary_type` are dictionary encoded:
+    their arrays hold integer codes indexing into `categories[column]`.
+    """
+
+    arrays: dict[str, np.ndarray]
+    categories: dict[str, list[str]]
+
+    def __len__(self) -> int:
+        return len(self.arrays["game_pk"])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.arrays[column]
+
+    @classmethod
+    def from_response(cls, feed: dict) -> PlaysFrame:
+        """
+        Builds the frame straight from a `/game/{id}/feed/live` response, without
+        building any Play models.
+
+        :param feed: the decoded live feed
+        :return: the plays of the game in columnar form
+        """
+        builder = _Builder()
+        game_pk = feed.get("gameData", dict()).get("game", dict()).get("pk")
+        plays = feed.get("liveData", dict()).get("plays", dict())
+        for play in plays.get("allPlays", []):
+            result = play.get("result", dict())
+            about = play.get("about", dict())
+            goals = about.get("goals", dict())
+            coordinates = play.get("coordinates", dict())
+            builder.append(
+                {
+                    "game_pk": _missing(game_pk),
+                    "period": _missing(about.get("period")),
+                    "period_seconds": _period_seconds(about.get("periodTime")),
+                    "x": _missing(coordinates.get("x"), math.nan),
+                    "y": _missing(coordinates.get("y"), math.nan),
+                    "goals_away": _missing(goals.get("away")),
+                    "goals_home": _missing(goals.get("home")),
+                    "team_id": _missing(play.get("team", dict()).get("id")),
+                    "event_type_id": result.get("eventTypeId"),
+                    "strength_name": result.get("strength", dict()).get("name"),
+                    "secondary_type": result.get("secondaryType"),
+                }
+            )
+        return builder.build()
+
+    @classmethod
+    def from_plays(cls, plays: Iterable[Play], game_pk: int = None) -> PlaysFrame:
+        """
+        Builds the frame from already parsed Play models.
+
+        :param plays: the plays we want to store
+        :param game_pk: the game the plays belong to, defaults to None
+        :return: the plays in columnar form
+        """
+        builder = _Builder()
+        for play in plays:
+            coordinates = play.coordinates or dict()
+            builder.append(
+                {
+                    "game_pk": _missing(game_pk),
+                    "period": _missing(play.period),
+                    "period_seconds": _period_seconds(play.period_time),
+                    "x": _missing(coordinates.get("x"), math.nan),
+                    "y": _missing(coordinates.get("y"), math.nan),
+                    "goals_away": _missing(play.goals_away),
+                    "goals_home": _missing(play.goals_home),
+                    "team_id": _missing(play.team.id if play.team else None),
+                    "event_type_id": play.event_type_id,
+                    "strength_name": play.strength_name,
+                    "secondary_type": play.secondary_type,
+                }
+            )
+        return builder.build()
+
+    @classmethod
+    def concat(cls, frames: Iterable[PlaysFrame]) -> PlaysFrame:
+        """
+        Concatenates frames (e.g. one per game) into a single frame. Categorical
+        codes are remapped onto the union of every frame's categories.
+
+        :param frames: the frames we want to concatenate
+        :return: a frame containing the rows of every frame, in order
+        """
+        _require_numpy()
+        frames = list(frames)
+        if not frames:
+            return _Builder().build()
+        arrays = {
+            name: np.concatenate([f.arrays[name] for f in frames])
+            for name in NUMERIC_COLUMNS
+        }
+        categories = dict()
+        for name in CATEGORICAL_COLUMNS:
+            encoder = _Encoder()
+            remapped = []
+            for frame in frames:
+                # the trailing -1 maps missing values (code -1) onto themselves
+                lookup = np.array(
+                    [encoder.encode(c) for c in frame.categories[name]] + [-1],
+                    dtype="int32",
+                )
+                remapped.append(lookup[frame.arrays[name]])
+            arrays[name] = np.concatenate(remapped)
+            categories[name] = encoder.categories
+        return cls(arrays, categories)
+
+    def code(self, column: str, value: str) -> int:
+        """
+        :param column: one of the categorical columns
+        :param value: the category we want the code for
+        :return: the code of the category, -1 if it does not occur in the frame
+        """
+        try:
+            return self.categories[column].index(value)
+        except ValueError:
+            return -1
+
+    def equals(self, column: str, value: str) -> np.ndarray:
+        """
+        Vectorized comparison of a categorical column against a value, e.g.
+        `frame.equals("event_type_id", "GOAL")`.
+
+        :param column: one of the categorical columns
+        :param value: the category we want to compare against
+        :return: boolean mask with one entry per row
+        """
+        code = self.code(column, value)
+        if code == -1:
+            return np.zeros(len(self), dtype=bool)
+        return self.arrays[column] == code
+
+    def decode(self, column: str) -> np.ndarray:
+        """
+        :param column: one of the categorical columns
+        :return: object array of the column's values, None where missing
+        """
+        values = np.array([*self.categories[column], None], dtype=object)
+        return values[self.arrays[column]]
+
+    def select(self, mask: np.ndarray) -> PlaysFrame:
+        """
+        :param mask: boolean mask (or index array) of the rows we want to keep
+        :return: a frame containing only the selected rows
+        """
+        return PlaysFrame(
+            {name: array[mask] for name, array in self.arrays.items()},
+            self.categories,
+        )
@@ -1,138 +1,41 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from nhl_data.models.base import Model
+from nhl_data.models.base import Model, lazy, source
 from nhl_data.models.team import Team
-from nhl_data.models.utils import convert_keys_to_snake_case
 
+if TYPE_CHECKING:  # pragma: no cover
+    from nhl_data.models.columnar import PlaysFrame
 
-@dataclass
-class Game(Model):
-    """
-    Represents and contains all data for a given game, returned from the NHL API.
-    """
-
-    pk: int = None
-    season: str = None
-    type: str = None
-    date_time: str = None
-    end_date_time: str = None
-    abstract_game_state: str = None
-    coded_game_state: str = None
-    detailed_state: str = None
-    status_code: str = None
-    away_team: Team = None
-    home_team: Team = None
-    players: dict = None
-    venue: dict = None
-    all_plays: list[Play] = None
-    scoring_plays: list = None
-    penalty_plays: list = None
-    plays_by_period: list = None
-    current_play: Play = None
-    boxscore: Boxscore = None
-    decisions: dict = None
-
-    @classmethod
-    def from_response(cls, request_data: dict):
-        data = convert_keys_to_snake_case(request_data)
-        game_data = data.get("game_data", dict())
-        live_data = data.get("live_data", dict())
-        plays_data = live_data.get("plays", dict())
-        all_plays = (
-            [Play.from_response(d) for d in plays_data.get("all_plays", [])]
-            if "all_plays" in plays_data
-            else None
-        )
-        return cls(
-            pk=game_data.get("game", dict()).get("pk"),
-            season=game_data.get("game", dict()).get("season"),
-            type=game_data.get("game", dict()).get("game_type"),
-            date_time=game_data.get("date_time", dict()).get("date_time"),
-            end_date_time=game_data.get("date_time", dict()).get("end_date_time"),
-            abstract_game_state=game_data.get("status", dict()).get(
-                "abstract_game_state"
-            ),
-            coded_game_state=game_data.get("status", dict()).get("coded_game_state"),
-            detailed_state=game_data.get("status", dict()).get("detailed_state"),
-            status_code=game_data.get("status", dict()).get("status_code"),
-            away_team=Team.from_response(game_data.get("teams", dict()).get("away"))
-            if "away" in game_data.get("teams", dict())
-            else None,
-            home_team=Team.from_response(game_data.get("teams", dict()).get("home"))
-            if "home" in game_data.get("teams", dict())
-            else None,
-            players=game_data.get("players"),
-            venue=game_data.get("venue"),
-            all_plays=all_plays,
-            scoring_plays=plays_data.get("scoring_plays"),
-            penalty_plays=plays_data.get("penalty_plays"),
-            plays_by_period=plays_data.get("plays_by_period"),
-            current_play=Play.from_response(plays_data["current_play"])
-            if "current_play" in plays_data
-            else None,
-            boxscore=Boxscore.from_response(live_data["boxscore"])
-            if "boxscore" in live_data
-            else None,
-            decisions=live_data.get("decisions"),
-        )
 
-
-@dataclass
+@dataclass(slots=True)
 class Play(Model):
     """
     Represents and contains all data for a single play from an NHL game.
     """
 
     players: list = None
-    event: str = None
-    event_type_id: str = None
-    description: str = None
-    secondary_type: str = None
-    strength_name: str = None
-    game_winning_goal: bool = None
-    empty_net: bool = None
-    penalty_severity: str = None
-    penalty_minutes: str = None
-    period: int = None
-    period_type: str = None
-    ordinal_num: str = None
-    period_time: str = None
-    period_time_remaining: str = None
-    date_time: str = None
-    goals_away: int = None
-    goals_home: int = None
+    event: str = source("result", "event")
+    event_type_id: str = source("result", "eventTypeId")
+    description: str = source("result", "description")
+    secondary_type: str = source("result", "secondaryType")
+    strength_name: str = source("result", "strength", "name")
+    game_winning_goal: bool = source("result", "gameWinningGoal")
+    empty_net: bool = source("result", "emptyNet")
+    penalty_severity: str = source("result", "penaltySeverity")
+    penalty_minutes: str = source("result", "penaltyMinutes")
+    period: int = source("about", "period")
+    period_type: str = source("about", "periodType")
+    ordinal_num: str = source("about", "ordinalNum")
+    period_time: str = source("about", "periodTime")
+    period_time_remaining: str = source("about", "periodTimeRemaining")
+    date_time: str = source("about", "dateTime")
+    goals_away: int = source("about", "goals", "away")
+    goals_home: int = source("about", "goals", "home")
     coordinates: dict = None
-    team: Team = None
-
-    @classmethod
-    def from_response(cls, request_data: dict):
-        data = convert_keys_to_snake_case(request_data)
-        result_data = data.get("result", dict())
-        about_data = data.get("about", dict())
-        return cls(
-            players=data.get("players"),
-            event=result_data.get("event"),
-            event_type_id=result_data.get("event_type_id"),
-            description=result_data.get("description"),
-            secondary_type=result_data.get("secondary_type"),
-            strength_name=result_data.get("strength", dict()).get("name"),
-            game_winning_goal=result_data.get("game_winning_goal"),
-            empty_net=result_data.get("empty_net"),
-            penalty_severity=result_data.get("penalty_severity"),
-            penalty_minutes=result_data.get("penalty_minutes"),
-            period=about_data.get("period"),
-            period_type=about_data.get("period_type"),
-            ordinal_num=about_data.get("ordinal_num"),
-            period_time=about_data.get("period_time"),
-            period_time_remaining=about_data.get("period_time_remaining"),
-            date_time=about_data.get("date_time"),
-            goals_away=about_data.get("goals", dict()).get("away"),
-            goals_home=about_data.get("goals", dict()).get("home"),
-            coordinates=data.get("coordinates"),
-            team=Team.from_response(data["team"]) if "team" in data else None,
-        )
+    team: Team = source("team", parser=Team.from_response)
 
 
 @dataclass
@@ -141,49 +44,74 @@ class Boxscore(Model):
     Represents and contains boxscore data for a given game, returned from the NHL API.
     """
 
-    away_team: Team = None
-    away_team_stats: dict = None
-    away_players: dict = None
-    away_goalies: list = None
-    away_skaters: list = None
-    away_on_ice: list = None
-    away_scratches: list = None
-    away_penalty_box: list = None
-    away_coaches: list = None
-    home_team: Team = None
-    home_team_stats: dict = None
-    home_players: dict = None
-    home_goalies: list = None
-    home_skaters: list = None
-    home_on_ice: list = None
-    home_scratches: list = None
-    home_penalty_box: list = None
-    home_coaches: list = None
+    away_team: Team = source("teams", "away", "team", parser=Team.from_response)
+    away_team_stats: dict = source("teams", "away", "teamStats", "teamSkaterStats")
+    away_players: dict = source("teams", "away", "players")
+    away_goalies: list = source("teams", "away", "goalies")
+    away_skaters: list = source("teams", "away", "skaters")
+    away_on_ice: list = source("teams", "away", "onIcePlus")
+    away_scratches: list = source("teams", "away", "scratches")
+    away_penalty_box: list = source("teams", "away", "penaltyBox")
+    away_coaches: list = source("teams", "away", "coaches")
+    home_team: Team = source("teams", "home", "team", parser=Team.from_response)
+    home_team_stats: dict = source("teams", "home", "teamStats", "teamSkaterStats")
+    home_players: dict = source("teams", "home", "players")
+    home_goalies: list = source("teams", "home", "goalies")
+    home_skaters: list = source("teams", "home", "skaters")
+    home_on_ice: list = source("teams", "home", "onIcePlus")
+    home_scratches: list = source("teams", "home", "scratches")
+    home_penalty_box: list = source("teams", "home", "penaltyBox")
+    home_coaches: list = source("teams", "home", "coaches")
     officials: list = None
 
-    @classmethod
-    def from_response(cls, request_data: dict):
-        data = convert_keys_to_snake_case(request_data)
-        away = data.get("teams", dict()).get("away", dict())
-        home = data.get("teams", dict()).get("home", dict())
-        return cls(
-            away_team=Team.from_response(away.get("team")) if "team" in away else None,
-            away_team_stats=away.get("team_stats", dict()).get("team_skater_stats"),
-            away_players=away.get("players"),
-            away_goalies=away.get("goalies"),
-            away_skaters=away.get("skaters"),
-            away_on_ice=away.get("on_ice_plus"),
-            away_scratches=away.get("scratches"),
-            away_penalty_box=away.get("penalty_box"),
-            away_coaches=away.get("coaches"),
-            home_team=Team.from_response(home.get("team")) if "team" in home else None,
-            home_team_stats=home.get("team_stats", dict()).get("team_skater_stats"),
-            home_players=home.get("players"),
-            home_goalies=home.get("goalies"),
-            home_skaters=home.get("skaters"),
-            home_on_ice=home.get("on_ice_plus"),
-            home_scratches=home.get("scratches"),
-            home_penalty_box=home.get("penalty_box"),
-            home_coaches=home.get("coaches"),
-            officials=data.get("officials"),
-        )
+
+@dataclass
+class Game(Model):
+    """
+    Represents and contains all data for a given game, returned from the NHL API.
+    """
+
+    pk: int = source("gameData", "game", "pk")
+    season: str = source("gameData", "game", "season")
+    type: str = source("gameData", "game", "gameType")
+    date_time: str = source("gameData", "dateTime", "dateTime")
+    end_date_time: str = source("gameData", "dateTime", "endDateTime")
+    abstract_game_state: str = source("gameData", "status", "abstractGameState")
+    coded_game_state: str = source("gameData", "status", "codedGameState")
+    detailed_state: str = source("gameData", "status", "detailedState")
+    status_code: str = source("gameData", "status", "statusCode")
+    away_team: Team = source("gameData", "teams", "away", parser=Team.from_response)
+    home_team: Team = source("gameData", "teams", "home", parser=Team.from_response)
+    players: dict = source("gameData", "players")
+    venue: dict = source("gameData", "venue")
+    all_plays: list[Play] = source(
+        "liveData", "plays", "allPlays", parser=Play.from_response_list
+    )
+    scoring_plays: list = source("liveData", "plays", "scoringPlays")
+    penalty_plays: list = source("liveData", "plays", "penaltyPlays")
+    plays_by_period: list = source("liveData", "plays", "playsByPeriod")
+    current_play: Play = source(
+        "liveData", "plays", "currentPlay", parser=Play.from_response
+    )
+    boxscore: Boxscore = source("liveData", "boxscore", parser=Boxscore.from_response)
+    decisions: dict = source("liveData", "decisions")
+
+    def plays_frame(self) -> PlaysFrame:
+        """
+        Returns the plays of the game in columnar form, backed by NumPy arrays.
+        Requires the optional `numpy` dependency.
+
+        :return: PlaysFrame holding every play of `all_plays`
+        """
+        from nhl_data.models.columnar import PlaysFrame
+
+        return PlaysFrame.from_plays(self.all_plays or [], game_pk=self.pk)
+
+
+@lazy
+class LazyGame(Game):
+    """
+    Game which keeps the raw live feed and only builds a field (e.g. `all_plays`,
+    `boxscore` or the teams) the first time it is accessed, memoizing the result.
+    Use it when only a few fields of a large feed are needed, e.g. the status.
+    """
@@ -0,0 +1,285 @@
+"""
+In-memory indexes over the games of a season, answering lookups by team, person,
+event type, period and date without scanning every play.
+"""
+
+from __future__ import annotations
+
+import datetime
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from nhl_data.models.game import Game, Play
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+from nhl_data.models.utils import parse_datetime
+
+
+class PlayRef(NamedTuple):
+    """A play together with the game it belongs to and its index in `all_plays`."""
+
+    game_pk: int
+    index: int
+    play: Play
+
+
+def _as_datetime(value: datetime.date | datetime.datetime) -> datetime.datetime:
+    """Dates are taken as midnight UTC, naive datetimes as UTC."""
+    if not isinstance(value, datetime.datetime):
+        return datetime.datetime(
+            value.year, value.month, value.day, tzinfo=datetime.timezone.utc
+        )
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _person_ids(play: Play) -> set[int]:
+    return {
+        player["player"]["id"] for player in play.players or () if player.get("player")
+    }
+
+
+def _keys(event_type_id: str | None, values: list[tuple]) -> list[tuple]:
+    """The index keys of a play (or query) with the given values."""
+    if event_type_id is None:
+        return values
+    keys = [("event_type", event_type_id)]
+    keys.extend([("event_type", event_type_id, *value) for value in values])
+    keys.extend(values)
+    return keys
+
+
+def _play_keys(play: Play) -> list[tuple]:
+    values = [("person", person_id) for person_id in _person_ids(play)]
+    if play.team is not None and play.team.id is not None:
+        values.append(("team", play.team.id))
+    if play.period is not None:
+        values.append(("period", play.period))
+    return _keys(play.event_type_id, values)
+
+
+def _involves(play: Play, person_id: int, player_type: str = None) -> bool:
+    for player in play.players or ():
+        if (player.get("player") or {}).get("id") == person_id and (
+            player_type is None or player.get("playerType") == player_type
+        ):
+            return True
+    return False
+
+
+class SeasonIndex:
+    """
+    Indexes the Games (and ScheduleGames) of a season once, so that lookups such
+    as "every goal of a player", "the games of a team in March" or "every
+    penalty of the third period" no longer scan every play of every game.
+
+    Plays are kept in hash indexes by person id (every player listed on the play),
+    team id, `event_type_id` and period, and by `event_type_id` combined with
+    each of the others; a query starts from the smallest index matching its
+    filters and only checks the remaining filters on those plays.
+    Games are kept in a hash index by team id and in a list sorted by start time,
+    which is searched with `bisect` for date ranges.
+
+    Start times are in UTC, as returned by the API. Adding a game whose `pk` is
+    already indexed replaces it, e.g. after polling a live feed again.
+    """
+
+    def __init__(
+        self,
+        games: Iterable[Game] = (),
+        schedule: Iterable[ScheduleDate | ScheduleGame] = (),
+    ) -> None:
+        """
+        :param games: the games, including their plays, to index
+        :param schedule: scheduled games, or whole schedule dates, to index;
+            only their teams and start times are indexed
+        """
+        self.games: dict[int, Game] = dict()
+        self.schedule_games: dict[int, ScheduleGame] = dict()
+        self._games_by_team: dict[int, set[int]] = defaultdict(set)
+        self._start_times: dict[int, datetime.datetime] = dict()
+        self._sorted_times: list[datetime.datetime] = []
+        self._sorted_pks: list[int] = []
+        self._dirty = False
+        # refs are keyed by (game pk, index) so a game's plays can be dropped
+        # without scanning the refs of other games, while keeping insertion order
+        self._plays: dict[tuple, dict[tuple[int, int], PlayRef]] = defaultdict(dict)
+        self._game_keys: dict[int, list[tuple[int, tuple]]] = dict()
+        for game in schedule:
+            self.add_schedule(game)
+        for game in games:
+            self.add_game(game)
+
+    def add_schedule(self, schedule: ScheduleDate | ScheduleGame) -> None:
+        """:param schedule: a scheduled game, or every game of a schedule date"""
+        if isinstance(schedule, ScheduleDate):
+            for game in schedule.games or ():
+                self.add_schedule(game)
+            return
+        if schedule.game_pk is None:
+            return
+        self.schedule_games[schedule.game_pk] = schedule
+        self._index_game(
+            schedule.game_pk,
+            schedule.game_date,
+            (schedule.away_team, schedule.home_team),
+        )
+
+    def add_game(self, game: Game) -> None:
+        """:param game: a game, whose plays are indexed as well"""
+        if game.pk is None:
+            return
+        if game.pk in self.games:
+            self._remove_game(self.games[game.pk])
+        self.games[game.pk] = game
+        start_time = parse_datetime(game.date_time) if game.date_time else None
+        self._index_game(game.pk, start_time, (game.away_team, game.home_team))
+        plays = self._plays
+        game_keys = self._game_keys[game.pk] = []
+        for index, play in enumerate(game.all_plays or ()):
+            ref = PlayRef(game.pk, index, play)
+            for key in _play_keys(play):
+                plays[key][game.pk, index] = ref
+                game_keys.append((index, key))
+
+    def game_pks(
+        self,
+        team_id: int = None,
+        start: datetime.date | datetime.datetime = None,
+        end: datetime.date | datetime.datetime = None,
+    ) -> list[int]:
+        """
+        Looks up games by team and start time, e.g. the games of a team in March
+        with `start=date(2023, 3, 1), end=date(2023, 4, 1)`.
+
+        :param team_id: only games played by this team, defaults to every team
+        :param start: only games starting at or after this time (dates are taken
+            as midnight UTC), defaults to no lower bound
+        :param end: only games starting before this time, defaults to no upper bound
+        :return: the pks of the matching games, ordered by start time; games
+            without a known start time come last, and only without a range
+        """
+        if self._dirty:
+            pairs = sorted((time, pk) for pk, time in self._start_times.items())
+            self._sorted_times = [time for time, _ in pairs]
+            self._sorted_pks = [pk for _, pk in pairs]
+            self._dirty = False
+        low, high = 0, len(self._sorted_pks)
+        if start is not None:
+            low = bisect_left(self._sorted_times, _as_datetime(start))
+        if end is not None:
+            high = bisect_left(self._sorted_times, _as_datetime(end))
+        pks = self._sorted_pks[low:high]
+        if start is None and end is None:
+            known = set(self._start_times)
+            pks += [pk for pk in self._all_pks() if pk not in known]
+        if team_id is not None:
+            team_pks = self._games_by_team.get(team_id, ())
+            pks = [pk for pk in pks if pk in team_pks]
+        return pks
+
+    def plays(
+        self,
+        person_id: int = None,
+        team_id: int = None,
+        event_type_id: str = None,
+        period: int = None,
+        player_type: str = None,
+        game_pks: Iterable[int] = None,
+    ) -> list[PlayRef]:
+        """
+        Looks up plays matching every given filter, e.g. every goal scored by a
+        player with `person_id=..., event_type_id="GOAL", player_type="Scorer"`.
+
+        :param person_id: only plays involving this person, defaults to anyone
+        :param team_id: only plays of this team, defaults to every team
+        :param event_type_id: only plays of this event type (e.g. `GOAL`),
+            defaults to every event type
+        :param period: only plays of this period, defaults to every period
+        :param player_type: only plays where `person_id` has this role (e.g.
+            `Scorer`, `Assist`), requires `person_id`, defaults to any role
+        :param game_pks: only plays of these games (e.g. from `game_pks`),
+            defaults to every game
+        :return: the matching plays, in the order they were indexed
+        """
+        if player_type is not None and person_id is None:
+            raise ValueError("player_type can only be used together with person_id")
+        values = [
+            (name, value)
+            for name, value in (
+                ("person", person_id),
+                ("team", team_id),
+                ("period", period),
+            )
+            if value is not None
+        ]
+        keys = _keys(event_type_id, values)
+        key = min(keys, key=lambda k: len(self._plays.get(k, ()))) if keys else ()
+        candidates = self._plays.get(key, {}).values() if keys else None
+        games = set(game_pks) if game_pks is not None else None
+        selected = self.games.values()
+        if games is not None:
+            selected = [game for pk, game in self.games.items() if pk in games]
+            count = sum(len(game.all_plays or ()) for game in selected)
+            if candidates is None or count < len(candidates):
+                # the plays of the selected games are fewer than the index's
+                candidates, key, games = None, (), None
+        if candidates is None:
+            candidates = [
+                PlayRef(game.pk, index, play)
+                for game in selected
+                for index, play in enumerate(game.all_plays or ())
+            ]
+        filters = len(values) + (event_type_id is not None)
+        covered = len(key) // 2  # every key is made of (name, value) pairs
+        if covered == filters and player_type is None and games is None:
+            return list(candidates)
+        return [
+            ref
+            for ref in candidates
+            if (games is None or ref.game_pk in games)
+            and (team_id is None or (ref.play.team and ref.play.team.id == team_id))
+            and (event_type_id is None or ref.play.event_type_id == event_type_id)
+            and (period is None or ref.play.period == period)
+            and (person_id is None or _involves(ref.play, person_id, player_type))
+        ]
+
+    def _index_game(
+        self, pk: int, start_time: datetime.datetime | None, teams: Iterable
+    ) -> None:
+        for team in teams:
+            if team is not None and team.id is not None:
+                self._games_by_team[team.id].add(pk)
+        if start_time is None:
+            return
+        start_time = _as_datetime(start_time)
+        if self._start_times.get(pk) != start_time:
+            self._start_times[pk] = start_time
+            self._dirty = True
+
+    def _all_pks(self) -> list[int]:
+        return list(dict.fromkeys([*self.schedule_games, *self.games]))
+
+    def _remove_game(self, game: Game) -> None:
+        """Drops the teams, start time and plays of an indexed game."""
+        for team in (game.away_team, game.home_team):
+            if team is not None and team.id is not None:
+                self._games_by_team[team.id].discard(game.pk)
+        if self._start_times.pop(game.pk, None) is not None:
+            self._dirty = True
+        schedule = self.schedule_games.get(game.pk)
+        if schedule is not None:
+            self._index_game(
+                game.pk, schedule.game_date, (schedule.away_team, schedule.home_team)
+            )
+        self._remove_plays(game)
+
+    def _remove_plays(self, game: Game) -> None:
+        """Drops the refs of a game's plays, using the keys recorded by `add_game`."""
+        for index, key in self._game_keys.pop(game.pk, ()):
+            refs = self._plays[key]
+            del refs[game.pk, index]
+            if not refs:
+                del self._plays[key]
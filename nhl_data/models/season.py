@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 
 from nhl_data.models.base import Model
-from nhl_data.models.utils import convert_keys_to_snake_case
 
 
 @dataclass
@@ -21,19 +20,3 @@ class Season(Model):
     conferences_in_use: bool = None
     divisions_in_use: bool = None
     wild_card_in_use: bool = None
-
-    @classmethod
-    def from_response(cls, response_data: dict):
-        data = convert_keys_to_snake_case(response_data)
-        return cls(
-            season_id=data.get("season_id"),
-            regular_season_start_date=data.get("regular_season_start_date"),
-            regular_season_end_date=data.get("regular_season_end_date"),
-            season_end_date=data.get("season_end_date"),
-            number_of_games=data.get("number_of_games"),
-            ties_in_use=data.get("ties_in_use"),
-            olympics_participation=data.get("olympics_participation"),
-            conferences_in_use=data.get("conferences_in_use"),
-            divisions_in_use=data.get("divisions_in_use"),
-            wild_card_in_use=data.get("wild_card_in_use"),
-        )
@@ -0,0 +1,359 @@
+"""
+Typed decoding of the largest payloads (live feed, boxscore and schedule) with
+`msgspec`, straight from the raw response bytes into compact structs.
+
+The structs mirror the camelCase layout of the responses, so no intermediate
+dictionaries are built and no keys have to be converted or looked up one by one.
+`to_model()` turns each struct into the matching public model.
+
+Requires the optional `msgspec` dependency (`poetry install -E msgspec`).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import msgspec
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "Typed decoding requires msgspec, install it with `poetry install -E msgspec`"
+    ) from error
+
+from nhl_data.models.game import Boxscore, Game, Play
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+from nhl_data.models.team import Team
+from nhl_data.models.utils import convert_keys_to_snake_case, parse_date, parse_datetime
+
+
+def _team(data: dict | None) -> Team | None:
+    return Team.from_response(data) if data is not None else None
+
+
+def _snake(data: dict | None) -> dict | None:
+    return convert_keys_to_snake_case(data) if data is not None else None
+
+
+class _Struct(msgspec.Struct, rename="camel", gc=False):
+    """
+    Base of every struct. Decoded payloads never contain reference cycles, so
+    the structs are not tracked by the garbage collector.
+    """
+
+
+class Strength(_Struct):
+    name: str | None = None
+
+
+class Result(_Struct):
+    event: str | None = None
+    event_type_id: str | None = None
+    description: str | None = None
+    secondary_type: str | None = None
+    strength: Strength | None = None
+    game_winning_goal: bool | None = None
+    empty_net: bool | None = None
+    penalty_severity: str | None = None
+    penalty_minutes: int | str | None = None
+
+
+class Goals(_Struct):
+    away: int | None = None
+    home: int | None = None
+
+
+class About(_Struct):
+    period: int | None = None
+    period_type: str | None = None
+    ordinal_num: str | None = None
+    period_time: str | None = None
+    period_time_remaining: str | None = None
+    date_time: str | None = None
+    goals: Goals | None = None
+
+
+class PlayStruct(_Struct):
+    players: list | None = None
+    result: Result | None = None
+    about: About | None = None
+    coordinates: dict | None = None
+    team: dict | None = None
+
+    def to_model(self) -> Play:
+        result = self.result or Result()
+        about = self.about or About()
+        goals = about.goals or Goals()
+        return Play(
+            players=self.players,
+            event=result.event,
+            event_type_id=result.event_type_id,
+            description=result.description,
+            secondary_type=result.secondary_type,
+            strength_name=result.strength.name if result.strength else None,
+            game_winning_goal=result.game_winning_goal,
+            empty_net=result.empty_net,
+            penalty_severity=result.penalty_severity,
+            penalty_minutes=result.penalty_minutes,
+            period=about.period,
+            period_type=about.period_type,
+            ordinal_num=about.ordinal_num,
+            period_time=about.period_time,
+            period_time_remaining=about.period_time_remaining,
+            date_time=about.date_time,
+            goals_away=goals.away,
+            goals_home=goals.home,
+            coordinates=_snake(self.coordinates),
+            team=_team(self.team),
+        )
+
+
+class TeamStats(_Struct):
+    team_skater_stats: dict | None = None
+
+
+class BoxscoreTeam(_Struct):
+    team: dict | None = None
+    team_stats: TeamStats | None = None
+    players: dict | None = None
+    goalies: list | None = None
+    skaters: list | None = None
+    on_ice_plus: list | None = None
+    scratches: list | None = None
+    penalty_box: list | None = None
+    coaches: list | None = None
+
+
+class BoxscoreTeams(_Struct):
+    away: BoxscoreTeam | None = None
+    home: BoxscoreTeam | None = None
+
+
+class BoxscoreStruct(_Struct):
+    teams: BoxscoreTeams | None = None
+    officials: list | None = None
+
+    def to_model(self) -> Boxscore:
+        teams = self.teams or BoxscoreTeams()
+        away = teams.away or BoxscoreTeam()
+        home = teams.home or BoxscoreTeam()
+        return Boxscore(
+            away_team=_team(away.team),
+            away_team_stats=_snake(
+                away.team_stats.team_skater_stats if away.team_stats else None
+            ),
+            away_players=_snake(away.players),
+            away_goalies=away.goalies,
+            away_skaters=away.skaters,
+            away_on_ice=away.on_ice_plus,
+            away_scratches=away.scratches,
+            away_penalty_box=away.penalty_box,
+            away_coaches=away.coaches,
+            home_team=_team(home.team),
+            home_team_stats=_snake(
+                home.team_stats.team_skater_stats if home.team_stats else None
+            ),
+            home_players=_snake(home.players),
+            home_goalies=home.goalies,
+            home_skaters=home.skaters,
+            home_on_ice=home.on_ice_plus,
+            home_scratches=home.scratches,
+            home_penalty_box=home.penalty_box,
+            home_coaches=home.coaches,
+            officials=self.officials,
+        )
+
+
+class GameInfo(_Struct):
+    pk: int | None = None
+    season: str | None = None
+    game_type: str | None = None
+
+
+class GameDateTime(_Struct):
+    date_time: str | None = None
+    end_date_time: str | None = None
+
+
+class GameStatus(_Struct):
+    abstract_game_state: str | None = None
+    coded_game_state: str | None = None
+    detailed_state: str | None = None
+    status_code: str | None = None
+
+
+class GameTeams(_Struct):
+    away: dict | None = None
+    home: dict | None = None
+
+
+class GameData(_Struct):
+    game: GameInfo | None = None
+    date_time: GameDateTime | None = None
+    status: GameStatus | None = None
+    teams: GameTeams | None = None
+    players: dict | None = None
+    venue: dict | None = None
+
+
+class Plays(_Struct):
+    all_plays: list[PlayStruct] | None = None
+    scoring_plays: list | None = None
+    penalty_plays: list | None = None
+    plays_by_period: list | None = None
+    current_play: PlayStruct | None = None
+
+
+class LiveData(_Struct):
+    plays: Plays | None = None
+    boxscore: BoxscoreStruct | None = None
+    decisions: dict | None = None
+
+
+class LiveFeed(_Struct):
+    game_data: GameData | None = None
+    live_data: LiveData | None = None
+
+    def to_model(self) -> Game:
+        game_data = self.game_data or GameData()
+        info = game_data.game or GameInfo()
+        date_time = game_data.date_time or GameDateTime()
+        status = game_data.status or GameStatus()
+        teams = game_data.teams or GameTeams()
+        live_data = self.live_data or LiveData()
+        plays = live_data.plays or Plays()
+        return Game(
+            pk=info.pk,
+            season=info.season,
+            type=info.game_type,
+            date_time=date_time.date_time,
+            end_date_time=date_time.end_date_time,
+            abstract_game_state=status.abstract_game_state,
+            coded_game_state=status.coded_game_state,
+            detailed_state=status.detailed_state,
+            status_code=status.status_code,
+            away_team=_team(teams.away),
+            home_team=_team(teams.home),
+            players=_snake(game_data.players),
+            venue=_snake(game_data.venue),
+            all_plays=(
+                [p.to_model() for p in plays.all_plays]
+                if plays.all_plays is not None
+                else None
+            ),
+            scoring_plays=plays.scoring_plays,
+            penalty_plays=plays.penalty_plays,
+            plays_by_period=plays.plays_by_period,
+            current_play=plays.current_play.to_model() if plays.current_play else None,
+            boxscore=live_data.boxscore.to_model() if live_data.boxscore else None,
+            decisions=_snake(live_data.decisions),
+        )
+
+
+class ScheduleTeam(_Struct):
+    league_record: dict | None = None
+    score: int | None = None
+    team: dict | None = None
+
+
+class ScheduleTeams(_Struct):
+    away: ScheduleTeam | None = None
+    home: ScheduleTeam | None = None
+
+
+class ScheduleGameStruct(_Struct):
+    game_pk: int | None = None
+    game_type: str | None = None
+    season: str | None = None
+    game_date: str | None = None
+    status: dict | None = None
+    teams: ScheduleTeams | None = None
+    venue: dict | None = None
+
+    def to_model(self) -> ScheduleGame:
+        teams = self.teams or ScheduleTeams()
+        away = teams.away or ScheduleTeam()
+        home = teams.home or ScheduleTeam()
+        return ScheduleGame(
+            game_pk=self.game_pk,
+            game_type=self.game_type,
+            season=self.season,
+            game_date=parse_datetime(self.game_date) if self.game_date else None,
+            status=_snake(self.status),
+            away_league_record=_snake(away.league_record),
+            away_score=away.score,
+            away_team=_team(away.team),
+            home_league_record=_snake(home.league_record),
+            home_score=home.score,
+            home_team=_team(home.team),
+            venue=_snake(self.venue),
+        )
+
+
+class ScheduleDateStruct(_Struct):
+    date: str | None = None
+    total_items: int | None = None
+    total_events: int | None = None
+    total_games: int | None = None
+    total_matches: int | None = None
+    games: list[ScheduleGameStruct] | None = None
+    events: list | None = None
+    matches: list | None = None
+
+    def to_model(self) -> ScheduleDate:
+        return ScheduleDate(
+            date=parse_date(self.date) if self.date else None,
+            total_items=self.total_items,
+            total_events=self.total_events,
+            total_games=self.total_games,
+            total_matches=self.total_matches,
+            games=(
+                [g.to_model() for g in self.games] if self.games is not None else None
+            ),
+            events=self.events,
+            matches=self.matches,
+        )
+
+
+class Schedule(_Struct):
+    dates: list[ScheduleDateStruct] = []
+
+
+_LIVE_FEED_DECODER = msgspec.json.Decoder(LiveFeed)
+_BOXSCORE_DECODER = msgspec.json.Decoder(BoxscoreStruct)
+_SCHEDULE_DECODER = msgspec.json.Decoder(Schedule)
+
+
+def decode_game(content: bytes) -> Game:
+    """
+    :param content: raw body of a `/game/{id}/feed/live` response
+    :return: the Game model, identical to `Game.from_response` on the decoded body
+    """
+    return _LIVE_FEED_DECODER.decode(content).to_model()
+
+
+def decode_boxscore(content: bytes) -> Boxscore:
+    """
+    :param content: raw body of a `/game/{id}/boxscore` response
+    :return: the Boxscore model
+    """
+    return _BOXSCORE_DECODER.decode(content).to_model()
+
+
+def decode_schedule(content: bytes) -> list[ScheduleDate]:
+    """
+    :param content: raw body of a `/schedule` response
+    :return: a ScheduleDate model for every date of the schedule
+    """
+    return [d.to_model() for d in _SCHEDULE_DECODER.decode(content).dates]
+
+
+def decode_struct(content: bytes, struct: type[_Struct]) -> Any:
+    """
+    Decodes a raw body into one of the structs of this module, without
+    converting it to a model.
+
+    :param content: the raw body of the response
+    :param struct: the struct describing the body, e.g. `LiveFeed`
+    :return: the decoded struct
+    """
+    return msgspec.json.decode(content, type=struct)
@@ -1,78 +1,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 
-from nhl_data.models.base import Model
-from nhl_data.models.utils import convert_keys_to_snake_case
+from nhl_data.models.base import Model, source
+from nhl_data.models.utils import camel_to_snake_case
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass(frozen=True)
-class Team(Model):
-    """
-    Represents and contains all data for a single team, returned from the NHL API.
-    """
-
-    id: int = None
-    name: str = None
-    link: str = None
-    venue: dict = None
-    abbreviation: str = None
-    team_name: str = None
-    location_name: str = None
-    first_year_of_play: int = None
-    division: dict = None
-    conference: dict = None
-    franchise: dict = None
-    team_stats: list = None
-    roster: list[TeamRosterSpot] = None
-    team_leaders: list[TeamLeader] = None
-    short_name: str = None
-    record: TeamRecord = None
-    official_site_url: str = None
-    active: bool = None
-
-    @classmethod
-    def from_response(cls, data: dict) -> Team:
-        data = convert_keys_to_snake_case(data)
-        record_data = (
-            TeamRecord.from_response(data.get("record")) if "record" in data else None
-        )
-        team_leaders = (
-            [TeamLeader.from_response(d) for d in data.get("team_leaders")]
-            if "team_leaders" in data
-            else None
-        )
-        team_roster = (
-            [
-                TeamRosterSpot.from_response(d)
-                for d in data.get("roster", dict()).get("roster", [])
-            ]
-            if "roster" in data and "roster" in data.get("roster")
-            else None
-        )
-        return cls(
-            id=data.get("id"),
-            name=data.get("name"),
-            link=data.get("link"),
-            venue=data.get("venue"),
-            abbreviation=data.get("abbreviation"),
-            team_name=data.get("team_name"),
-            location_name=data.get("location_name"),
-            first_year_of_play=data.get("first_year_of_play"),
-            division=data.get("division"),
-            conference=data.get("conference"),
-            franchise=data.get("franchise"),
-            team_stats=data.get("teamStats"),
-            roster=team_roster,
-            team_leaders=team_leaders,
-            short_name=data.get("shortName"),
-            record=record_data,
-            official_site_url=data.get("official_site_url"),
-            active=data.get("active"),
-        )
+_SHALLOW_TEAM_FIELDS = {"id", "name", "link"}
+_TEAM_REGISTRY_MAXSIZE = 4096
 
 
 @dataclass(frozen=True)
@@ -93,7 +31,7 @@ class TeamRecord(Model):
     conference_road_rank: str = None
     conference_home_rank: str = None
     league_rank: str = None
-    leage_l10_rank: str = None
+    leage_l10_rank: str = source("leagueL10Rank")
     league_road_rank: str = None
     league_home_rank: str = None
     wild_card_rank: str = None
@@ -107,39 +45,6 @@ class TeamRecord(Model):
     pp_league_rank: str = None
     last_updated: str = None
 
-    @classmethod
-    def from_response(cls, json_response: dict) -> TeamRecord:
-        data = convert_keys_to_snake_case(json_response)
-        return cls(
-            league_record=data.get("league_record"),
-            regulation_wins=data.get("regulation_wins"),
-            goals_against=data.get("goals_against"),
-            goals_scored=data.get("goals_scored"),
-            points=data.get("points"),
-            division_rank=data.get("division_rank"),
-            division_l10_rank=data.get("division_l10_rank"),
-            division_road_rank=data.get("division_road_rank"),
-            division_home_rank=data.get("division_home_rank"),
-            conference_rank=data.get("conference_rank"),
-            conference_l10_rank=data.get("conference_l10_rank"),
-            conference_road_rank=data.get("conference_road_rank"),
-            conference_home_rank=data.get("conference_home_rank"),
-            league_rank=data.get("league_rank"),
-            leage_l10_rank=data.get("leage_l10_rank"),
-            league_road_rank=data.get("league_road_rank"),
-            league_home_rank=data.get("league_home_rank"),
-            wild_card_rank=data.get("wild_card_rank"),
-            row=data.get("row"),
-            games_played=data.get("games_played"),
-            streak=data.get("streak"),
-            clinch_indicator=data.get("clinch_indicator"),
-            points_percentage=data.get("points_percentage"),
-            pp_division_rank=data.get("pp_division_rank"),
-            pp_conference_rank=data.get("pp_conference_rank"),
-            pp_league_rank=data.get("pp_league_rank"),
-            last_updated=data.get("last_updated"),
-        )
-
 
 @dataclass(frozen=True)
 class TeamLeader(Model):
@@ -154,32 +59,81 @@ class TeamLeader(Model):
     limit_metadata: dict = None
     leaders: list[dict] = None
 
-    @classmethod
-    def from_response(cls, json_response: dict) -> TeamLeader:
-        data = convert_keys_to_snake_case(json_response)
-        return cls(
-            leader_category=data.get("leader_category"),
-            depth=data.get("depth"),
-            player_status=data.get("player_status"),
-            season=data.get("season"),
-            game_type=data.get("game_type"),
-            limits=data.get("limits"),
-            limit_metadata=data.get("limit_metadata"),
-            leaders=data.get("leaders"),
-        )
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamRosterSpot(Model):
     person: dict[str, str | int] = None
     jersey_number: str = None
     position: dict[str, str] = None
 
+
+@dataclass(frozen=True)
+class Team(Model):
+    """
+    Represents and contains all data for a single team, returned from the NHL API.
+    """
+
+    id: int = None
+    name: str = None
+    link: str = None
+    venue: dict = None
+    abbreviation: str = None
+    team_name: str = None
+    location_name: str = None
+    first_year_of_play: int = None
+    division: dict = None
+    conference: dict = None
+    franchise: dict = None
+    team_stats: list = None
+    roster: list[TeamRosterSpot] = source(
+        "roster", "roster", parser=TeamRosterSpot.from_response_list
+    )
+    team_leaders: list[TeamLeader] = source(
+        "teamLeaders", parser=TeamLeader.from_response_list
+    )
+    short_name: str = None
+    record: TeamRecord = source("record", parser=TeamRecord.from_response)
+    official_site_url: str = None
+    active: bool = None
+
+    @classmethod
+    def from_response(cls, data: dict, fields: Iterable[str] = None) -> Team:
+        """
+        Builds a Team from the response data. Shallow team references, which only
+        carry the `id`, `name` and `link` of a team (e.g. the teams of a play or
+        a scheduled game), are interned: every reference to the same team
+        returns the same canonical, immutable instance. Projections (see
+        `Model.from_response`) are never interned.
+
+        :param data: dictionary containing all the data (e.g. the response data)
+        :param fields: the names of the fields to parse, defaults to every field
+        :return: an instance of the model
+        """
+        if fields is not None or cls is not Team or not cls._is_shallow(data):
+            return super().from_response(data, fields)
+        key = (data.get("id"), data.get("name"), data.get("link"))
+        try:
+            return _TEAM_REGISTRY[key]
+        except KeyError:
+            team = super().from_response(data)
+            if len(_TEAM_REGISTRY) < _TEAM_REGISTRY_MAXSIZE:
+                team = _TEAM_REGISTRY.setdefault(key, team)
+            return team
+
     @classmethod
-    def from_response(cls, json_response: dict) -> TeamRosterSpot:
-        data = convert_keys_to_snake_case(json_response)
-        return cls(
-            person=data.get("person"),
-            jersey_number=data.get("jersey_number"),
-            position=data.get("position"),
-        )
+    def _is_shallow(cls, data: dict) -> bool:
+        if "_deep_keys" not in cls.__dict__:
+            deep_keys = set()
+            for name, path, _ in cls.field_map():
+                if name not in _SHALLOW_TEAM_FIELDS:
+                    deep_keys.update({path[0], camel_to_snake_case(path[0])})
+            setattr(cls, "_deep_keys", frozenset(deep_keys))
+        return cls.__dict__["_deep_keys"].isdisjoint(data)
+
+
+_TEAM_REGISTRY: dict[tuple, Team] = dict()
+
+
+def clear_team_registry() -> None:
+    """Drops every interned Team, releasing the memory they hold."""
+    _TEAM_REGISTRY.clear()
@@ -1,30 +1,85 @@
+import datetime
 import re
 
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+_SNAKE_CASE_KEYS: dict[str, str] = {}
+_SNAKE_CASE_KEYS_MAXSIZE = 16384
+
+
+class SnakeCaseDict(dict):
+    """
+    Dictionary returned by `convert_keys_to_snake_case`. Its keys, and the keys of
+    every nested dictionary, are already in snake_case, so converting it again is
+    a no-op. This lets nested `from_response` calls skip sub-trees that their
+    parent model has already converted.
+    """
+
+    __slots__ = ()
+
 
 def camel_to_snake_case(value: str) -> str:
     """
     Takes any string that is camelCase, and converts it to snake_case.
+    Conversions are memoized, since the API only ever uses a limited set of keys.
 
     :param value: the string we want to convert
     :return: snake_case formatted string
     """
-    r_string = r"(?<!^)(?=[A-Z])"
-    return re.sub(r_string, "_", value).lower()
+    try:
+        return _SNAKE_CASE_KEYS[value]
+    except KeyError:
+        converted = _CAMEL_CASE_BOUNDARY.sub("_", value).lower()
+        if len(_SNAKE_CASE_KEYS) < _SNAKE_CASE_KEYS_MAXSIZE:
+            _SNAKE_CASE_KEYS[value] = converted
+        return converted
 
 
 def convert_keys_to_snake_case(d: dict) -> dict:
     """
     Converts all the keys in a given dictionary to snake case.
-    It will traverse through nested dictionaries as well.
+    It will traverse through nested dictionaries as well, in a single pass.
+
+    Dictionaries that were already converted are returned as they are.
 
     :param d: the dictionary we want to convert keys for
     :return: the same dictionary with converted keys
     """
-    new_data = {}
+    if isinstance(d, SnakeCaseDict):
+        return d
+    new_data = SnakeCaseDict()
     for k, v in d.items():
-        new_key = camel_to_snake_case(k)
-        if isinstance(v, dict):
-            new_data[new_key] = convert_keys_to_snake_case(v)
-        else:
-            new_data[new_key] = v
+        new_data[camel_to_snake_case(k)] = (
+            convert_keys_to_snake_case(v) if isinstance(v, dict) else v
+        )
     return new_data
+
+
+def snake_to_camel_case(value: str) -> str:
+    """
+    Takes any string that is snake_case, and converts it to camelCase.
+
+    :param value: the string we want to convert
+    :return: camelCase formatted string
+    """
+    first, *rest = value.split("_")
+    return first + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def parse_date(value: str) -> datetime.date:
+    """
+    Parses a date returned by the API, e.g. `2023-01-01`.
+
+    :param value: the date string
+    :return: the parsed date
+    """
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """
+    Parses an ISO 8601 timestamp returned by the API, e.g. `2023-01-01T01:30:00Z`.
+
+    :param value: the timestamp string
+    :return: the parsed, timezone aware datetime
+    """
+    return datetime.datetime.fromisoformat(value)
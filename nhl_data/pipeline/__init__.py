@@ -0,0 +1,14 @@
+from nhl_data.pipeline.arrow import (
+    GameDatasetWriter,
+    ParquetDatasetWriter,
+    arrow_schema,
+    export_games,
+    to_arrow_table,
+)
+from nhl_data.pipeline.backfill import (
+    BackfillReport,
+    backfill_season,
+    iter_schedule_games,
+)
+from nhl_data.pipeline.sinks import CallbackSink, JsonlSink, ParquetSink, Sink
+from nhl_data.pipeline.warehouse import SyncReport, Warehouse, sync_season
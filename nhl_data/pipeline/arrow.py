@@ -0,0 +1,356 @@
+"""
+Export of models to Arrow tables and partitioned Parquet datasets.
+
+Arrow schemas are derived from the model dataclasses, so every export of a model
+has the same schema regardless of which fields the API happened to send:
+
+* `int`, `float`, `bool` and `str` fields map onto the matching Arrow types
+* `datetime.datetime` and `datetime.date` fields map onto timestamps and dates
+* nested models become structs, and lists of models become lists of structs
+* free-form `dict` and `list` fields are stored as JSON encoded strings
+
+Requires the optional `pyarrow` dependency (`poetry install -E parquet`).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import json
+import types
+import typing
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+from nhl_data.models.base import Model
+from nhl_data.models.game import Boxscore, Game, Play
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+"""Number of rows buffered per partition before a row group is written."""
+
+DEFAULT_PARTITION_BY = ("season", "game_type")
+"""Columns a dataset is partitioned by, if its rows have them."""
+
+GAME_CONTEXT = {"game_pk": int, "season": str, "game_type": str}
+"""Columns identifying the game that plays and boxscores belong to."""
+
+_GAME_EXCLUDE = ("all_plays", "current_play", "boxscore")
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Arrow export requires pyarrow, install it with `poetry install -E parquet`"
+        )
+
+
+def _coerce(kind: type) -> Callable[[Any], Any]:
+    def convert(value):
+        try:
+            return kind(value)
+        except (TypeError, ValueError):
+            return None
+
+    return convert
+
+
+def _to_json(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _column(annotation: Any) -> tuple[pa.DataType, Callable[[Any], Any]]:
+    """Maps a field annotation onto its Arrow type and a value converter."""
+    if isinstance(annotation, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+    origin = typing.get_origin(annotation)
+    if annotation is bool:
+        return pa.bool_(), _coerce(bool)
+    if annotation is int:
+        return pa.int64(), _coerce(int)
+    if annotation is float:
+        return pa.float64(), _coerce(float)
+    if annotation is str:
+        return pa.string(), _coerce(str)
+    if annotation is datetime.datetime:
+        return pa.timestamp("us", tz="UTC"), lambda value: value
+    if annotation is datetime.date:
+        return pa.date32(), lambda value: value
+    if isinstance(annotation, type) and issubclass(annotation, Model):
+        return pa.struct(arrow_schema(annotation)), _row_converter(annotation)
+    if origin is list:
+        (item,) = typing.get_args(annotation)
+        if isinstance(item, type) and issubclass(item, Model):
+            item_type, convert_item = _column(item)
+            return pa.list_(item_type), lambda value: [convert_item(v) for v in value]
+    return pa.string(), _to_json
+
+
+def _columns(model_cls: type[Model], exclude: Iterable[str] = ()) -> dict:
+    hints = typing.get_type_hints(model_cls)
+    return {
+        field.name: _column(hints[field.name])
+        for field in dataclasses.fields(model_cls)
+        if field.name not in exclude
+    }
+
+
+def _row_converter(
+    model_cls: type[Model], exclude: Iterable[str] = ()
+) -> Callable[[Model], dict]:
+    converters = [(name, c[1]) for name, c in _columns(model_cls, exclude).items()]
+
+    def convert(model: Model) -> dict:
+        row = dict()
+        for name, converter in converters:
+            value = getattr(model, name)
+            row[name] = None if value is None else converter(value)
+        return row
+
+    return convert
+
+
+def arrow_schema(
+    model_cls: type[Model],
+    exclude: Iterable[str] = (),
+    context: Mapping[str, type] = None,
+) -> pa.Schema:
+    """
+    Derives the Arrow schema of a model from its dataclass fields.
+
+    :param model_cls: the model we want the schema of
+    :param exclude: names of fields which should be left out, defaults to none
+    :param context: extra leading columns and their python types, e.g.
+        `GAME_CONTEXT` for the plays of a game, defaults to none
+    :return: the schema of the model's table
+    """
+    _require_pyarrow()
+    fields = [(name, _column(kind)[0]) for name, kind in (context or dict()).items()]
+    fields += [(name, c[0]) for name, c in _columns(model_cls, exclude).items()]
+    return pa.schema(fields)
+
+
+def to_arrow_table(
+    models: Iterable[Model],
+    model_cls: type[Model],
+    exclude: Iterable[str] = (),
+    context: Mapping[str, Any] = None,
+) -> pa.Table:
+    """
+    Converts a batch of models into an Arrow table.
+
+    :param models: the models we want to convert, all of type `model_cls`
+    :param model_cls: the type of the models
+    :param exclude: names of fields which should be left out, defaults to none
+    :param context: extra leading columns and the value they hold in every row,
+        e.g. `game_context(game)` for the plays of a game, defaults to none
+    :return: table with one row per model
+    """
+    context = context or dict()
+    schema = arrow_schema(
+        model_cls, exclude, {name: type(value) for name, value in context.items()}
+    )
+    convert = _row_converter(model_cls, exclude)
+    rows = [{**context, **convert(model)} for model in models]
+    return pa.Table.from_pylist(rows, schema=schema)
+
+
+def game_context(game: Game) -> dict[str, Any]:
+    """
+    :param game: the game that plays or a boxscore belong to
+    :return: the values of the `GAME_CONTEXT` columns for the game
+    """
+    return {"game_pk": game.pk, "season": game.season, "game_type": game.type}
+
+
+class ParquetDatasetWriter:
+    """
+    Streams models of a single type into a Hive partitioned Parquet dataset,
+    e.g. `root/season=20222023/game_type=R/part-0.parquet`.
+
+    Each writer opens a new part file in every partition it writes to, named
+    after the first free `part-<n>.parquet`, so exporting into a dataset again
+    adds to it instead of overwriting what is already there.
+
+    Rows are buffered per partition and written as a row group once
+    `row_group_size` rows have been collected, so memory use is bounded by the
+    row group size rather than by the size of the export. Partition columns are
+    encoded in the directory names and left out of the files, following the Hive
+    convention understood by `pyarrow.dataset`, pandas and most query engines.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        model_cls: type[Model],
+        partition_by: Iterable[str] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        exclude: Iterable[str] = (),
+        context: Mapping[str, type] = None,
+    ) -> None:
+        """
+        :param root: the directory the dataset is written to
+        :param model_cls: the model we want to write
+        :param partition_by: the columns the dataset is partitioned by, defaults
+            to those of `DEFAULT_PARTITION_BY` the rows have; pass `()` to write
+            an unpartitioned dataset
+        :param row_group_size: rows buffered per partition before they are written
+        :param exclude: names of fields which should be left out, defaults to none
+        :param context: extra leading columns and their python types, defaults
+            to none
+        """
+        _require_pyarrow()
+        self.root = Path(root)
+        self.model_cls = model_cls
+        self.row_group_size = row_group_size
+        self.context = dict(context or dict())
+        self.rows_written = 0
+        schema = arrow_schema(model_cls, exclude, self.context)
+        if partition_by is None:
+            partition_by = [c for c in DEFAULT_PARTITION_BY if c in schema.names]
+        self.partition_by = tuple(partition_by)
+        self.schema = pa.schema(f for f in schema if f.name not in self.partition_by)
+        self._convert = _row_converter(model_cls, exclude)
+        self._buffers: dict[tuple, list[dict]] = dict()
+        self._writers: dict[tuple, pq.ParquetWriter] = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def write(self, model: Model, **context: Any) -> None:
+        """
+        Buffers a single model, writing a row group once the model's partition
+        holds `row_group_size` rows.
+
+        :param model: the model we want to write
+        :param context: the values of the writer's context columns for this row
+        """
+        row = {**context, **self._convert(model)}
+        partition = tuple(row.pop(name) for name in self.partition_by)
+        buffer = self._buffers.setdefault(partition, [])
+        buffer.append(row)
+        if len(buffer) >= self.row_group_size:
+            self._flush(partition)
+
+    def close(self) -> None:
+        """Writes every buffered row and finalizes the Parquet files."""
+        for partition in list(self._buffers):
+            self._flush(partition)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def _flush(self, partition: tuple) -> None:
+        rows = self._buffers.pop(partition)
+        if not rows:
+            return
+        writer = self._writers.get(partition)
+        if writer is None:
+            directory = self.root.joinpath(
+                *(
+                    f"{name}={value}"
+                    for name, value in zip(self.partition_by, partition)
+                )
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(_new_part(directory), self.schema)
+            self._writers[partition] = writer
+        writer.write_table(pa.Table.from_pylist(rows, schema=self.schema))
+        self.rows_written += len(rows)
+
+
+def _new_part(directory: Path) -> Path:
+    number = 0
+    while (directory / f"part-{number}.parquet").exists():
+        number += 1
+    return directory / f"part-{number}.parquet"
+
+
+class GameDatasetWriter:
+    """
+    Streams Games into three Parquet datasets below `root`, each partitioned by
+    season and game type:
+
+    * `games`: one row per game, without its plays and boxscore
+    * `plays`: one row per play, keyed by `game_pk`
+    * `boxscores`: one row per game, keyed by `game_pk`
+    """
+
+    def __init__(
+        self, root: str | Path, row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ) -> None:
+        root = Path(root)
+        partition_by = DEFAULT_PARTITION_BY
+        # the game's own `type` column is written as `game_type`, so that every
+        # dataset is partitioned (and can be joined) on the same columns
+        self.games = ParquetDatasetWriter(
+            root / "games",
+            Game,
+            partition_by,
+            row_group_size,
+            _GAME_EXCLUDE + ("type",),
+            context={"game_type": str},
+        )
+        self.plays = ParquetDatasetWriter(
+            root / "plays", Play, partition_by, row_group_size, context=GAME_CONTEXT
+        )
+        self.boxscores = ParquetDatasetWriter(
+            root / "boxscores",
+            Boxscore,
+            partition_by,
+            row_group_size,
+            context=GAME_CONTEXT,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def write(self, game: Game) -> None:
+        """
+        :param game: the game we want to write, along with its plays and boxscore
+        """
+        self.games.write(game, game_type=game.type)
+        context = game_context(game)
+        for play in game.all_plays or []:
+            self.plays.write(play, **context)
+        if game.boxscore is not None:
+            self.boxscores.write(game.boxscore, **context)
+
+    def close(self) -> None:
+        self.games.close()
+        self.plays.close()
+        self.boxscores.close()
+
+
+def export_games(
+    games: Iterable[Game],
+    root: str | Path,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Writes games, their plays and their boxscores to partitioned Parquet
+    datasets. `games` is consumed lazily, so a generator of games (e.g. a
+    season backfill) is never held in memory at once.
+
+    :param games: the games we want to export
+    :param root: the directory the datasets are written to
+    :param row_group_size: rows buffered per partition before they are written
+    :return: the number of games written
+    """
+    with GameDatasetWriter(root, row_group_size) as writer:
+        for game in games:
+            writer.write(game)
+    return writer.games.rows_written
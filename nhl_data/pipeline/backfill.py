@@ -0,0 +1,88 @@
+"""
+Pipeline which backfills every game of a season: schedule -> live feeds -> sink.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from nhl_data.api.stats import StatsNhlApi
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+from nhl_data.pipeline.sinks import Sink
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackfillReport:
+    """Summary of a finished backfill."""
+
+    written: int = 0
+    failed: dict[int, Exception] = field(default_factory=dict)
+
+
+def iter_schedule_games(
+    schedule: Iterable[ScheduleDate], game_types: Iterable[str] = None
+) -> Iterator[ScheduleGame]:
+    """
+    Walks every ScheduleDate, yielding each of its games once.
+
+    :param schedule: the dates returned by `StatsNhlApi.schedule`
+    :param game_types: only yield games of these types (e.g. `R`, `P`),
+        defaults to yielding every game
+    :return: iterator of ScheduleGames in schedule order
+    """
+    game_types = set(game_types) if game_types else None
+    seen = set()
+    for schedule_date in schedule:
+        for game in schedule_date.games or []:
+            if game.game_pk is None or game.game_pk in seen:
+                continue
+            if game_types and game.game_type not in game_types:
+                continue
+            seen.add(game.game_pk)
+            yield game
+
+
+def backfill_season(
+    api: StatsNhlApi,
+    season: int,
+    sink: Sink,
+    game_types: Iterable[str] = None,
+    max_workers: int = 10,
+) -> BackfillReport:
+    """
+    Fetches the live feed of every game in a season and writes each parsed Game
+    to `sink` as soon as it arrives.
+
+    Only `max_workers` games are in flight at once and each Game is released once
+    the sink has consumed it, so memory use does not grow with the season length.
+    Games that fail to download are recorded on the report and skipped.
+
+    :param api: the API wrapper used for every request
+    :param season: the start year of the season we want to backfill
+    :param sink: where every parsed Game is written to
+    :param game_types: only backfill games of these types (e.g. `R`, `P`),
+        defaults to every game
+    :param max_workers: the maximum number of live feeds in flight at once,
+        defaults to 10
+    :return: summary of how many games were written and which ones failed
+    """
+    report = BackfillReport()
+    schedule_games = iter_schedule_games(api.schedule(season=season), game_types)
+    game_pks = (game.game_pk for game in schedule_games)
+    for result in api.fetch_games(game_pks, max_workers=max_workers):
+        if not result.ok:
+            report.failed[result.key] = result.error
+            continue
+        sink.write(result.value)
+        report.written += 1
+    logger.info(
+        "Backfilled %s games for season %s, %s failed",
+        report.written,
+        season,
+        len(report.failed),
+    )
+    return report
@@ -0,0 +1,103 @@
+"""
+Sinks which receive the models produced by a pipeline.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from nhl_data.models.base import Model
+from nhl_data.models.game import Game
+from nhl_data.pipeline.arrow import (
+    DEFAULT_ROW_GROUP_SIZE,
+    GameDatasetWriter,
+    ParquetDatasetWriter,
+)
+
+
+class Sink(ABC):
+    """
+    Base class for every pipeline sink. Sinks receive one model at a time and
+    should not hold on to it after `write` returns, so that memory use stays
+    bounded regardless of how many models flow through them.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    @abstractmethod
+    def write(self, model: Model) -> None:  # pragma: no cover
+        """
+        Consumes a single model.
+
+        :param model: the model produced by the pipeline
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flushes and releases any resources held by the sink."""
+
+
+class CallbackSink(Sink):
+    """Hands every model to a user supplied callable."""
+
+    def __init__(self, callback: Callable[[Model], None]) -> None:
+        self.callback = callback
+
+    def write(self, model: Model) -> None:
+        self.callback(model)
+
+
+class JsonlSink(Sink):
+    """
+    Writes every model as one JSON object per line. Dates and other values that
+    are not JSON serializable are written as strings.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.file = self.path.open("w", encoding="utf-8")
+
+    def write(self, model: Model) -> None:
+        self.file.write(json.dumps(dataclasses.asdict(model), default=str))
+        self.file.write("\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Streams models into partitioned Parquet datasets below `root`. Games are split
+    into `games`, `plays` and `boxscores` datasets (see `GameDatasetWriter`);
+    other models are written to a single dataset partitioned by `partition_by`,
+    which defaults to season and game type for models having them.
+    Requires the optional `pyarrow` dependency.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        model_cls: type[Model] = Game,
+        partition_by: Iterable[str] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        if model_cls is Game:
+            self.writer = GameDatasetWriter(root, row_group_size)
+        else:
+            self.writer = ParquetDatasetWriter(
+                root, model_cls, partition_by, row_group_size
+            )
+
+    def write(self, model: Model) -> None:
+        self.writer.write(model)
+
+    def close(self) -> None:
+        self.writer.close()
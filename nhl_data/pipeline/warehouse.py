@@ -0,0 +1,452 @@
+"""
+Local SQLite mirror of the Stats API, kept up to date by incremental syncs.
+
+Every game is written in its own transaction together with its plays, so a sync
+that is interrupted simply resumes with the games that were not stored yet. Games
+are only downloaded until the warehouse holds them in their `Final` state.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from nhl_data.api.stats import StatsNhlApi
+from nhl_data.models.game import Game
+from nhl_data.models.person import Person
+from nhl_data.models.schedule import ScheduleDate
+from nhl_data.models.season import Season
+from nhl_data.models.standing import Standing
+from nhl_data.models.team import Team
+from nhl_data.pipeline.backfill import iter_schedule_games
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    season_id TEXT PRIMARY KEY,
+    regular_season_start_date TEXT,
+    regular_season_end_date TEXT,
+    season_end_date TEXT,
+    number_of_games INTEGER
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    link TEXT
+);
+CREATE TABLE IF NOT EXISTS schedule_games (
+    game_pk INTEGER PRIMARY KEY,
+    season TEXT,
+    game_type TEXT,
+    game_date TEXT,
+    abstract_game_state TEXT,
+    detailed_state TEXT,
+    away_team_id INTEGER REFERENCES teams (id),
+    home_team_id INTEGER REFERENCES teams (id),
+    away_score INTEGER,
+    home_score INTEGER
+);
+CREATE INDEX IF NOT EXISTS schedule_games_season ON schedule_games (season);
+CREATE INDEX IF NOT EXISTS schedule_games_date ON schedule_games (game_date);
+CREATE INDEX IF NOT EXISTS schedule_games_away ON schedule_games (away_team_id);
+CREATE INDEX IF NOT EXISTS schedule_games_home ON schedule_games (home_team_id);
+CREATE TABLE IF NOT EXISTS games (
+    game_pk INTEGER PRIMARY KEY,
+    season TEXT,
+    game_type TEXT,
+    date_time TEXT,
+    end_date_time TEXT,
+    abstract_game_state TEXT,
+    detailed_state TEXT,
+    away_team_id INTEGER REFERENCES teams (id),
+    home_team_id INTEGER REFERENCES teams (id),
+    synced_at REAL
+);
+CREATE INDEX IF NOT EXISTS games_date ON games (date_time);
+CREATE INDEX IF NOT EXISTS games_away ON games (away_team_id);
+CREATE INDEX IF NOT EXISTS games_home ON games (home_team_id);
+CREATE TABLE IF NOT EXISTS plays (
+    game_pk INTEGER REFERENCES games (game_pk),
+    play_index INTEGER,
+    event_type_id TEXT,
+    event TEXT,
+    description TEXT,
+    secondary_type TEXT,
+    strength_name TEXT,
+    period INTEGER,
+    period_time TEXT,
+    date_time TEXT,
+    goals_away INTEGER,
+    goals_home INTEGER,
+    x REAL,
+    y REAL,
+    team_id INTEGER REFERENCES teams (id),
+    PRIMARY KEY (game_pk, play_index)
+);
+CREATE INDEX IF NOT EXISTS plays_team ON plays (team_id);
+CREATE TABLE IF NOT EXISTS play_players (
+    game_pk INTEGER,
+    play_index INTEGER,
+    person_id INTEGER REFERENCES people (id),
+    player_type TEXT,
+    FOREIGN KEY (game_pk, play_index) REFERENCES plays (game_pk, play_index)
+);
+CREATE INDEX IF NOT EXISTS play_players_play ON play_players (game_pk, play_index);
+CREATE INDEX IF NOT EXISTS play_players_person ON play_players (person_id);
+CREATE TABLE IF NOT EXISTS people (
+    id INTEGER PRIMARY KEY,
+    full_name TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    birth_date TEXT,
+    nationality TEXT,
+    position TEXT,
+    shoots_catches TEXT,
+    current_team_id INTEGER REFERENCES teams (id),
+    active INTEGER
+);
+CREATE INDEX IF NOT EXISTS people_team ON people (current_team_id);
+CREATE TABLE IF NOT EXISTS standings (
+    season TEXT,
+    standings_type TEXT,
+    team_id INTEGER REFERENCES teams (id),
+    division_id INTEGER,
+    conference_id INTEGER,
+    games_played INTEGER,
+    points INTEGER,
+    goals_scored INTEGER,
+    goals_against INTEGER,
+    division_rank TEXT,
+    conference_rank TEXT,
+    league_rank TEXT,
+    PRIMARY KEY (season, standings_type, team_id)
+);
+CREATE INDEX IF NOT EXISTS standings_team ON standings (team_id);
+"""
+
+
+def _get(data: dict | None, *path: str):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+class Warehouse:
+    """
+    Normalized SQLite database holding seasons, schedules, games, plays, people
+    and standings. Tables are indexed by game, team, person and date, so the
+    mirror can be queried directly with SQL through `connection`.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def write_seasons(self, seasons: Iterable[Season]) -> None:
+        """
+        :param seasons: the seasons we want to store, replacing existing rows
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        s.season_id,
+                        s.regular_season_start_date,
+                        s.regular_season_end_date,
+                        s.season_end_date,
+                        s.number_of_games,
+                    )
+                    for s in seasons
+                ],
+            )
+
+    def write_schedule(self, schedule: Iterable[ScheduleDate]) -> None:
+        """
+        :param schedule: the dates returned by `StatsNhlApi.schedule`, whose games
+            replace any existing schedule rows
+        """
+        rows, teams = [], []
+        for game in iter_schedule_games(schedule):
+            teams += [game.away_team, game.home_team]
+            rows.append(
+                (
+                    game.game_pk,
+                    game.season,
+                    game.game_type,
+                    game.game_date.isoformat() if game.game_date else None,
+                    _get(game.status, "abstract_game_state"),
+                    _get(game.status, "detailed_state"),
+                    game.away_team.id if game.away_team else None,
+                    game.home_team.id if game.home_team else None,
+                    game.away_score,
+                    game.home_score,
+                )
+            )
+        with self.connection:
+            self._write_teams(teams)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO schedule_games "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def write_game(self, game: Game) -> None:
+        """
+        Stores a game along with its plays and the people taking part in it, in a
+        single transaction. Plays stored for the game before are replaced.
+
+        :param game: the game we want to store
+        """
+        plays, play_players = [], []
+        for index, play in enumerate(game.all_plays or []):
+            coordinates = play.coordinates or dict()
+            plays.append(
+                (
+                    game.pk,
+                    index,
+                    play.event_type_id,
+                    play.event,
+                    play.description,
+                    play.secondary_type,
+                    play.strength_name,
+                    play.period,
+                    play.period_time,
+                    play.date_time,
+                    play.goals_away,
+                    play.goals_home,
+                    coordinates.get("x"),
+                    coordinates.get("y"),
+                    play.team.id if play.team else None,
+                )
+            )
+            for player in play.players or []:
+                person_id = _get(player, "player", "id")
+                play_players.append(
+                    (game.pk, index, person_id, player.get("playerType"))
+                )
+        people = [Person.from_response(p) for p in (game.players or dict()).values()]
+        with self.connection:
+            self._write_teams([game.away_team, game.home_team])
+            self.connection.execute(
+                "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    game.pk,
+                    game.season,
+                    game.type,
+                    game.date_time,
+                    game.end_date_time,
+                    game.abstract_game_state,
+                    game.detailed_state,
+                    game.away_team.id if game.away_team else None,
+                    game.home_team.id if game.home_team else None,
+                    time.time(),
+                ),
+            )
+            self.connection.execute(
+                "DELETE FROM play_players WHERE game_pk = ?", (game.pk,)
+            )
+            self.connection.execute("DELETE FROM plays WHERE game_pk = ?", (game.pk,))
+            self.connection.executemany(
+                "INSERT INTO plays "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                plays,
+            )
+            self.connection.executemany(
+                "INSERT INTO play_players VALUES (?, ?, ?, ?)", play_players
+            )
+            self._write_people(people)
+
+    def write_people(self, people: Iterable[Person]) -> None:
+        """
+        :param people: the people we want to store, replacing existing rows
+        """
+        with self.connection:
+            self._write_people(people)
+
+    def write_standings(self, season: str, standings: Iterable[Standing]) -> None:
+        """
+        :param season: the season the standings belong to, e.g. `20222023`
+        :param standings: the standings we want to store, replacing existing rows
+        """
+        rows, teams = [], []
+        for standing in standings:
+            for team in standing.team_records or []:
+                record = team.record
+                teams.append(team)
+                rows.append(
+                    (
+                        season,
+                        standing.standings_type,
+                        team.id,
+                        _get(standing.division, "id"),
+                        _get(standing.conference, "id"),
+                        record.games_played if record else None,
+                        record.points if record else None,
+                        record.goals_scored if record else None,
+                        record.goals_against if record else None,
+                        record.division_rank if record else None,
+                        record.conference_rank if record else None,
+                        record.league_rank if record else None,
+                    )
+                )
+        with self.connection:
+            self._write_teams(teams)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO standings "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def pending_games(self, season: str, game_types: Iterable[str] = None) -> list[int]:
+        """
+        Finds the scheduled games of a season which have started, but which the
+        warehouse does not hold in their final state yet.
+
+        :param season: the season we want to look at, e.g. `20222023`
+        :param game_types: only consider games of these types (e.g. `R`, `P`),
+            defaults to every game
+        :return: the pks of the games which should be (re-)downloaded
+        """
+        query = (
+            "SELECT s.game_pk FROM schedule_games s "
+            "LEFT JOIN games g ON g.game_pk = s.game_pk "
+            "WHERE s.season = ? AND s.abstract_game_state IS NOT 'Preview' "
+            "AND g.abstract_game_state IS NOT 'Final'"
+        )
+        params = [season]
+        if game_types:
+            game_types = list(game_types)
+            query += f" AND s.game_type IN ({', '.join('?' * len(game_types))})"
+            params += game_types
+        rows = self.connection.execute(query + " ORDER BY s.game_date", params)
+        return [game_pk for (game_pk,) in rows]
+
+    def is_season_final(self, season: str) -> bool:
+        """
+        :param season: the season we want to look at, e.g. `20222023`
+        :return: True if every scheduled game of the season is stored as final
+        """
+        (unfinished,) = self.connection.execute(
+            "SELECT COUNT(*) FROM schedule_games s "
+            "LEFT JOIN games g ON g.game_pk = s.game_pk "
+            "WHERE s.season = ? AND g.abstract_game_state IS NOT 'Final'",
+            (season,),
+        ).fetchone()
+        return unfinished == 0
+
+    def has_rows(self, table: str, **where) -> bool:
+        """
+        :param table: the table we want to look at
+        :param where: column values the rows must match
+        :return: True if at least one matching row exists
+        """
+        condition = " AND ".join(f"{column} = ?" for column in where) or "1"
+        row = self.connection.execute(
+            f"SELECT 1 FROM {table} WHERE {condition} LIMIT 1", tuple(where.values())
+        ).fetchone()
+        return row is not None
+
+    def _write_teams(self, teams: Iterable[Team]) -> None:
+        self.connection.executemany(
+            "INSERT INTO teams VALUES (?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+            "name = coalesce(excluded.name, name), "
+            "link = coalesce(excluded.link, link)",
+            {(t.id, t.name, t.link) for t in teams if t is not None and t.id},
+        )
+
+    def _write_people(self, people: Iterable[Person]) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO people VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    p.id,
+                    p.full_name,
+                    p.first_name,
+                    p.last_name,
+                    p.birth_date.isoformat() if p.birth_date else None,
+                    p.nationality,
+                    _get(p.primary_position, "abbreviation"),
+                    p.shoots_catches,
+                    p.current_team.id if p.current_team else None,
+                    p.active,
+                )
+                for p in people
+            ],
+        )
+
+
+@dataclass
+class SyncReport:
+    """Summary of a finished sync."""
+
+    games_synced: int = 0
+    failed: dict[int, Exception] = field(default_factory=dict)
+
+
+def sync_season(
+    api: StatsNhlApi,
+    warehouse: Warehouse,
+    season: int,
+    game_types: Iterable[str] = None,
+    max_workers: int = 10,
+) -> SyncReport:
+    """
+    Brings the warehouse up to date for a single season.
+
+    The season list is only downloaded when the season is missing, and the
+    schedule is always refreshed since it is a single request. Live feeds are
+    downloaded only for games that have started and are not stored as `Final`
+    yet, and standings are refreshed until every game of the season is final.
+    Each game is committed as soon as it arrives, so re-running an interrupted
+    sync only fetches the games it had not stored.
+
+    :param api: the API wrapper used for every request
+    :param warehouse: the warehouse we want to update
+    :param season: the start year of the season we want to sync
+    :param game_types: only sync games of these types (e.g. `R`, `P`),
+        defaults to every game
+    :param max_workers: the maximum number of live feeds in flight at once,
+        defaults to 10
+    :return: summary of how many games were synced and which ones failed
+    """
+    season_id = f"{season}{season + 1}"
+    report = SyncReport()
+    if not warehouse.has_rows("seasons", season_id=season_id):
+        warehouse.write_seasons(api.seasons())
+    warehouse.write_schedule(api.schedule(season=season))
+    pending = warehouse.pending_games(season_id, game_types)
+    logger.info("Syncing %s games of season %s", len(pending), season_id)
+    for result in api.fetch_games(pending, max_workers=max_workers):
+        if not result.ok:
+            report.failed[result.key] = result.error
+            continue
+        warehouse.write_game(result.value)
+        report.games_synced += 1
+    standings_stored = warehouse.has_rows("standings", season=season_id)
+    if not (standings_stored and warehouse.is_season_final(season_id)):
+        warehouse.write_standings(season_id, api.standings(season_start=season))
+    logger.info(
+        "Synced %s games of season %s, %s failed",
+        report.games_synced,
+        season_id,
+        len(report.failed),
+    )
+    return report
@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+
+from nhl_data.api.bulk import FetchResult, amap_concurrent, map_concurrent
+
+
+def square(x):
+    if x < 0:
+        raise ValueError(x)
+    return x * x
+
+
+async def async_square(x):
+    await asyncio.sleep(0)
+    return square(x)
+
+
+def test_map_concurrent():
+    results = {r.key: r for r in map_concurrent(square, range(5), max_workers=2)}
+    assert {k: r.value for k, r in results.items()} == {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
+    assert all(r.ok for r in results.values())
+
+
+def test_map_concurrent_reports_failures():
+    results = {r.key: r for r in map_concurrent(square, [1, -1, 2], max_workers=2)}
+    assert not results[-1].ok
+    assert isinstance(results[-1].error, ValueError)
+    assert results[1] == FetchResult(1, value=1)
+    assert results[2] == FetchResult(2, value=4)
+
+
+def test_map_concurrent_is_parallel():
+    def slow(x):
+        time.sleep(0.05)
+        return x
+
+    start = time.perf_counter()
+    results = list(map_concurrent(slow, range(20), max_workers=10))
+    assert time.perf_counter() - start < 0.5
+    assert len(results) == 20
+
+
+def test_map_concurrent_consumes_keys_lazily():
+    consumed = []
+
+    def keys():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = map_concurrent(square, keys(), max_workers=2)
+    next(results)
+    results.close()
+    assert len(consumed) <= 4
+
+
+@pytest.mark.asyncio
+async def test_amap_concurrent():
+    results = [r async for r in amap_concurrent(async_square, [1, -1, 3], 2)]
+    assert {r.key: r.value for r in results if r.ok} == {1: 1, 3: 9}
+    assert [r.key for r in results if not r.ok] == [-1]
+
+
+@pytest.mark.asyncio
+async def test_amap_concurrent_is_bounded():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def track(x):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return x
+
+    results = [r async for r in amap_concurrent(track, range(20), 4)]
+    assert len(results) == 20
+    assert max_in_flight == 4
@@ -0,0 +1,245 @@
+import gzip
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from nhl_data.api.cache import (
+    FOREVER,
+    CachedResponse,
+    CachePolicy,
+    CacheRule,
+    MemoryCache,
+    ResponseCache,
+    SqliteCache,
+    ValidatorCache,
+)
+from nhl_data.api.decoding import response_json
+from nhl_data.api.http_client import HttpClient, HttpClientAsync
+
+TEST_URL = "https://testing.com"
+
+
+def entry(expires):
+    return CachedResponse(200, [("content-type", "application/json")], b"{}", expires)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache()
+    return SqliteCache(tmp_path / "cache.sqlite")
+
+
+def test_backend_round_trip(backend):
+    stored = entry(time.time() + 60)
+    backend.set("key", stored)
+    assert backend.get("key") == stored
+    assert backend.get("other") is None
+
+
+def test_backend_forever(backend):
+    backend.set("key", entry(FOREVER))
+    assert backend.get("key").expires == FOREVER
+
+
+def test_backend_expired(backend):
+    backend.set("key", entry(time.time() - 1))
+    assert backend.get("key") is None
+
+
+def test_backend_clear(backend):
+    backend.set("key", entry(FOREVER))
+    backend.clear()
+    assert backend.get("key") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", entry(FOREVER))
+    cache.set("b", entry(FOREVER))
+    cache.get("a")
+    cache.set("c", entry(FOREVER))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "body", "expected"),
+    [
+        ("/seasons", [], 24 * 60 * 60),
+        ("/statTypes", [], 24 * 60 * 60),
+        ("/draft/2000", {}, FOREVER),
+        ("/draft/9999", {}, 60 * 60),
+        (
+            "/game/1/feed/live",
+            {"gameData": {"status": {"abstractGameState": "Final"}}},
+            FOREVER,
+        ),
+        (
+            "/game/1/feed/live",
+            {"gameData": {"status": {"abstractGameState": "Live"}}},
+            None,
+        ),
+        ("/teams", {}, None),
+    ],
+)
+def test_default_policy(endpoint, body, expected):
+    response = httpx.Response(status_code=200, json=body)
+    assert CachePolicy().ttl_for(endpoint, response) == expected
+
+
+def test_http_client_serves_from_cache():
+    cache = ResponseCache(policy=CachePolicy([CacheRule(r"/seasons", 60)]))
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(
+        status_code=200, json={"seasons": []}
+    )
+    with HttpClient(TEST_URL, cache=cache) as c:
+        c.client = mock_client
+        first = c.get("/seasons")
+        second = c.get("/seasons")
+        c.get("/seasons", {"season": "20222023"})
+    assert mock_client.request.call_count == 2
+    assert first.json() == second.json() == {"seasons": []}
+    assert cache.stats() == {"hits": 1, "misses": 2}
+
+
+def test_http_client_replays_gzip_response(backend):
+    body = json.dumps({"seasons": [{"seasonId": "20222023"}]}).encode()
+    compressed = gzip.compress(body)
+    cache = ResponseCache(backend, CachePolicy([CacheRule(r"/seasons", 60)]))
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(
+        status_code=200,
+        headers={"Content-Encoding": "gzip", "Content-Length": str(len(compressed))},
+        content=compressed,
+    )
+    with HttpClient(TEST_URL, cache=cache) as c:
+        c.client = mock_client
+        first = c.get("/seasons")
+        second = c.get("/seasons")
+    assert mock_client.request.call_count == 1
+    assert second.content == first.content == body
+    assert "content-encoding" not in second.headers
+    assert second.headers["content-length"] == str(len(body))
+
+
+def test_http_client_skips_uncacheable_responses():
+    cache = ResponseCache()
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(status_code=200, json={})
+    with HttpClient(TEST_URL, cache=cache) as c:
+        c.client = mock_client
+        c.get("/teams")
+        c.get("/teams")
+    assert mock_client.request.call_count == 2
+    assert cache.hits == 0
+
+
+def test_validator_cache_headers():
+    validators = ValidatorCache()
+    response = httpx.Response(
+        status_code=200,
+        headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Mar 2023 00:00:00 GMT"},
+        json={},
+    )
+    assert validators.headers("GET", TEST_URL) == {}
+    validators.resolve("GET", TEST_URL, None, response)
+    assert validators.headers("GET", TEST_URL) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Mar 2023 00:00:00 GMT",
+    }
+    assert validators.headers("GET", TEST_URL, {"season": 1}) == {}
+
+
+def test_validator_cache_ignores_responses_without_validators():
+    validators = ValidatorCache()
+    validators.resolve("GET", TEST_URL, None, httpx.Response(200, json={}))
+    assert validators.headers("GET", TEST_URL) == {}
+
+
+def test_http_client_replays_not_modified():
+    validators = ValidatorCache()
+    mock_client = Mock()
+    mock_client.request.side_effect = [
+        httpx.Response(status_code=200, headers={"ETag": '"v1"'}, json={"a": 1}),
+        httpx.Response(status_code=304),
+    ]
+    with HttpClient(TEST_URL, validators=validators) as c:
+        c.client = mock_client
+        first = c.get("/standings")
+        body = response_json(first)
+        second = c.get("/standings")
+    assert mock_client.request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert second is first
+    assert response_json(second) is body
+    assert validators.revalidated == 1
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_replays_not_modified():
+    validators = ValidatorCache()
+    mock_client = AsyncMock()
+    mock_client.request.side_effect = [
+        httpx.Response(status_code=200, headers={"ETag": '"v1"'}, json={"a": 1}),
+        httpx.Response(status_code=304),
+    ]
+    async with HttpClientAsync(TEST_URL, validators=validators) as c:
+        c.client = mock_client
+        first = await c.get("/standings")
+        second = await c.get("/standings")
+    assert second is first
+
+
+def test_http_client_refetches_when_validated_response_was_evicted():
+    validators = ValidatorCache(maxsize=1)
+    responses = [
+        httpx.Response(status_code=200, headers={"ETag": '"v1"'}, json={"a": 1}),
+        httpx.Response(status_code=304),
+        httpx.Response(status_code=200, headers={"ETag": '"v2"'}, json={"a": 2}),
+    ]
+
+    def request(method, endpoint, **kwargs):
+        response = responses.pop(0)
+        if response.status_code == 304:
+            # another url pushes the entry out while the request is in flight
+            other = httpx.Response(200, headers={"ETag": '"t"'})
+            validators.resolve("GET", f"{TEST_URL}/teams", None, other)
+        return response
+
+    mock_client = Mock()
+    mock_client.request.side_effect = request
+    with HttpClient(TEST_URL, validators=validators) as c:
+        c.client = mock_client
+        c.get("/standings")
+        response = c.get("/standings")
+    assert response_json(response) == {"a": 2}
+    calls = mock_client.request.call_args_list
+    assert calls[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert calls[2].kwargs["headers"] is None
+
+
+def test_validator_cache_unknown_not_modified():
+    validators = ValidatorCache()
+    assert validators.resolve("GET", TEST_URL, None, httpx.Response(304)) is None
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_refetches_when_validated_response_was_evicted():
+    validators = ValidatorCache()
+    mock_client = AsyncMock()
+    mock_client.request.side_effect = [
+        httpx.Response(status_code=200, headers={"ETag": '"v1"'}, json={"a": 1}),
+        httpx.Response(status_code=304),
+        httpx.Response(status_code=200, json={"a": 2}),
+    ]
+    async with HttpClientAsync(TEST_URL, validators=validators) as c:
+        c.client = mock_client
+        await c.get("/standings")
+        validators._entries.clear()
+        response = await c.get("/standings")
+    assert response_json(response) == {"a": 2}
+    assert mock_client.request.call_count == 3
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nhl_data.api.coalescing import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_result():
+    flight = SingleFlight()
+    calls = 0
+    started = threading.Event()
+
+    def call():
+        nonlocal calls
+        calls += 1
+        started.set()
+        time.sleep(0.05)
+        return object()
+
+    with ThreadPoolExecutor(5) as executor:
+        leader = executor.submit(flight.do, "key", call)
+        started.wait()
+        followers = [executor.submit(flight.do, "key", call) for _ in range(4)]
+        results = [f.result() for f in [leader, *followers]]
+    assert calls == 1
+    assert flight.coalesced == 4
+    assert all(result is results[0] for result in results)
+
+
+def test_single_flight_shares_error():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def call():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, "key", call)
+        started.wait()
+        follower = executor.submit(flight.do, "key", call)
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_single_flight_runs_again_once_finished():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.do("other", lambda: 3) == 3
+    assert flight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight():
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*[flight.do("key", call) for _ in range(5)])
+    assert results == [1] * 5
+    assert flight.coalesced == 4
+    assert await flight.do("key", call) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_survives_cancelled_caller():
+    flight = AsyncSingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("key", call))
+    follower = asyncio.ensure_future(flight.do("key", call))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "done"
@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from nhl_data.api.decoding import (
+    DECODERS,
+    get_json_decoder,
+    response_json,
+    set_json_decoder,
+)
+
+BODY = {"teams": [{"id": 1, "name": "Team", "active": True, "ratio": 0.5}]}
+
+
+@pytest.fixture(autouse=True)
+def restore_decoder():
+    decoder = get_json_decoder()
+    yield
+    set_json_decoder(decoder)
+
+
+def test_default_decoder_is_fastest_installed():
+    assert get_json_decoder() is next(iter(DECODERS.values()))
+    assert "json" in DECODERS
+
+
+@pytest.mark.parametrize("name", DECODERS)
+def test_decoders(name):
+    set_json_decoder(name)
+    assert response_json(httpx.Response(200, json=BODY)) == BODY
+
+
+def test_set_json_decoder_callable():
+    set_json_decoder(lambda content: {"decoded": content})
+    assert response_json(httpx.Response(200, content=b"{}")) == {"decoded": b"{}"}
+
+
+def test_set_json_decoder_unknown():
+    decoder = get_json_decoder()
+    with pytest.raises(ValueError):
+        set_json_decoder("simplejson")
+    assert get_json_decoder() is decoder
+
+
+def test_response_json_is_memoized():
+    response = httpx.Response(200, json=BODY)
+    assert response_json(response) is response_json(response)
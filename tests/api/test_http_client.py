@@ -1,4 +1,6 @@
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, Mock
 
 import httpx
@@ -105,3 +107,54 @@ def test_status_error_dont_raise_exception(status):
     with HttpClient(TEST_URL, raise_status_errors=False) as c:
         val = c._handle_response(response)
     assert val.json() == data
+
+
+def test_close():
+    mock_client = Mock()
+    c = HttpClient(TEST_URL)
+    c.client = mock_client
+    c.close()
+    mock_client.close.assert_called_once()
+
+
+def test_pool_limits():
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    with HttpClient(TEST_URL, limits=limits) as c:
+        pool = c.client._transport._pool
+    assert pool._max_connections == 1
+    assert pool._max_keepalive_connections == 1
+
+
+def test_coalesce_concurrent_gets():
+    calls = 0
+
+    def mock_request(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return httpx.Response(status_code=200, json={})
+
+    mock_client = Mock()
+    mock_client.request.side_effect = mock_request
+    with HttpClient(TEST_URL, coalesce=True) as c:
+        c.client = mock_client
+        with ThreadPoolExecutor(4) as executor:
+            responses = list(executor.map(lambda _: c.get("/", {"a": 1}), range(4)))
+            assert c.get("/", {"a": 2}).status_code == 200
+    assert calls == 2
+    assert all(response is responses[0] for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_async_coalesce_only_gets():
+    async def mock_request(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code=200, json={})
+
+    mock_client = AsyncMock()
+    mock_client.request.side_effect = mock_request
+    async with HttpClientAsync(TEST_URL, coalesce=True) as c:
+        c.client = mock_client
+        await asyncio.gather(*[c.get("/") for _ in range(5)])
+        await asyncio.gather(*[c.request("POST", "/") for _ in range(5)])
+    assert mock_client.request.call_count == 6
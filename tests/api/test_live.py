@@ -0,0 +1,202 @@
+from unittest.mock import Mock
+
+import pytest
+
+from nhl_data.api.live import LiveGameTracker, apply_json_patch
+from nhl_data.models.game import Game, Play
+
+
+def feed(*events, timestamp="20230101_000000", state="Live"):
+    return {
+        "metaData": {"timeStamp": timestamp},
+        "gameData": {"game": {"pk": 1}, "status": {"abstractGameState": state}},
+        "liveData": {"plays": {"allPlays": [{"result": {"event": e}} for e in events]}},
+    }
+
+
+def play_patch(index, event):
+    return {
+        "op": "add",
+        "path": f"/liveData/plays/allPlays/{index}",
+        "value": {"result": {"event": event}},
+    }
+
+
+def play(event_id, event):
+    return {"about": {"eventId": event_id}, "result": {"event": event}}
+
+
+def timestamp_patch(timestamp):
+    return {"op": "replace", "path": "/metaData/timeStamp", "value": timestamp}
+
+
+@pytest.mark.parametrize(
+    ("operations", "expected"),
+    [
+        ([{"op": "add", "path": "/a/b", "value": 1}], {"a": {"b": 1}, "l": [1]}),
+        ([{"op": "replace", "path": "/l/0", "value": 2}], {"a": {}, "l": [2]}),
+        ([{"op": "add", "path": "/l/-", "value": 2}], {"a": {}, "l": [1, 2]}),
+        ([{"op": "add", "path": "/l/0", "value": 0}], {"a": {}, "l": [0, 1]}),
+        ([{"op": "remove", "path": "/l/0"}], {"a": {}, "l": []}),
+        ([{"op": "remove", "path": "/a"}], {"l": [1]}),
+        ([{"op": "add", "path": "/a/x~1y", "value": 1}], {"a": {"x/y": 1}, "l": [1]}),
+    ],
+)
+def test_apply_json_patch(operations, expected):
+    document = {"a": {}, "l": [1]}
+    apply_json_patch(document, operations)
+    assert document == expected
+
+
+def test_apply_json_patch_unsupported():
+    with pytest.raises(ValueError, match="move"):
+        apply_json_patch({"a": 1}, [{"op": "move", "path": "/a", "from": "/b"}])
+
+
+def test_first_poll_downloads_full_feed():
+    api = Mock()
+    api.get.return_value = feed("Start", "Faceoff")
+    tracker = LiveGameTracker(api, 1)
+    assert tracker.poll() == [Play(event="Start"), Play(event="Faceoff")]
+    api.get.assert_called_once_with("/game/1/feed/live")
+    assert tracker.game == Game(
+        pk=1,
+        abstract_game_state="Live",
+        all_plays=[Play(event="Start"), Play(event="Faceoff")],
+    )
+
+
+def test_poll_applies_diff_patch():
+    api = Mock()
+    api.get.side_effect = [
+        feed("Start"),
+        [{"diff": [timestamp_patch("20230101_000100"), play_patch(1, "Shot")]}],
+        [],
+    ]
+    tracker = LiveGameTracker(api, 1)
+    tracker.poll()
+    assert tracker.poll() == [Play(event="Shot")]
+    api.get.assert_called_with(
+        "/game/1/feed/live/diffPatch",
+        url_parameters={"startTimecode": "20230101_000000"},
+    )
+    assert tracker.timecode == "20230101_000100"
+    assert tracker.poll() == []
+    assert tracker.game.all_plays == [Play(event="Start"), Play(event="Shot")]
+
+
+def test_poll_reparses_corrected_plays():
+    api = Mock()
+    api.get.side_effect = [
+        feed("Start", "Shot"),
+        [
+            {
+                "diff": [
+                    {
+                        "op": "replace",
+                        "path": "/liveData/plays/allPlays/1/result/event",
+                        "value": "Goal",
+                    }
+                ]
+            }
+        ],
+    ]
+    tracker = LiveGameTracker(api, 1)
+    tracker.poll()
+    assert tracker.poll() == []
+    assert tracker.plays == [Play(event="Start"), Play(event="Goal")]
+
+
+def test_poll_resyncs_when_plays_are_removed():
+    api = Mock()
+    api.get.side_effect = [
+        feed("Start", "Shot", "Goal"),
+        [{"diff": [{"op": "remove", "path": "/liveData/plays/allPlays/1"}]}],
+    ]
+    tracker = LiveGameTracker(api, 1)
+    tracker.poll()
+    assert tracker.poll() == []
+    assert tracker.plays == [Play(event="Start"), Play(event="Goal")]
+
+
+def test_poll_returns_plays_inserted_before_known_ones():
+    api = Mock()
+    api.get.side_effect = [
+        {"liveData": {"plays": {"allPlays": [play(1, "Start"), play(3, "Goal")]}}},
+        [
+            {
+                "diff": [
+                    {
+                        "op": "add",
+                        "path": "/liveData/plays/allPlays/1",
+                        "value": play(2, "Shot"),
+                    }
+                ]
+            }
+        ],
+    ]
+    tracker = LiveGameTracker(api, 1)
+    tracker.poll()
+    assert [p.event for p in tracker.poll()] == ["Shot"]
+    assert [p.event for p in tracker.plays] == ["Start", "Shot", "Goal"]
+
+
+@pytest.mark.parametrize(
+    ("path", "value"),
+    [
+        ("/liveData", {"plays": {"allPlays": [play(1, "Faceoff"), play(2, "Shot")]}}),
+        ("/liveData/plays", {"allPlays": [play(1, "Faceoff"), play(2, "Shot")]}),
+        (
+            "",
+            {
+                "liveData": {
+                    "plays": {"allPlays": [play(1, "Faceoff"), play(2, "Shot")]}
+                }
+            },
+        ),
+    ],
+)
+def test_poll_resyncs_when_a_parent_of_all_plays_is_replaced(path, value):
+    api = Mock()
+    api.get.side_effect = [
+        {"liveData": {"plays": {"allPlays": [play(1, "Start")]}}},
+        [{"diff": [{"op": "replace", "path": path, "value": value}]}],
+    ]
+    tracker = LiveGameTracker(api, 1)
+    tracker.poll()
+    assert [p.event for p in tracker.poll()] == ["Shot"]
+    assert [p.event for p in tracker.plays] == ["Faceoff", "Shot"]
+
+
+def test_is_final_before_first_poll():
+    assert not LiveGameTracker(Mock(), 1).is_final
+
+
+def test_poll_resets_on_full_feed():
+    api = Mock()
+    api.get.side_effect = [feed("Start"), feed("Start", "Shot")]
+    tracker = LiveGameTracker(api, 1)
+    tracker.poll()
+    assert tracker.poll() == [Play(event="Start"), Play(event="Shot")]
+
+
+def test_follow_stops_when_final(monkeypatch):
+    monkeypatch.setattr("nhl_data.api.live.time.sleep", lambda _: None)
+    api = Mock()
+    api.get.side_effect = [
+        feed("Start"),
+        [
+            {
+                "diff": [
+                    play_patch(1, "Game End"),
+                    {
+                        "op": "replace",
+                        "path": "/gameData/status/abstractGameState",
+                        "value": "Final",
+                    },
+                ]
+            }
+        ],
+    ]
+    tracker = LiveGameTracker(api, 1)
+    assert [p.event for p in tracker.follow()] == ["Start", "Game End"]
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from nhl_data.api.metadata import MetadataRegistry
+
+
+def test_fetch_loads_once():
+    registry = MetadataRegistry()
+    load = Mock(return_value=[{"displayName": "goals"}])
+    assert registry.fetch("/statTypes", load) == [{"displayName": "goals"}]
+    assert registry.fetch("/statTypes", load) == [{"displayName": "goals"}]
+    load.assert_called_once()
+
+
+def test_stale_entry_is_served_while_refreshing():
+    registry = MetadataRegistry(max_age=60)
+    registry.set("/statTypes", ["old"], fetched_at=time.time() - 120)
+    load = Mock(return_value=["new"])
+    assert registry.fetch("/statTypes", load) == ["old"]
+    for _ in range(100):
+        if registry.get("/statTypes") == ["new"]:
+            break
+        time.sleep(0.01)
+    assert registry.get("/statTypes") == ["new"]
+    assert not registry.is_stale("/statTypes")
+    load.assert_called_once()
+
+
+def test_failed_refresh_keeps_entry():
+    registry = MetadataRegistry(max_age=0)
+    registry.set("/seasons", {"seasons": []}, fetched_at=1)
+    registry._refresh("/seasons", Mock(side_effect=ValueError("failed")))
+    assert registry.get("/seasons") == {"seasons": []}
+    assert registry._begin_refresh("/seasons")
+
+
+@pytest.mark.asyncio
+async def test_afetch():
+    registry = MetadataRegistry(max_age=60)
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        return [calls]
+
+    assert await registry.afetch("/standingsTypes", load) == [1]
+    assert await registry.afetch("/standingsTypes", load) == [1]
+    registry.set("/standingsTypes", [1], fetched_at=time.time() - 120)
+    assert await registry.afetch("/standingsTypes", load) == [1]
+    await asyncio.gather(*registry._tasks)
+    assert registry.get("/standingsTypes") == [2]
+
+
+def test_snapshot(tmp_path):
+    path = tmp_path / "metadata.json"
+    registry = MetadataRegistry(snapshot=path)
+    registry.fetch("/leagueLeaderTypes", lambda: [{"displayName": "assists"}])
+    assert path.exists()
+
+    restored = MetadataRegistry(snapshot=path)
+    load = Mock()
+    assert restored.fetch("/leagueLeaderTypes", load) == [{"displayName": "assists"}]
+    load.assert_not_called()
@@ -0,0 +1,369 @@
+import asyncio
+import email.utils
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from nhl_data.api.http_client import HttpClient, HttpClientAsync, HttpServerError
+from nhl_data.api.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgePolicy,
+    RateLimiter,
+    RetryPolicy,
+    TimeoutPolicy,
+    TimeoutRule,
+)
+
+TEST_URL = "https://testing.com"
+
+
+def test_should_retry():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry("GET", 0, response=httpx.Response(503))
+    assert policy.should_retry("GET", 1, error=httpx.ConnectTimeout("timeout"))
+    assert not policy.should_retry("GET", 2, response=httpx.Response(503))
+    assert not policy.should_retry("GET", 0, response=httpx.Response(404))
+    assert not policy.should_retry("GET", 0, error=ValueError("bug"))
+    assert not policy.should_retry("POST", 0, response=httpx.Response(503))
+
+
+def test_delay_backoff():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+    jittered = RetryPolicy(backoff=1, max_backoff=5)
+    assert all(0 <= jittered.delay(3) <= 5 for _ in range(100))
+
+
+def test_delay_retry_after():
+    policy = RetryPolicy(max_backoff=60)
+    response = httpx.Response(429, headers={"Retry-After": "7"})
+    assert policy.delay(0, response) == 7
+    retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+    response = httpx.Response(503, headers={"Retry-After": retry_at})
+    assert 25 < policy.delay(0, response) <= 30
+    assert RetryPolicy(max_backoff=2).delay(0, response) == 2
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=100, burst=2)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async():
+    limiter = RateLimiter(rate=100)
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.aacquire() for _ in range(11)])
+    assert time.monotonic() - start >= 0.09
+
+
+def test_rate_limiter_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_request_retries():
+    mock_client = Mock()
+    mock_client.request.side_effect = [
+        httpx.ConnectError("refused"),
+        httpx.Response(503),
+        httpx.Response(200, json={}),
+    ]
+    with HttpClient(TEST_URL, retry=RetryPolicy(backoff=0)) as c:
+        c.client = mock_client
+        assert c.request("GET", "/").status_code == 200
+    assert mock_client.request.call_count == 3
+
+
+def test_request_retries_exhausted():
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(503)
+    with HttpClient(TEST_URL, retry=RetryPolicy(max_retries=2, backoff=0)) as c:
+        c.client = mock_client
+        with pytest.raises(HttpServerError):
+            c.request("GET", "/")
+    assert mock_client.request.call_count == 3
+
+
+def test_request_without_retry():
+    mock_client = Mock()
+    mock_client.request.side_effect = httpx.ConnectError("refused")
+    with HttpClient(TEST_URL) as c:
+        c.client = mock_client
+        with pytest.raises(httpx.ConnectError):
+            c.request("GET", "/")
+    assert mock_client.request.call_count == 1
+
+
+def test_request_rate_limited():
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(200, json={})
+    limiter = Mock(wraps=RateLimiter(rate=1000))
+    with HttpClient(TEST_URL, rate_limiter=limiter) as c:
+        c.client = mock_client
+        c.request("GET", "/")
+        c.request("GET", "/")
+    assert limiter.acquire.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_request_retries():
+    mock_client = AsyncMock()
+    mock_client.request.side_effect = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={}),
+    ]
+    limiter = RateLimiter(rate=1000)
+    async with HttpClientAsync(
+        TEST_URL, retry=RetryPolicy(), rate_limiter=limiter
+    ) as c:
+        c.client = mock_client
+        response = await c.request("GET", "/")
+    assert response.status_code == 200
+    assert mock_client.request.call_count == 2
+
+
+def test_timeout_policy():
+    policy = TimeoutPolicy([TimeoutRule(r"/game/\d+/feed/live", 3)], default=5)
+    assert policy.timeout_for("/game/1/feed/live") == 3
+    assert policy.timeout_for("/teams") == 5
+    assert TimeoutPolicy().timeout_for("/teams") is None
+
+
+def test_request_uses_endpoint_timeout():
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(200, json={})
+    timeouts = TimeoutPolicy([TimeoutRule(r"/teams", 2)])
+    with HttpClient(TEST_URL, timeouts=timeouts) as c:
+        c.client = mock_client
+        c.request("GET", "/teams")
+        c.request("GET", "/seasons")
+    assert mock_client.request.call_args_list[0].kwargs["timeout"] == 2
+    assert "timeout" not in mock_client.request.call_args_list[1].kwargs
+
+
+def test_circuit_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=0.05)
+    breaker.before_request()
+    breaker.record(response=httpx.Response(500))
+    breaker.record(response=httpx.Response(200))
+    breaker.record(error=httpx.ConnectError("refused"))
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record(response=httpx.Response(503))
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    time.sleep(0.05)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record(response=httpx.Response(200))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_reopens_after_failed_trial():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+    breaker.record(response=httpx.Response(500))
+    time.sleep(0.05)
+    breaker.before_request()
+    breaker.record(error=httpx.ReadTimeout("timeout"))
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_request_fails_fast_when_circuit_open():
+    mock_client = Mock()
+    mock_client.request.return_value = httpx.Response(503)
+    breaker = CircuitBreaker(failure_threshold=2)
+    with HttpClient(
+        TEST_URL, retry=RetryPolicy(max_retries=5, backoff=0), circuit_breaker=breaker
+    ) as c:
+        c.client = mock_client
+        with pytest.raises(CircuitOpenError):
+            c.request("GET", "/")
+    assert mock_client.request.call_count == 2
+
+
+def test_hedge_delay():
+    policy = HedgePolicy(quantile=0.9, initial_delay=2, min_samples=10)
+    assert policy.delay() == 2
+    for latency in range(1, 11):
+        policy.record(latency / 10)
+    assert policy.delay() == 1.0
+
+
+def slow_then_fast(responses: list):
+    calls = []
+
+    def call():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return responses[0]
+        return responses[1]
+
+    return call, calls
+
+
+def test_hedge_run():
+    policy = HedgePolicy(initial_delay=0.01)
+    call, calls = slow_then_fast([httpx.Response(200), httpx.Response(201)])
+    start = time.monotonic()
+    assert policy.run(call).status_code == 201
+    assert time.monotonic() - start < 0.4
+    assert len(calls) == 2 and policy.hedged == 1
+
+
+def test_hedge_run_fast_request_is_not_hedged():
+    policy = HedgePolicy(initial_delay=1)
+    assert policy.run(lambda: httpx.Response(200)).status_code == 200
+    assert policy.hedged == 0
+
+
+def test_hedge_run_all_failed():
+    policy = HedgePolicy(initial_delay=0)
+
+    def call():
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        policy.run(call)
+
+
+def test_hedge_records_only_successful_latencies():
+    policy = HedgePolicy(initial_delay=1)
+    policy.run(lambda: httpx.Response(503))
+    policy.run(lambda: httpx.Response(200))
+    assert len(policy._latencies) == 1
+
+
+def test_hedge_close_releases_threads():
+    policy = HedgePolicy(initial_delay=1)
+    policy.run(lambda: httpx.Response(200))
+    executor = policy._executor
+    policy.close()
+    assert policy._executor is None and executor._shutdown
+    assert policy.run(lambda: httpx.Response(200)).status_code == 200
+    policy.close()
+
+
+def test_http_client_close_closes_hedging():
+    hedging = Mock(wraps=HedgePolicy())
+    with HttpClient(TEST_URL, hedging=hedging):
+        pass
+    hedging.close.assert_called_once()
+
+
+def test_hedged_duplicate_waits_on_rate_limiter():
+    mock_client = Mock()
+    responses = iter([0.5, 0])
+
+    def request(*args, **kwargs):
+        time.sleep(next(responses))
+        return httpx.Response(200, json={})
+
+    mock_client.request.side_effect = request
+    limiter = Mock(wraps=RateLimiter(rate=1000, burst=2))
+    hedging = HedgePolicy(initial_delay=0.01)
+    with HttpClient(TEST_URL, rate_limiter=limiter, hedging=hedging) as c:
+        c.client = mock_client
+        assert c.get("/").status_code == 200
+    assert hedging.hedged == 1
+    assert limiter.acquire.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_arun():
+    policy = HedgePolicy(initial_delay=0.01)
+    calls = []
+
+    async def call():
+        calls.append(None)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    response = await asyncio.wait_for(policy.arun(call), timeout=1)
+    assert response.status_code == 200
+    assert policy.hedged == 1
+
+
+@pytest.mark.asyncio
+async def test_async_request_hedged():
+    mock_client = AsyncMock()
+    mock_client.request.return_value = httpx.Response(200, json={})
+    hedging = HedgePolicy(initial_delay=1)
+    async with HttpClientAsync(TEST_URL, hedging=hedging) as c:
+        c.client = mock_client
+        response = await c.request("GET", "/")
+    assert response.status_code == 200
+    assert mock_client.request.call_count == 1
+    assert hedging.hedged == 0
+
+
+def flaky_transport(*responses):
+    responses = iter(responses)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_stream_retries_before_first_byte():
+    transport, calls = flaky_transport(
+        httpx.ConnectError("refused"),
+        httpx.Response(503),
+        httpx.Response(200, content=b"ok"),
+    )
+    timeouts = TimeoutPolicy([TimeoutRule(r"/game", 2)])
+    with HttpClient(TEST_URL, retry=RetryPolicy(backoff=0), timeouts=timeouts) as c:
+        c.client = httpx.Client(base_url=TEST_URL, transport=transport)
+        with c.stream("GET", "/game") as response:
+            assert b"".join(response.iter_bytes()) == b"ok"
+    assert len(calls) == 3
+    assert calls[-1].extensions["timeout"]["read"] == 2
+
+
+def test_stream_fails_fast_when_circuit_open():
+    transport, calls = flaky_transport(httpx.Response(503), httpx.Response(503))
+    breaker = CircuitBreaker(failure_threshold=2)
+    with HttpClient(
+        TEST_URL, retry=RetryPolicy(max_retries=5, backoff=0), circuit_breaker=breaker
+    ) as c:
+        c.client = httpx.Client(base_url=TEST_URL, transport=transport)
+        with pytest.raises(CircuitOpenError):
+            with c.stream("GET", "/"):
+                pass
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_stream_retries_before_first_byte():
+    transport, calls = flaky_transport(
+        httpx.Response(503), httpx.Response(200, content=b"ok")
+    )
+    breaker = CircuitBreaker()
+    async with HttpClientAsync(
+        TEST_URL, retry=RetryPolicy(backoff=0), circuit_breaker=breaker
+    ) as c:
+        c.client = httpx.AsyncClient(base_url=TEST_URL, transport=transport)
+        async with c.stream("GET", "/") as response:
+            assert b"".join([chunk async for chunk in response.aiter_bytes()]) == b"ok"
+    assert len(calls) == 2
+    assert breaker.state == CircuitBreaker.CLOSED
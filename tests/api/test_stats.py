@@ -1,8 +1,13 @@
+import asyncio
+import threading
 from unittest.mock import patch
 
 import httpx
+import pytest
 
-from nhl_data import StatsNhlApi
+from nhl_data import AsyncStatsNhlApi, StatsNhlApi
+from nhl_data.api.metadata import MetadataRegistry
+from nhl_data.models import Game, LazyGame, Person, ScheduleDate, Team
 
 
 @patch("nhl_data.api.http_client.HttpClient.request")
@@ -23,3 +28,321 @@ def test_get(mock_request):
     api = StatsNhlApi()
     response = api.get("/")
     assert response == {"random_key": "random_value"}
+
+
+@patch("nhl_data.api.http_client.HttpClient.get")
+def test_client_reused_between_requests(mock_request):
+    mock_request.return_value = httpx.Response(status_code=200, json={})
+    with StatsNhlApi() as api:
+        client = api.client
+        api.get("/")
+        api.get("/")
+        assert api.client is client
+    assert client.client.is_closed
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.http_client.HttpClientAsync.request")
+async def test_async_request(mock_request):
+    mock_request.return_value = httpx.Response(
+        status_code=200, json={"random_key": "random_value"}
+    )
+    async with AsyncStatsNhlApi() as api:
+        response = await api.request("GET", "/")
+    assert response == {"random_key": "random_value"}
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.http_client.HttpClientAsync.get")
+async def test_async_game(mock_request):
+    mock_request.return_value = httpx.Response(
+        status_code=200, json={"gameData": {"game": {"pk": 2000020001}}}
+    )
+    async with AsyncStatsNhlApi() as api:
+        response = await api.game(2000020001)
+    assert response == Game(pk=2000020001)
+    mock_request.assert_called_once_with("/game/2000020001/feed/live", None)
+
+
+@pytest.mark.asyncio
+async def test_async_concurrency_is_bounded():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_request(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(status_code=200, json={})
+
+    async with AsyncStatsNhlApi(max_concurrency=3) as api:
+        with patch.object(api.client.client, "request", side_effect=mock_request):
+            await asyncio.gather(*[api.get(f"/{i}") for i in range(10)])
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_async_coalesced_requests_do_not_hold_slots():
+    calls = 0
+
+    async def mock_request(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code=200, json={"calls": calls})
+
+    async with AsyncStatsNhlApi(max_concurrency=2, coalesce=True) as api:
+        with patch.object(api.client.client, "request", side_effect=mock_request):
+            results = await asyncio.gather(*[api.get("/") for _ in range(20)])
+    assert calls == 1
+    assert results == [{"calls": 1}] * 20
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_lazy_game(mock_get):
+    mock_get.return_value = {"gameData": {"game": {"pk": 1}}}
+    with StatsNhlApi() as api:
+        game = api.game(1, lazy=True)
+    assert isinstance(game, LazyGame)
+    assert game.pk == 1
+
+
+@patch("nhl_data.api.http_client.HttpClient.get")
+def test_typed_decoding(mock_get):
+    pytest.importorskip("msgspec")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json={"gameData": {"game": {"pk": 1}}}
+    )
+    with StatsNhlApi(typed_decoding=True) as api:
+        assert api.game(1) == Game(pk=1)
+        assert isinstance(api.game(1, lazy=True), LazyGame)
+    mock_get.return_value = httpx.Response(status_code=200, json={"dates": [{}]})
+    with StatsNhlApi(typed_decoding=True) as api:
+        assert api.schedule() == [ScheduleDate()]
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_fetch_games(mock_get):
+    def get(url, url_parameters=None):
+        game_id = int(url.split("/")[2])
+        if game_id == 3:
+            raise httpx.ConnectError("failed")
+        return {"gameData": {"game": {"pk": game_id}}}
+
+    mock_get.side_effect = get
+    with StatsNhlApi() as api:
+        results = {r.key: r for r in api.fetch_games([1, 2, 3], max_workers=2)}
+    assert results[1].value == Game(pk=1)
+    assert results[2].value == Game(pk=2)
+    assert isinstance(results[3].error, httpx.ConnectError)
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.stats.AsyncStatsNhlApi.get")
+async def test_async_fetch_games(mock_get):
+    async def get(url, url_parameters=None):
+        return {"gameData": {"game": {"pk": int(url.split("/")[2])}}}
+
+    mock_get.side_effect = get
+    async with AsyncStatsNhlApi() as api:
+        results = [r async for r in api.fetch_games([1, 2])]
+    assert sorted(r.value.pk for r in results) == [1, 2]
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_many(mock_get):
+    def get(url, url_parameters=None):
+        if url == "/leagueLeaderTypes":
+            return [{"displayName": "goals"}]
+        ids = url_parameters["teamId"].split(",")
+        return {"teams": [{"id": int(x)} for x in ids if x != "99"]}
+
+    mock_get.side_effect = get
+    with StatsNhlApi() as api:
+        teams = api.teams_many([1, 2, 1, 99, 2])
+    assert teams == {1: Team(id=1), 2: Team(id=2)}
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["url_parameters"]["teamId"] == "1,2,99"
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_many_fetches_chunks_in_parallel(mock_get):
+    barrier = threading.Barrier(3, timeout=1)
+
+    def get(url, url_parameters=None):
+        barrier.wait()
+        return {"teams": [{"id": int(url_parameters["teamId"])}]}
+
+    mock_get.side_effect = get
+    with StatsNhlApi() as api, patch("nhl_data.api.stats.TEAMS_PER_REQUEST", 1):
+        teams = api.teams_many([1, 2, 3], expands=[], max_workers=3)
+    assert teams == {1: Team(id=1), 2: Team(id=2), 3: Team(id=3)}
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_many_raises_failed_chunk(mock_get):
+    mock_get.side_effect = httpx.ConnectError("failed")
+    with StatsNhlApi() as api:
+        with pytest.raises(httpx.ConnectError):
+            api.teams_many([1], expands=[])
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_many_fields_without_id(mock_get):
+    mock_get.return_value = {"teams": [{"id": x, "name": f"T{x}"} for x in (1, 2, 3)]}
+    with StatsNhlApi() as api:
+        teams = api.teams_many([1, 2, 3], expands=[], fields=["name"])
+    assert teams == {x: Team(name=f"T{x}") for x in (1, 2, 3)}
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.stats.AsyncStatsNhlApi.get")
+async def test_async_teams_many_fields_without_id(mock_get):
+    async def get(url, url_parameters=None):
+        return {"teams": [{"id": x, "name": f"T{x}"} for x in (1, 2, 3)]}
+
+    mock_get.side_effect = get
+    async with AsyncStatsNhlApi() as api:
+        teams = await api.teams_many([1, 2, 3], expands=[], fields=["name"])
+    assert teams == {x: Team(name=f"T{x}") for x in (1, 2, 3)}
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_many_empty(mock_get):
+    with StatsNhlApi() as api:
+        assert api.teams_many([]) == {}
+    mock_get.assert_not_called()
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_people_many(mock_get):
+    def get(url, url_parameters=None):
+        person_id = int(url.split("/")[2])
+        if person_id == 3:
+            raise httpx.ConnectError("failed")
+        return {"people": [{"id": person_id}]}
+
+    mock_get.side_effect = get
+    with StatsNhlApi() as api:
+        people = api.people_many([1, 2, 2, 3, 1], max_workers=2)
+    assert people == {1: Person(id=1), 2: Person(id=2)}
+    assert mock_get.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.stats.AsyncStatsNhlApi.get")
+async def test_async_many(mock_get):
+    async def get(url, url_parameters=None):
+        if url == "/leagueLeaderTypes":
+            return []
+        if url == "/teams":
+            ids = url_parameters["teamId"].split(",")
+            return {"teams": [{"id": int(x)} for x in ids]}
+        return {"people": [{"id": int(url.split("/")[2])}]}
+
+    mock_get.side_effect = get
+    async with AsyncStatsNhlApi() as api:
+        assert await api.teams_many([5, 5, 6]) == {5: Team(id=5), 6: Team(id=6)}
+        assert await api.people_many([7, 7]) == {7: Person(id=7)}
+    assert mock_get.call_count == 3
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_metadata_is_requested_once(mock_get):
+    def get(url, url_parameters=None):
+        if url == "/leagueLeaderTypes":
+            return [{"displayName": "goals"}]
+        if url == "/statTypes":
+            return [{"displayName": "yearByYear"}]
+        return {"teams": [{"id": 1}]}
+
+    mock_get.side_effect = get
+    with StatsNhlApi() as api:
+        for _ in range(3):
+            assert api.teams([1]) == [Team(id=1)]
+            assert api.stat_types() == ["yearByYear"]
+    urls = [call.args[0] for call in mock_get.call_args_list]
+    assert urls.count("/leagueLeaderTypes") == 1
+    assert urls.count("/statTypes") == 1
+    assert urls.count("/teams") == 3
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.stats.AsyncStatsNhlApi.get")
+async def test_async_metadata_shared_registry(mock_get):
+    async def get(url, url_parameters=None):
+        return [{"name": "wildCard"}]
+
+    mock_get.side_effect = get
+    registry = MetadataRegistry()
+    for _ in range(2):
+        async with AsyncStatsNhlApi(metadata=registry) as api:
+            assert await api.standing_types() == ["wildCard"]
+    mock_get.assert_called_once_with("/standingsTypes")
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_people_selective_stats(mock_get):
+    mock_get.return_value = {"people": [{"id": 1, "fullName": "A", "social": {}}]}
+    with StatsNhlApi() as api:
+        person = api.people(1, stats=["yearByYear"], fields=["id"])
+        assert person == Person(id=1)
+        mock_get.assert_called_with(
+            "/people/1", {"expand": "person.social,person.stats", "stats": "yearByYear"}
+        )
+        api.people(1, 2022, stats=[], expands=[])
+        mock_get.assert_called_with("/people/1", {"season": "20222023"})
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_selective_expands(mock_get):
+    mock_get.return_value = {"teams": [{"id": 1, "name": "Team"}]}
+    with StatsNhlApi() as api:
+        assert api.teams([1], expands=["team.record"], fields=["id"]) == [Team(id=1)]
+        mock_get.assert_called_once_with(
+            "/teams", url_parameters={"teamId": "1", "expand": "team.record"}
+        )
+        mock_get.reset_mock()
+        api.teams([1], expands=["team.leaders"], leader_categories=["goals"])
+        mock_get.assert_called_once_with(
+            "/teams",
+            url_parameters={
+                "teamId": "1",
+                "expand": "team.leaders",
+                "leaderCategories": "goals",
+            },
+        )
+
+
+@patch("nhl_data.api.stats.StatsNhlApi.get")
+def test_teams_expands_generator(mock_get):
+    mock_get.return_value = {"teams": [{"id": 1}]}
+    with StatsNhlApi() as api:
+        api.teams([1], expands=(e for e in ["team.roster"]))
+        mock_get.assert_called_once_with(
+            "/teams", url_parameters={"teamId": "1", "expand": "team.roster"}
+        )
+        mock_get.reset_mock()
+        with patch("nhl_data.api.stats.TEAMS_PER_REQUEST", 1):
+            api.teams_many([1, 2], expands=(e for e in ["team.roster"]))
+    params = [c.kwargs["url_parameters"] for c in mock_get.call_args_list]
+    assert sorted(params, key=lambda p: p["teamId"]) == [
+        {"teamId": "1", "expand": "team.roster"},
+        {"teamId": "2", "expand": "team.roster"},
+    ]
+
+
+@pytest.mark.asyncio
+@patch("nhl_data.api.stats.AsyncStatsNhlApi.get")
+async def test_async_teams_expands_generator(mock_get):
+    async def get(url, url_parameters=None):
+        return {"teams": [{"id": 1}]}
+
+    mock_get.side_effect = get
+    async with AsyncStatsNhlApi() as api:
+        await api.teams([1], expands=(e for e in ["team.roster"]))
+        await api.teams_many([1], expands=(e for e in ["team.roster"]))
+    for call in mock_get.call_args_list:
+        assert call.kwargs["url_parameters"]["expand"] == "team.roster"
@@ -0,0 +1,91 @@
+import json
+
+import httpx
+import pytest
+
+from nhl_data import AsyncStatsNhlApi, StatsNhlApi
+from nhl_data.api.http_client import HttpClientError
+from nhl_data.models import Play
+
+ijson = pytest.importorskip("ijson")
+
+from nhl_data.api.streaming import (  # noqa: E402
+    ALL_PLAYS_PREFIX,
+    aiter_json_items,
+    iter_json_items,
+)
+
+FEED = json.dumps(
+    {
+        "gameData": {"game": {"pk": 1}},
+        "liveData": {
+            "plays": {
+                "allPlays": [
+                    {"result": {"event": "Faceoff"}, "coordinates": {"x": 0.5}},
+                    {"result": {"event": "Goal"}, "about": {"period": 1}},
+                ],
+                "currentPlay": {"result": {"event": "Goal"}},
+            }
+        },
+    }
+).encode()
+
+
+def chunked(data: bytes, size: int = 7):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_iter_json_items():
+    items = list(iter_json_items(chunked(FEED), ALL_PLAYS_PREFIX))
+    assert items == [
+        {"result": {"event": "Faceoff"}, "coordinates": {"x": 0.5}},
+        {"result": {"event": "Goal"}, "about": {"period": 1}},
+    ]
+    assert isinstance(items[0]["coordinates"]["x"], float)
+
+
+def test_iter_json_items_is_incremental():
+    chunks = iter(chunked(FEED))
+    items = iter_json_items(chunks, ALL_PLAYS_PREFIX)
+    next(items)
+    assert next(chunks, None) is not None
+
+
+@pytest.mark.asyncio
+async def test_aiter_json_items():
+    async def chunks():
+        for chunk in chunked(FEED):
+            yield chunk
+
+    items = [item async for item in aiter_json_items(chunks(), ALL_PLAYS_PREFIX)]
+    assert len(items) == 2
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/game/1/feed/live"):
+        return httpx.Response(200, content=FEED)
+    return httpx.Response(404)
+
+
+def test_iter_plays():
+    with StatsNhlApi() as api:
+        api.client.client = httpx.Client(
+            base_url=api.client.base_url, transport=httpx.MockTransport(handler)
+        )
+        plays = list(api.iter_plays(1))
+        assert plays == [
+            Play(event="Faceoff", coordinates={"x": 0.5}),
+            Play(event="Goal", period=1),
+        ]
+        with pytest.raises(HttpClientError):
+            list(api.iter_plays(2))
+
+
+@pytest.mark.asyncio
+async def test_async_iter_plays():
+    async with AsyncStatsNhlApi() as api:
+        api.client.client = httpx.AsyncClient(
+            base_url=api.client.base_url, transport=httpx.MockTransport(handler)
+        )
+        plays = [play async for play in api.iter_plays(1)]
+    assert [play.event for play in plays] == ["Faceoff", "Goal"]
@@ -0,0 +1,109 @@
+import pickle
+from dataclasses import dataclass
+
+import pytest
+
+from nhl_data.models.base import FieldSource, Model, source
+from nhl_data.models.game import Play
+from nhl_data.models.schedule import ScheduleGame
+from nhl_data.models.stat import Stat
+from nhl_data.models.team import TeamRosterSpot
+from nhl_data.models.utils import convert_keys_to_snake_case
+
+
+@dataclass
+class Inner(Model):
+    value: int = None
+
+
+@dataclass
+class Outer(Model):
+    name: str = None
+    full_name: str = None
+    nested_value: int = source("outer", "innerValue")
+    nested_dict: dict = source("outer", "innerDict")
+    inner: Inner = source("outer", "inner", parser=Inner.from_response)
+    inners: list[Inner] = source("inners", parser=Inner.from_response_list)
+
+
+def test_field_map():
+    assert Outer.field_map()[:3] == (
+        FieldSource("name", ("name",), None),
+        FieldSource("full_name", ("fullName",), None),
+        FieldSource("nested_value", ("outer", "innerValue"), None),
+    )
+
+
+def test_field_map_is_cached():
+    assert Outer.field_map() is Outer.field_map()
+
+
+def test_from_response():
+    data = {
+        "name": "a",
+        "fullName": "b",
+        "outer": {
+            "innerValue": 1,
+            "innerDict": {"camelCase": {"deepKey": 1}},
+            "inner": {"value": 2},
+        },
+        "inners": [{"value": 3}, {"value": 4}],
+        "unknown": 5,
+    }
+    assert Outer.from_response(data) == Outer(
+        name="a",
+        full_name="b",
+        nested_value=1,
+        nested_dict={"camel_case": {"deep_key": 1}},
+        inner=Inner(value=2),
+        inners=[Inner(value=3), Inner(value=4)],
+    )
+
+
+def test_from_response_projection():
+    data = {
+        "name": "a",
+        "fullName": "b",
+        "outer": {"innerValue": 1, "inner": {"value": 2}},
+        "inners": [{"value": 3}],
+    }
+    assert Outer.from_response(data, fields=["name", "inner"]) == Outer(
+        name="a", inner=Inner(value=2)
+    )
+    assert Outer.projection({"inner", "name"}) is Outer.projection(["name", "inner"])
+    assert Outer.from_response(data, fields=[]) == Outer()
+
+
+def test_projection_unknown_field():
+    with pytest.raises(ValueError):
+        Outer.projection(["missing"])
+
+
+def test_from_response_snake_case_keys():
+    data = {"full_name": "b", "outer": {"inner_value": 1}}
+    assert Outer.from_response(data) == Outer(full_name="b", nested_value=1)
+    converted = convert_keys_to_snake_case({"fullName": "b"})
+    assert Outer.from_response(converted) == Outer(full_name="b")
+
+
+def test_from_response_prefers_camel_case_keys():
+    assert Outer.from_response({"full_name": "a", "fullName": "b"}) == Outer(
+        full_name="b"
+    )
+    assert Outer.from_response({"fullName": "b", "full_name": "a"}) == Outer(
+        full_name="b"
+    )
+    assert Outer.from_response({"fullName": None, "full_name": "a"}) == Outer(
+        full_name="a"
+    )
+
+
+def test_from_response_ignores_null_values():
+    assert Outer.from_response({"outer": None, "inners": None}) == Outer()
+
+
+@pytest.mark.parametrize("model", [Play, ScheduleGame, Stat, TeamRosterSpot])
+def test_high_volume_models_are_slotted(model):
+    instance = model.from_response(dict())
+    assert not hasattr(instance, "__dict__")
+    assert pickle.loads(pickle.dumps(instance)) == instance
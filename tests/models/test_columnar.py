@@ -0,0 +1,88 @@
+import pytest
+
+from nhl_data.models.game import Game
+
+np = pytest.importorskip("numpy")
+
+from nhl_data.models.columnar import PlaysFrame  # noqa: E402
+
+feed = {
+    "gameData": {"game": {"pk": 1}},
+    "liveData": {
+        "plays": {
+            "allPlays": [
+                {
+                    "result": {"eventTypeId": "FACEOFF"},
+                    "about": {"period": 1, "periodTime": "00:00"},
+                },
+                {
+                    "result": {
+                        "eventTypeId": "GOAL",
+                        "secondaryType": "Wrist Shot",
+                        "strength": {"name": "Even"},
+                    },
+                    "about": {
+                        "period": 2,
+                        "periodTime": "05:30",
+                        "goals": {"away": 0, "home": 1},
+                    },
+                    "coordinates": {"x": 80.0, "y": -5.0},
+                    "team": {"id": 10, "name": "Team"},
+                },
+            ]
+        }
+    },
+}
+
+
+def test_from_response():
+    frame = PlaysFrame.from_response(feed)
+    assert len(frame) == 2
+    assert frame["game_pk"].tolist() == [1, 1]
+    assert frame["period"].tolist() == [1, 2]
+    assert frame["period_seconds"].tolist() == [0, 330]
+    assert frame["goals_home"].tolist() == [-1, 1]
+    assert frame["team_id"].tolist() == [-1, 10]
+    assert np.isnan(frame["x"][0]) and frame["x"][1] == 80.0
+    assert frame.categories["event_type_id"] == ["FACEOFF", "GOAL"]
+    assert frame["event_type_id"].tolist() == [0, 1]
+    assert frame["secondary_type"].tolist() == [-1, 0]
+    assert frame.decode("strength_name").tolist() == [None, "Even"]
+
+
+def test_from_plays_matches_from_response():
+    expected = PlaysFrame.from_response(feed)
+    frame = Game.from_response(feed).plays_frame()
+    for column, array in expected.arrays.items():
+        np.testing.assert_array_equal(frame[column], array)
+    assert frame.categories == expected.categories
+
+
+def test_concat_remaps_categories():
+    first = PlaysFrame.from_response(feed)
+    second = first.select(np.array([1]))
+    second = PlaysFrame(
+        {**second.arrays, "game_pk": np.array([2])},
+        {**second.categories, "event_type_id": ["GOAL"]},
+    )
+    second.arrays["event_type_id"][:] = 0
+    frame = PlaysFrame.concat([second, first])
+    assert frame["game_pk"].tolist() == [2, 1, 1]
+    assert frame.categories["event_type_id"] == ["GOAL", "FACEOFF"]
+    assert frame.decode("event_type_id").tolist() == ["GOAL", "FACEOFF", "GOAL"]
+    assert frame.decode("secondary_type").tolist() == [
+        "Wrist Shot",
+        None,
+        "Wrist Shot",
+    ]
+
+
+def test_concat_empty():
+    assert len(PlaysFrame.concat([])) == 0
+
+
+def test_equals_and_select():
+    frame = PlaysFrame.from_response(feed)
+    goals = frame.select(frame.equals("event_type_id", "GOAL"))
+    assert goals["period"].tolist() == [2]
+    assert not frame.equals("event_type_id", "HIT").any()
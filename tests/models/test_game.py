@@ -1,6 +1,8 @@
+import dataclasses
+
 import pytest
 
-from nhl_data.models.game import Boxscore, Game, Play
+from nhl_data.models.game import Boxscore, Game, LazyGame, Play
 from nhl_data.models.team import Team
 
 game_test_cases = {
@@ -28,6 +30,30 @@ def test_game_from_response(test_data, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    ("test_data", "expected"), game_test_cases.values(), ids=game_test_cases.keys()
+)
+def test_lazy_game_from_response(test_data, expected):
+    result = LazyGame.from_response(test_data)
+    assert dataclasses.asdict(result) == dataclasses.asdict(expected)
+
+
+def test_lazy_game_parses_fields_on_first_access():
+    game = LazyGame.from_response(game_test_cases["play_within_game"][0])
+    assert "all_plays" not in vars(game)
+    plays = game.all_plays
+    assert plays == [Play(event="Start")]
+    assert vars(game)["all_plays"] is plays
+    assert game.all_plays is plays
+    assert "boxscore" not in vars(game)
+
+
+def test_lazy_game_init():
+    game = LazyGame(pk=1, all_plays=[])
+    assert game == LazyGame(pk=1, all_plays=[])
+    assert game.all_plays == [] and game.boxscore is None
+
+
 play_test_cases = {
     "short_play": (
         {"result": {"description": "Game"}},
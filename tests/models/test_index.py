@@ -0,0 +1,155 @@
+import dataclasses
+import datetime
+
+import pytest
+
+from nhl_data.models import Game, Play, SeasonIndex, Team
+from nhl_data.models.index import PlayRef, _play_keys
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+
+UTC = datetime.timezone.utc
+
+
+def _player(person_id, player_type):
+    return {"player": {"id": person_id}, "playerType": player_type}
+
+
+def _play(event_type_id, period, team_id, *players):
+    return Play(
+        event_type_id=event_type_id,
+        period=period,
+        team=Team(id=team_id),
+        players=list(players),
+    )
+
+
+GOAL = _play("GOAL", 3, 1, _player(10, "Scorer"), _player(11, "Assist"))
+SHOT = _play("SHOT", 1, 2, _player(20, "Shooter"), _player(11, "Goalie"))
+PENALTY = _play("PENALTY", 3, 1, _player(11, "PenaltyOn"))
+
+GAMES = [
+    Game(
+        pk=1,
+        date_time="2023-03-02T00:00:00Z",
+        away_team=Team(id=1),
+        home_team=Team(id=2),
+        all_plays=[GOAL, SHOT],
+    ),
+    Game(
+        pk=2,
+        date_time="2023-04-01T00:00:00Z",
+        away_team=Team(id=2),
+        home_team=Team(id=3),
+        all_plays=[PENALTY],
+    ),
+]
+
+
+def test_plays_by_person():
+    index = SeasonIndex(GAMES)
+    assert index.plays(person_id=11) == [
+        PlayRef(1, 0, GOAL),
+        PlayRef(1, 1, SHOT),
+        PlayRef(2, 0, PENALTY),
+    ]
+    assert index.plays(person_id=11, player_type="Assist") == [PlayRef(1, 0, GOAL)]
+    assert index.plays(person_id=99) == []
+
+
+def test_plays_combined_filters():
+    index = SeasonIndex(GAMES)
+    assert index.plays(period=3, team_id=1) == [
+        PlayRef(1, 0, GOAL),
+        PlayRef(2, 0, PENALTY),
+    ]
+    assert index.plays(event_type_id="GOAL", period=1) == []
+    assert index.plays(period=3, game_pks=[2]) == [PlayRef(2, 0, PENALTY)]
+    assert len(index.plays()) == 3
+
+
+def test_game_pks_by_team_and_date():
+    schedule = ScheduleDate(
+        games=[
+            ScheduleGame(
+                game_pk=3,
+                game_date=datetime.datetime(2023, 3, 15, tzinfo=UTC),
+                away_team=Team(id=3),
+                home_team=Team(id=1),
+            ),
+            ScheduleGame(game_pk=4, away_team=Team(id=1)),
+        ]
+    )
+    index = SeasonIndex(GAMES, schedule=[schedule])
+    march = datetime.date(2023, 3, 1), datetime.date(2023, 4, 1)
+    assert index.game_pks(start=march[0], end=march[1]) == [1, 3]
+    assert index.game_pks(team_id=3, start=march[0], end=march[1]) == [3]
+    assert index.game_pks(team_id=3) == [3, 2]
+    assert index.game_pks(team_id=1) == [1, 3, 4]
+    assert index.game_pks(start=datetime.datetime(2023, 3, 20)) == [2]
+
+
+def test_add_game_replaces_plays():
+    index = SeasonIndex(GAMES)
+    index.add_game(
+        Game(
+            pk=1,
+            date_time="2023-03-03T00:00:00Z",
+            away_team=Team(id=3),
+            all_plays=[SHOT],
+        )
+    )
+    assert index.plays(event_type_id="GOAL") == []
+    assert index.plays(person_id=11) == [PlayRef(2, 0, PENALTY), PlayRef(1, 0, SHOT)]
+    assert index.game_pks(end=datetime.date(2023, 3, 3)) == []
+    assert index.game_pks(team_id=1) == []
+    assert index.game_pks(team_id=2) == [2]
+    assert index.game_pks(team_id=3) == [1, 2]
+    index.add_game(Game(pk=1))
+    assert index.game_pks(team_id=3) == [2]
+    assert index.game_pks(start=datetime.date(2023, 1, 1)) == [2]
+    assert index.game_pks() == [2, 1]
+
+
+def test_add_game_keeps_schedule_entries():
+    schedule = ScheduleGame(
+        game_pk=1,
+        game_date=datetime.datetime(2023, 3, 2, tzinfo=UTC),
+        away_team=Team(id=1),
+    )
+    index = SeasonIndex(GAMES, schedule=[schedule])
+    index.add_game(Game(pk=1))
+    assert index.game_pks(team_id=1) == [1]
+    assert index.game_pks(team_id=2) == [2]
+    assert index.game_pks(end=datetime.date(2023, 3, 3)) == [1]
+
+
+def test_plays_player_type_requires_person_id():
+    with pytest.raises(ValueError):
+        SeasonIndex(GAMES).plays(event_type_id="GOAL", player_type="Scorer")
+
+
+class UnreadablePlays(list):
+    def __iter__(self):
+        raise AssertionError("plays should not be read")
+
+
+def test_add_game_removes_plays_by_recorded_keys():
+    game = Game(pk=1, date_time="2023-03-02T00:00:00Z", all_plays=[GOAL, SHOT])
+    index = SeasonIndex([game, GAMES[1]])
+    game.all_plays = UnreadablePlays([GOAL, SHOT])
+    index.add_game(Game(pk=1, all_plays=[SHOT]))
+    assert index.plays(person_id=11) == [PlayRef(2, 0, PENALTY), PlayRef(1, 0, SHOT)]
+    assert index.plays(event_type_id="GOAL") == []
+    assert ("person", 10) not in index._plays
+    assert sorted(key for _, key in index._game_keys[1]) == sorted(_play_keys(SHOT))
+
+
+def test_plays_by_game_pks_reads_only_those_games():
+    index = SeasonIndex([GAMES[0], dataclasses.replace(GAMES[1])])
+    index.games[2].all_plays = UnreadablePlays([PENALTY])
+    assert index.plays(game_pks=[1]) == [PlayRef(1, 0, GOAL), PlayRef(1, 1, SHOT)]
+    assert index.plays(person_id=11, game_pks=[1]) == [
+        PlayRef(1, 0, GOAL),
+        PlayRef(1, 1, SHOT),
+    ]
+    assert index.plays(game_pks=[5]) == []
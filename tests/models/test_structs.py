@@ -0,0 +1,130 @@
+import datetime
+import json
+
+import pytest
+
+from nhl_data.models.game import Boxscore, Game, Play
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+from nhl_data.models.team import Team
+
+pytest.importorskip("msgspec")
+
+from nhl_data.models.structs import (  # noqa: E402
+    LiveFeed,
+    decode_boxscore,
+    decode_game,
+    decode_schedule,
+    decode_struct,
+)
+
+feed = {
+    "gameData": {
+        "game": {"pk": 2022020001, "season": "20222023", "gameType": "R"},
+        "status": {"abstractGameState": "Final", "codedGameState": "7"},
+        "teams": {"away": {"id": 1, "name": "Away"}, "home": {"id": 2}},
+        "players": {"ID1": {"fullName": "Some Player"}},
+        "unknownKey": [1, 2, 3],
+    },
+    "liveData": {
+        "plays": {
+            "allPlays": [
+                {
+                    "result": {
+                        "eventTypeId": "GOAL",
+                        "strength": {"code": "EVEN", "name": "Even"},
+                        "penaltyMinutes": 2,
+                    },
+                    "about": {"period": 1, "goals": {"away": 0, "home": 1}},
+                    "coordinates": {"x": 80.0, "y": 2},
+                    "players": [{"player": {"id": 1}, "playerType": "Scorer"}],
+                    "team": {"id": 2},
+                }
+            ],
+            "currentPlay": {"result": {"event": "Game End"}},
+        },
+        "boxscore": {
+            "teams": {
+                "away": {
+                    "team": {"id": 1},
+                    "teamStats": {"teamSkaterStats": {"powerPlayGoals": 1}},
+                    "onIcePlus": [{"playerId": 1}],
+                }
+            },
+            "officials": [],
+        },
+        "decisions": {"firstStar": {"id": 1}},
+    },
+}
+
+schedule = {
+    "dates": [
+        {
+            "date": "2023-01-01",
+            "totalGames": 1,
+            "games": [
+                {
+                    "gamePk": 1,
+                    "gameDate": "2023-01-01T00:00:00Z",
+                    "status": {"abstractGameState": "Final"},
+                    "teams": {
+                        "away": {"score": 2, "team": {"id": 1}},
+                        "home": {"leagueRecord": {"wins": 1}, "team": {"id": 2}},
+                    },
+                }
+            ],
+        }
+    ]
+}
+
+
+@pytest.mark.parametrize(
+    "data", [feed, dict(), {"liveData": {"plays": {"allPlays": [{}]}}}]
+)
+def test_decode_game_matches_from_response(data):
+    assert decode_game(json.dumps(data).encode()) == Game.from_response(data)
+
+
+def test_decode_game():
+    game = decode_game(json.dumps(feed).encode())
+    assert game.type == "R"
+    assert game.away_team == Team(id=1, name="Away")
+    assert game.all_plays[0] == Play(
+        event_type_id="GOAL",
+        strength_name="Even",
+        penalty_minutes=2,
+        period=1,
+        goals_away=0,
+        goals_home=1,
+        coordinates={"x": 80.0, "y": 2},
+        players=[{"player": {"id": 1}, "playerType": "Scorer"}],
+        team=Team(id=2),
+    )
+    assert game.boxscore.away_team_stats == {"power_play_goals": 1}
+    assert game.decisions == {"first_star": {"id": 1}}
+
+
+def test_decode_boxscore():
+    data = feed["liveData"]["boxscore"]
+    boxscore = decode_boxscore(json.dumps(data).encode())
+    assert boxscore == Boxscore.from_response(data)
+    assert boxscore.away_on_ice == [{"playerId": 1}]
+
+
+def test_decode_schedule():
+    dates = decode_schedule(json.dumps(schedule).encode())
+    assert dates == [ScheduleDate.from_response(d) for d in schedule["dates"]]
+    assert dates[0].games[0] == ScheduleGame(
+        game_pk=1,
+        game_date=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+        status={"abstract_game_state": "Final"},
+        away_score=2,
+        away_team=Team(id=1),
+        home_league_record={"wins": 1},
+        home_team=Team(id=2),
+    )
+
+
+def test_decode_struct():
+    struct = decode_struct(json.dumps(feed).encode(), LiveFeed)
+    assert struct.game_data.status.abstract_game_state == "Final"
+    assert struct.live_data.plays.all_plays[0].result.strength.name == "Even"
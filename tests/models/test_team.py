@@ -1,6 +1,12 @@
 import pytest
 
-from nhl_data.models.team import Team, TeamLeader, TeamRecord, TeamRosterSpot
+from nhl_data.models.team import (
+    Team,
+    TeamLeader,
+    TeamRecord,
+    TeamRosterSpot,
+    clear_team_registry,
+)
 
 team_test_cases = {
     "short_team": (
@@ -27,6 +33,7 @@ record_cases = {
     ),
     "empty_data": (dict(), TeamRecord()),
     "data_from_camel_case": ({"regulationWins": 50}, TeamRecord(regulation_wins=50)),
+    "league_l10_rank": ({"leagueL10Rank": "3"}, TeamRecord(leage_l10_rank="3")),
 }
 
 
@@ -78,3 +85,32 @@ roster_spot_cases = {
 def test_team_roster_spot_from_respon_json(test_data, expected):
     result = TeamRosterSpot.from_response(test_data)
     assert result == expected
+
+
+def test_shallow_teams_are_interned():
+    data = {"id": 1, "name": "Team", "link": "/api/v1/teams/1", "triCode": "TEA"}
+    first = Team.from_response(data)
+    assert first == Team(id=1, name="Team", link="/api/v1/teams/1")
+    assert Team.from_response(dict(data)) is first
+    assert Team.from_response({"id": 2, "name": "Team"}) is not first
+
+
+def test_detailed_teams_are_not_interned():
+    data = {"id": 1, "name": "Team", "abbreviation": "TEA"}
+    assert Team.from_response(data) is not Team.from_response(data)
+    assert Team.from_response(data) == Team(id=1, name="Team", abbreviation="TEA")
+
+
+def test_clear_team_registry():
+    first = Team.from_response({"id": 1})
+    clear_team_registry()
+    assert Team.from_response({"id": 1}) is not first
+
+
+def test_team_projection_is_not_interned():
+    data = {"id": 1, "name": "Team", "roster": {"roster": [{"jerseyNumber": "9"}]}}
+    team = Team.from_response(data, fields=["id"])
+    assert team == Team(id=1)
+    assert Team.from_response({"id": 1}, fields=["id"]) is not Team.from_response(
+        {"id": 1}, fields=["id"]
+    )
@@ -1,6 +1,10 @@
 import pytest
 
-from nhl_data.models.utils import camel_to_snake_case, convert_keys_to_snake_case
+from nhl_data.models.utils import (
+    SnakeCaseDict,
+    camel_to_snake_case,
+    convert_keys_to_snake_case,
+)
 
 
 @pytest.mark.parametrize(
@@ -37,3 +41,18 @@ def test_camel_to_snake_case(test_value, expected):
 def test_convert_keys_to_snake_case(test_value, expected):
     result = convert_keys_to_snake_case(test_value)
     assert expected == result
+
+
+def test_convert_keys_to_snake_case_skips_converted_dicts():
+    converted = convert_keys_to_snake_case({"hiThere": {"nestedHiThere": None}})
+    assert isinstance(converted, SnakeCaseDict)
+    assert isinstance(converted["hi_there"], SnakeCaseDict)
+    assert convert_keys_to_snake_case(converted) is converted
+    assert convert_keys_to_snake_case(converted["hi_there"]) is converted["hi_there"]
+
+
+def test_convert_keys_to_snake_case_leaves_lists():
+    data = {"allPlays": [{"playerType": "Shooter"}]}
+    assert convert_keys_to_snake_case(data) == {
+        "all_plays": [{"playerType": "Shooter"}]
+    }
@@ -0,0 +1,130 @@
+import datetime
+
+import pytest
+
+from nhl_data.models.game import Boxscore, Game, Play
+from nhl_data.models.schedule import ScheduleGame
+from nhl_data.models.team import Team
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from nhl_data.pipeline.arrow import (  # noqa: E402
+    GAME_CONTEXT,
+    ParquetDatasetWriter,
+    arrow_schema,
+    export_games,
+    to_arrow_table,
+)
+from nhl_data.pipeline.sinks import ParquetSink  # noqa: E402
+
+
+def game(pk: int, season: str = "20222023", game_type: str = "R") -> Game:
+    return Game(
+        pk=pk,
+        season=season,
+        type=game_type,
+        home_team=Team(id=1, name="Home"),
+        all_plays=[Play(event_type_id="FACEOFF", period=1), Play(event="Goal")],
+        boxscore=Boxscore(officials=[{"official": {"fullName": "Ref"}}]),
+    )
+
+
+def test_arrow_schema():
+    schema = arrow_schema(ScheduleGame)
+    assert schema.field("game_pk").type == pa.int64()
+    assert schema.field("game_date").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("status").type == pa.string()
+    assert schema.field("home_team").type.field("id").type == pa.int64()
+    plays = arrow_schema(Game).field("all_plays").type
+    assert plays.value_type.field("period").type == pa.int64()
+
+
+def test_arrow_schema_context_and_exclude():
+    schema = arrow_schema(Play, exclude=("team",), context=GAME_CONTEXT)
+    assert schema.names[:3] == ["game_pk", "season", "game_type"]
+    assert "team" not in schema.names
+
+
+def test_to_arrow_table():
+    table = to_arrow_table(
+        [
+            ScheduleGame(
+                game_pk=1,
+                game_date=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+                status={"detailedState": "Final"},
+                home_team=Team(id=2),
+            ),
+            ScheduleGame(game_pk=2),
+        ],
+        ScheduleGame,
+    )
+    assert table.schema == arrow_schema(ScheduleGame)
+    rows = table.to_pylist()
+    assert rows[0]["status"] == '{"detailedState": "Final"}'
+    assert rows[0]["home_team"]["id"] == 2
+    assert rows[1]["game_date"] is None
+
+
+def test_to_arrow_table_coerces_values():
+    table = to_arrow_table([Play(penalty_minutes=2)], Play, context={"game_pk": 1})
+    assert table.to_pylist()[0]["penalty_minutes"] == "2"
+    assert table.column("game_pk").to_pylist() == [1]
+
+
+def test_dataset_writer_streams_row_groups(tmp_path):
+    with ParquetDatasetWriter(
+        tmp_path, ScheduleGame, ("season", "game_type"), row_group_size=2
+    ) as writer:
+        for pk in range(5):
+            writer.write(ScheduleGame(game_pk=pk, season="20222023", game_type="R"))
+        writer.write(ScheduleGame(game_pk=5, season="20222023", game_type="P"))
+    assert writer.rows_written == 6
+    regular = pq.ParquetFile(tmp_path / "season=20222023/game_type=R/part-0.parquet")
+    assert regular.num_row_groups == 3
+    assert "season" not in regular.schema_arrow.names
+    table = ds.dataset(tmp_path, partitioning="hive").to_table()
+    assert sorted(table.column("game_pk").to_pylist()) == list(range(6))
+
+
+def test_export_games(tmp_path):
+    assert export_games([game(1), game(2, game_type="P")], tmp_path) == 2
+    games = ds.dataset(tmp_path / "games", partitioning="hive").to_table()
+    assert "all_plays" not in games.schema.names
+    assert sorted(games.column("pk").to_pylist()) == [1, 2]
+    assert "type" not in games.schema.names
+    assert sorted(games.column("game_type").to_pylist()) == ["P", "R"]
+    assert (tmp_path / "games/season=20222023/game_type=R/part-0.parquet").exists()
+    plays = ds.dataset(tmp_path / "plays", partitioning="hive").to_table()
+    assert plays.num_rows == 4
+    assert sorted(set(plays.column("game_pk").to_pylist())) == [1, 2]
+    boxscores = ds.dataset(tmp_path / "boxscores", partitioning="hive").to_table()
+    assert boxscores.num_rows == 2
+
+
+def test_export_games_twice_keeps_earlier_parts(tmp_path):
+    export_games([game(1)], tmp_path)
+    export_games([game(2)], tmp_path)
+    partition = tmp_path / "games/season=20222023/game_type=R"
+    assert sorted(p.name for p in partition.iterdir()) == [
+        "part-0.parquet",
+        "part-1.parquet",
+    ]
+    games = ds.dataset(tmp_path / "games", partitioning="hive").to_table()
+    assert sorted(games.column("pk").to_pylist()) == [1, 2]
+
+
+def test_parquet_sink(tmp_path):
+    with ParquetSink(tmp_path) as sink:
+        sink.write(game(1))
+    assert (tmp_path / "plays/season=20222023/game_type=R/part-0.parquet").exists()
+    with ParquetSink(tmp_path / "schedule", ScheduleGame, ("game_type",)) as sink:
+        sink.write(ScheduleGame(game_pk=1, game_type="R"))
+    assert (tmp_path / "schedule/game_type=R/part-0.parquet").exists()
+    with ParquetSink(tmp_path / "default", ScheduleGame) as sink:
+        sink.write(ScheduleGame(game_pk=1, season="20222023", game_type="R"))
+    assert (tmp_path / "default/season=20222023/game_type=R/part-0.parquet").exists()
+    with ParquetSink(tmp_path / "flat", ScheduleGame, ()) as sink:
+        sink.write(ScheduleGame(game_pk=1, season="20222023", game_type="R"))
+    assert (tmp_path / "flat/part-0.parquet").exists()
@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+from nhl_data.api.bulk import FetchResult
+from nhl_data.models.game import Game
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+from nhl_data.pipeline.backfill import backfill_season, iter_schedule_games
+from nhl_data.pipeline.sinks import CallbackSink
+
+schedule = [
+    ScheduleDate(games=[ScheduleGame(game_pk=1, game_type="R")]),
+    ScheduleDate(games=None),
+    ScheduleDate(
+        games=[
+            ScheduleGame(game_pk=2, game_type="P"),
+            ScheduleGame(game_pk=1, game_type="R"),
+        ]
+    ),
+]
+
+
+def test_iter_schedule_games():
+    assert [g.game_pk for g in iter_schedule_games(schedule)] == [1, 2]
+
+
+def test_iter_schedule_games_filters_game_type():
+    assert [g.game_pk for g in iter_schedule_games(schedule, ["P"])] == [2]
+
+
+def test_backfill_season():
+    error = ValueError("broken feed")
+    api = Mock()
+    api.schedule.return_value = schedule
+    api.fetch_games.side_effect = lambda pks, max_workers: [
+        FetchResult(1, value=Game(pk=1)) if pk == 1 else FetchResult(pk, error=error)
+        for pk in pks
+    ]
+    received = []
+    report = backfill_season(api, 2022, CallbackSink(received.append))
+    api.schedule.assert_called_once_with(season=2022)
+    assert received == [Game(pk=1)]
+    assert report.written == 1
+    assert report.failed == {2: error}
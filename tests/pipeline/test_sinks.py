@@ -0,0 +1,27 @@
+import datetime
+import json
+
+from nhl_data.models.game import Game
+from nhl_data.models.schedule import ScheduleGame
+from nhl_data.models.team import Team
+from nhl_data.pipeline.sinks import CallbackSink, JsonlSink
+
+
+def test_callback_sink():
+    received = []
+    with CallbackSink(received.append) as sink:
+        sink.write(Game(pk=1))
+    assert received == [Game(pk=1)]
+
+
+def test_jsonl_sink(tmp_path):
+    path = tmp_path / "games.jsonl"
+    with JsonlSink(path) as sink:
+        sink.write(Game(pk=1, home_team=Team(id=2)))
+        sink.write(
+            ScheduleGame(game_pk=3, game_date=datetime.datetime(2023, 1, 1, 1, 30))
+        )
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["pk"] == 1
+    assert lines[0]["home_team"]["id"] == 2
+    assert lines[1]["game_date"] == "2023-01-01 01:30:00"
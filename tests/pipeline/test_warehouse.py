@@ -0,0 +1,149 @@
+import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from nhl_data.api.bulk import FetchResult
+from nhl_data.models.game import Game
+from nhl_data.models.schedule import ScheduleDate, ScheduleGame
+from nhl_data.models.season import Season
+from nhl_data.models.standing import Standing
+from nhl_data.models.team import Team, TeamRecord
+from nhl_data.pipeline.warehouse import Warehouse, sync_season
+
+
+def schedule_game(game_pk: int, state: str) -> ScheduleGame:
+    return ScheduleGame(
+        game_pk=game_pk,
+        game_type="R",
+        season="20222023",
+        game_date=datetime.datetime(2023, 1, game_pk, tzinfo=datetime.timezone.utc),
+        status={"abstract_game_state": state},
+        away_team=Team(id=1, name="Away"),
+        home_team=Team(id=2, name="Home"),
+    )
+
+
+def game_feed(game_pk: int, state: str) -> dict:
+    return {
+        "gameData": {
+            "game": {"pk": game_pk, "season": "20222023", "type": "R"},
+            "status": {"abstractGameState": state},
+            "teams": {"away": {"id": 1}, "home": {"id": 2}},
+            "players": {
+                "ID8470000": {
+                    "id": 8470000,
+                    "fullName": "Some Player",
+                    "birthDate": "1995-01-01",
+                    "currentTeam": {"id": 2},
+                    "primaryPosition": {"abbreviation": "C"},
+                }
+            },
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": [
+                    {"result": {"eventTypeId": "FACEOFF"}, "about": {"period": 1}},
+                    {
+                        "result": {"eventTypeId": "GOAL"},
+                        "about": {"period": 1},
+                        "coordinates": {"x": 80.0, "y": 2.0},
+                        "team": {"id": 2},
+                        "players": [
+                            {"player": {"id": 8470000}, "playerType": "Scorer"}
+                        ],
+                    },
+                ]
+            }
+        },
+    }
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    with Warehouse(tmp_path / "nhl.sqlite") as warehouse:
+        yield warehouse
+
+
+@pytest.fixture
+def api():
+    api = Mock()
+    api.seasons.return_value = [Season(season_id="20222023", number_of_games=82)]
+    api.schedule.return_value = [
+        ScheduleDate(
+            games=[
+                schedule_game(1, "Final"),
+                schedule_game(2, "Live"),
+                schedule_game(3, "Preview"),
+            ]
+        )
+    ]
+    api.standings.return_value = [
+        Standing(
+            standings_type="regularSeason",
+            division={"id": 17},
+            team_records=[Team(id=2, record=TeamRecord(points=10, games_played=6))],
+        )
+    ]
+    states = {1: "Final", 2: "Live"}
+    api.fetch_games.side_effect = lambda pks, max_workers: [
+        FetchResult(pk, value=Game.from_response(game_feed(pk, states[pk])))
+        for pk in pks
+    ]
+    return api
+
+
+def test_write_game(warehouse):
+    warehouse.write_game(Game.from_response(game_feed(1, "Final")))
+    warehouse.write_game(Game.from_response(game_feed(1, "Final")))
+    connection = warehouse.connection
+    assert connection.execute("SELECT COUNT(*) FROM plays").fetchone() == (2,)
+    assert connection.execute(
+        "SELECT event_type_id, x, team_id FROM plays WHERE play_index = 1"
+    ).fetchone() == ("GOAL", 80.0, 2)
+    assert connection.execute("SELECT * FROM play_players").fetchall() == [
+        (1, 1, 8470000, "Scorer")
+    ]
+    assert connection.execute(
+        "SELECT full_name, birth_date, position, current_team_id FROM people"
+    ).fetchall() == [("Some Player", "1995-01-01", "C", 2)]
+
+
+def test_sync_season(warehouse, api):
+    report = sync_season(api, warehouse, 2022)
+    assert report.games_synced == 2
+    api.fetch_games.assert_called_once_with([1, 2], max_workers=10)
+    api.standings.assert_called_once_with(season_start=2022)
+    connection = warehouse.connection
+    assert connection.execute("SELECT game_pk FROM games").fetchall() == [(1,), (2,)]
+    assert connection.execute("SELECT team_id, points FROM standings").fetchall() == [
+        (2, 10)
+    ]
+    assert connection.execute("SELECT * FROM teams ORDER BY id").fetchall() == [
+        (1, "Away", None),
+        (2, "Home", None),
+    ]
+
+    # Only the game which was not final yet is fetched again
+    sync_season(api, warehouse, 2022)
+    api.seasons.assert_called_once()
+    assert api.fetch_games.call_args.args[0] == [2]
+
+
+def test_sync_season_resumes(warehouse, api):
+    error = ValueError("interrupted")
+    api.fetch_games.side_effect = lambda pks, max_workers: [
+        FetchResult(pks[0], value=Game.from_response(game_feed(1, "Final"))),
+        FetchResult(pks[1], error=error),
+    ]
+    report = sync_season(api, warehouse, 2022)
+    assert report.failed == {2: error}
+    assert warehouse.pending_games("20222023") == [2]
+
+
+def test_sync_season_skips_final_standings(warehouse, api):
+    api.schedule.return_value = [ScheduleDate(games=[schedule_game(1, "Final")])]
+    sync_season(api, warehouse, 2022)
+    sync_season(api, warehouse, 2022)
+    api.standings.assert_called_once()
+    assert warehouse.is_season_final("20222023")